@@ -0,0 +1,187 @@
+import heapq
+from array import array
+from algorithms.engine import Engine, run_engine, stream_engine, schedule_dicts
+
+# Load weight per nice value -20..19 (Linux sched_prio_to_weight); nice 0 weighs 1024
+NICE_WEIGHTS = (
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15
+)
+
+# Virtual time charged per unit of CPU time, 2^32 / weight (Linux sched_prio_to_wmult)
+NICE_WMULT = (
+    48388, 59856, 76040, 92818, 118348,
+    147320, 184698, 229616, 287308, 360437,
+    449829, 563644, 704093, 875809, 1099582,
+    1376151, 1717300, 2157191, 2708050, 3363326,
+    4194304, 5237765, 6557202, 8165337, 10153587,
+    12820798, 15790321, 19976592, 24970740, 31350126,
+    39045157, 49367440, 61356676, 76695844, 95443717,
+    119304647, 148102320, 186737708, 238609294, 286331153
+)
+
+def nice_of(priority):
+    # Nice value of a priority: priority 0 (the highest) is nice 0, clamped to -20..19.
+    return min(19, max(-20, priority))
+
+class CFSEngine(Engine):
+    # Completely Fair Scheduler (CFS) - Preemptive, weighted fair sharing.
+#
+# Modelled on Linux CFS. Every process has a load weight derived from its priority
+# (used as the nice value) and a virtual runtime that grows by the CPU time it
+# receives divided by its weight. The process with the smallest vruntime runs next,
+# for a slice proportional to its share of the ready weight: target_latency split
+# by weight, stretched to nr_running * min_granularity when many processes wait,
+# and never shorter than min_granularity. A new process starts at the queue's
+# min_vruntime, and preempts the running one if it is more than
+# wakeup_granularity (in the newcomer's virtual time) behind it.
+#
+# The ready processes sit in a min-heap keyed on (vruntime, row), so each pick is
+# O(log n). A waiting process's vruntime never changes, so entries are never
+# invalidated: the running process is settled and pushed back when it stops.
+# Virtual times are exact integers (CPU time * 2^32 / weight).
+
+    preemptive = True
+    row_columns = Engine.row_columns + ('vruntime', 'accounted', 'weight', 'wmult')
+    shared_columns = row_columns
+
+    def __init__(self, table, min_granularity=2, target_latency=None, wakeup_granularity=None):
+
+        # Args:
+        #    table: ProcessTable
+        #    min_granularity: Shortest slice a process is given
+        #    target_latency: Period in which every ready process runs once (default: 8 * min_granularity)
+        #    wakeup_granularity: How far ahead of an arrival the running process may be before
+        #        the arrival preempts it (default: min_granularity)
+
+        super().__init__(table)
+        if target_latency is None:
+            target_latency = 8 * min_granularity
+        if wakeup_granularity is None:
+            wakeup_granularity = min_granularity
+        if min_granularity < 1 or target_latency < 1 or wakeup_granularity < 0:
+            raise ValueError(f"CFS needs positive granularity and latency, got min_granularity={min_granularity}, "
+                             f"target_latency={target_latency}, wakeup_granularity={wakeup_granularity}")
+        self.min_granularity = min_granularity
+        self.target_latency = target_latency
+        self.wakeup_granularity = wakeup_granularity
+        self.vruntime = [-1] * len(table)  # Virtual runtime per row (-1 = not placed yet)
+        self.accounted = array('q', table.burst)  # Remaining time up to which vruntime is charged
+        nice = [nice_of(p) + 20 for p in table.priority]
+        self.weight = array('q', [NICE_WEIGHTS[k] for k in nice])  # Load weight per row
+        self.wmult = array('q', [NICE_WMULT[k] for k in nice])  # Virtual time per CPU time unit per row
+        self.ready = []  # Min-heap of (vruntime, row)
+        self.load = 0  # Total weight of the ready processes
+        self.current = -1  # Row dispatched last and not yet pushed back
+        self.min_vruntime = 0  # Monotonic floor of the queue's vruntimes
+
+    def add_row(self, i):
+        super().add_row(i)
+        nice = nice_of(self.table.priority[i]) + 20
+        self.vruntime[i] = -1
+        self.accounted[i] = self.table.burst[i]
+        self.weight[i] = NICE_WEIGHTS[nice]
+        self.wmult[i] = NICE_WMULT[nice]
+
+    def settle(self, i):
+        # Charges row i's vruntime for the CPU time it used since the last charge.
+        used = self.accounted[i] - self.remaining[i]
+        if used:
+            self.vruntime[i] += used * self.wmult[i]
+            self.accounted[i] = self.remaining[i]
+
+    def update_min_vruntime(self):
+        # Raises min_vruntime to the smallest vruntime of the running and ready processes.
+        if self.current >= 0:
+            floor = self.vruntime[self.current]
+            if self.ready and self.ready[0][0] < floor:
+                floor = self.ready[0][0]
+        elif self.ready:
+            floor = self.ready[0][0]
+        else:
+            return
+        if floor > self.min_vruntime:
+            self.min_vruntime = floor
+
+    def push(self, i):
+        if self.vruntime[i] < 0:
+            # New arrival: start level with the queue instead of far behind it
+            self.vruntime[i] = self.min_vruntime
+        else:
+            self.settle(i)
+            if self.current == i:
+                self.current = -1
+        heapq.heappush(self.ready, (self.vruntime[i], i))
+        self.load += self.weight[i]
+        self.update_min_vruntime()
+
+    def pop(self):
+        i = heapq.heappop(self.ready)[1]
+        self.load -= self.weight[i]
+        return i
+
+    def has_ready(self):
+        return bool(self.ready)
+
+    def slice_length(self, i):
+        # Weighted share of the scheduling period, or the remaining time if shorter
+        self.current = i
+        self.update_min_vruntime()
+        weight = self.weight[i]
+        period = max(self.target_latency, (len(self.ready) + 1) * self.min_granularity)
+        length = max(self.min_granularity, period * weight // (self.load + weight))
+        return min(length, self.remaining[i])
+
+    def complete(self, i):
+        # A finished process no longer holds min_vruntime back
+        if self.current == i:
+            self.current = -1
+
+    def should_preempt(self, i):
+        # An arrival preempts when the running process is more than wakeup_granularity ahead of it
+        self.settle(i)
+        self.update_min_vruntime()
+        if not self.ready:
+            return False
+        leftmost, j = self.ready[0]
+        return self.vruntime[i] - leftmost > self.wakeup_granularity * self.wmult[j]
+
+    def preempt_rank(self, i):
+        # The process furthest ahead in virtual time is preempted first
+        self.settle(i)
+        return self.vruntime[i], i
+
+    def preempt_order(self, i):
+        # While running, vruntime grows by wmult per time unit: processes of the same weight
+        # keep their order, taken as the vruntime they would have had at time 0
+        self.settle(i)
+        return self.wmult[i], (self.vruntime[i] - self.clock * self.wmult[i], i)
+
+def simulate(table, min_granularity=2, target_latency=None, wakeup_granularity=None,
+             switch_cost=0, smp=None, checkpoint=None, incremental=None):
+    # Runs CFS over a ProcessTable (on several cores with smp) and returns a ScheduleResult.
+    return run_engine(CFSEngine, table, min_granularity, target_latency, wakeup_granularity,
+                      switch_cost=switch_cost, smp=smp, checkpoint=checkpoint,
+                      incremental=incremental)
+
+def stream(records, min_granularity=2, target_latency=None, wakeup_granularity=None, switch_cost=0):
+    # Runs CFS online over (pid, arrival, burst, priority) records in arrival order; returns a StreamSimulator.
+    return stream_engine(CFSEngine, records, min_granularity, target_latency, wakeup_granularity,
+                         switch_cost=switch_cost)
+
+def schedule(processes, min_granularity=2, target_latency=None, wakeup_granularity=None):
+    # Dictionary-based entry point.
+#
+# Args:
+#     processes: List of process dictionaries with 'arrival_time', 'burst_time', 'priority', 'pid'
+#     min_granularity, target_latency, wakeup_granularity: As for CFSEngine
+#
+# Returns:
+#     execution_log: List of tuples (start_time, end_time, pid) representing execution blocks
+    return schedule_dicts(CFSEngine, processes, min_granularity, target_latency, wakeup_granularity)
@@ -0,0 +1,408 @@
+from array import array
+from utils.process_table import ProcessTable, ScheduleResult
+from algorithms.smp import SMPSimulator
+
+# Events processed between checks whether a checkpoint is due
+CHECKPOINT_STEPS = 4096
+
+# Engine.upcoming once no process is left to arrive; compares later than any time
+NO_ARRIVAL = float('inf')
+
+class Engine:
+
+    # Event-driven simulation loop shared by all scheduling algorithms.
+
+    # The engine reads a ProcessTable (rows sorted by arrival time, then PID) and
+    # writes start/completion times into its own columns, leaving the table untouched.
+    # Time never advances one unit at a time: the clock jumps straight to the next
+    # arrival, slice expiry or completion.
+
+    # Subclasses describe their policy through a few hooks:
+    #    push(i) / pop() / has_ready(): the ready queue, holding row indices
+    #    slice_length(i): how long process i may run once dispatched (default: to completion)
+    #    should_preempt(i): whether a new arrival takes the CPU from running process i
+    #    preempt_rank(i): how little running process i deserves the CPU compared with others
+    #        running; a multi-core run with one shared queue preempts the highest rank first
+    #    preempt_order(i): preempt_rank(i) as a (group, key) pair taken when process i starts
+    #        running, which orders it within its group as preempt_rank would for as long as it runs
+    #    before_dispatch(): called right before a process is taken from the ready queue
+    #    counters(): instrumentation counters of the finished run (extend to add policy-specific ones)
+    #    complete(i): called when process i finishes
+    #    finish(result): adds policy-specific data to the finished run's ScheduleResult
+    #    add_row(i): initializes the per-row state of a row streamed in after construction
+
+    # Arrivals come from admit(), which moves the processes that have arrived by the
+    # clock into the ready queue and keeps upcoming at the arrival time of the next one.
+    # The default source is the table; the streaming simulator substitutes a record
+    # iterator (see StreamArrivals in algorithms/stream.py) and drives the same loop().
+
+    # Dispatching a different process than the one that held the CPU last is a context
+    # switch, counted by the engine. With a switch_cost the dispatcher spends that long
+    # before the process starts: the time is lost to every process. Arrivals during the
+    # switch are queued, and once it is over a preemptive policy is asked whether one of
+    # them takes the CPU from the process switched in, before that process runs at all.
+
+    # An engine pickles without its table, so a run can be checkpointed mid-way and
+    # resumed (see run() and utils/checkpoint.py); policy state must be picklable.
+    # A snapshot taken just before the last row is admitted can also be continued over
+    # a longer workload that starts with the same rows (see extend()).
+
+    preemptive = False  # Stop at every arrival while a process runs and ask should_preempt()
+    row_columns = ('remaining',)  # Per-row state columns, indexed by row
+    shared_columns = row_columns  # State shared by the policy instances of a multi-core run
+
+    def __init__(self, table):
+        n = len(table)
+        self.table = table
+        self.remaining = array('q', table.burst)  # CPU time still needed per row
+        self.start = array('q', [-1]) * n  # First CPU access per row (-1 = not started)
+        self.completion = array('q', [0]) * n  # Completion time per row
+        self.execution_log = []  # (start_time, end_time, pid) blocks
+        self.clock = 0  # Current system time
+        self.next_arrival = 0  # Row index of the next process that has not arrived yet
+        self.upcoming = table.arrival[0] if n else NO_ARRIVAL  # Arrival time of that process
+        self.completed = 0  # Number of completed processes
+        self.steps = 0  # Loop iterations, i.e. events processed
+        self.dispatches = 0  # Processes taken from the ready queue
+        self.preemptions = 0  # Blocks that ended without completing their process
+        self.idle_jumps = 0  # Jumps over idle CPU time to the next arrival
+        self.switch_cost = 0  # Dispatcher time per context switch
+        self.context_switches = 0  # Dispatches of a different process than the last one
+        self.last_row = -1  # Row that held the CPU last (-1 = none yet)
+        self.switch_log = []  # (start_time, end_time) context switch blocks, with a switch_cost
+        self.running = -1  # Row holding the CPU when checkpointed (-1 = none)
+        self.block_start = 0  # Start of the running process's block when checkpointed
+        self.slice_end = 0  # End of the running process's slice when checkpointed
+        self.resume_at = None  # Where run() picks up a snapshot taken at the last arrival (see suspend)
+
+    def __getstate__(self):
+        # The table is re-read on resume rather than stored in every snapshot
+        state = self.__dict__.copy()
+        del state['table']
+        return state
+
+    def push(self, i):
+        raise NotImplementedError
+
+    def pop(self):
+        raise NotImplementedError
+
+    def has_ready(self):
+        raise NotImplementedError
+
+    def slice_length(self, i):
+        return self.remaining[i]
+
+    def should_preempt(self, i):
+        return False
+
+    def preempt_rank(self, i):
+        return 0
+
+    def preempt_order(self, i):
+        # Ranks that do not change while a process runs are their own key
+        return 0, self.preempt_rank(i)
+
+    def before_dispatch(self):
+        pass
+
+    def complete(self, i):
+        pass
+
+    def finish(self, result):
+        pass
+
+    def add_row(self, i):
+        self.remaining[i] = self.table.burst[i]
+
+    def extend(self, table):
+        # Continues a snapshot taken at the last arrival of a shorter workload (see run())
+        # over table, whose leading rows must be exactly that workload's rows.
+        # Until the last of those rows was admitted, no decision could depend on a later
+        # row, so the new rows only need their per-row state.
+        added = len(table) - len(self.start)
+        self.table = table
+        self.upcoming = table.arrival[self.next_arrival] if self.next_arrival < len(table) else NO_ARRIVAL
+        self.start.extend(array('q', [-1]) * added)
+        self.completion.extend(array('q', [0]) * added)
+        for name in self.row_columns:
+            getattr(self, name).extend([0] * added)
+        for i in range(len(table) - added, len(table)):
+            self.add_row(i)
+
+    def counters(self):
+        # Instrumentation counters of the finished run, as a dictionary.
+        #
+        # A tick-by-tick simulator would step through every time unit up to the last
+        # completion; ticks_skipped is how many of those the event loop never visited.
+        return {
+            'steps': self.steps,
+            'dispatches': self.dispatches,
+            'preemptions': self.preemptions,
+            'idle_jumps': self.idle_jumps,
+            'queue_pushes': len(self.table) + self.preemptions,
+            'queue_pops': self.dispatches,
+            'ticks_total': self.clock,
+            'ticks_skipped': max(0, self.clock - self.steps),
+            'context_switches': self.context_switches,
+            'switch_time': self.context_switches * self.switch_cost
+        }
+
+    def spend_switch(self):
+        # Spends switch_cost on a context switch, admitting the processes that arrive meanwhile.
+        # Each is admitted at its own arrival time, since queueing may depend on the clock (MLFQ boosts).
+        # Returns whether any process arrived.
+        end = self.clock + self.switch_cost
+        self.switch_log.append((self.clock, end))
+        admitted = self.upcoming <= end
+        while self.upcoming <= end:
+            self.clock = self.upcoming
+            self.admit()
+        self.clock = end
+        return admitted
+
+    def admit(self):
+        # Moves every process that has arrived by the current clock into the ready queue.
+        if self.upcoming > self.clock:
+            return
+        arrival = self.table.arrival
+        n = len(arrival)
+        i = self.next_arrival
+        while i < n and arrival[i] <= self.clock:
+            self.push(i)
+            i += 1
+        self.next_arrival = i
+        self.upcoming = arrival[i] if i < n else NO_ARRIVAL
+
+    def suspend(self, running, block_start, slice_end, steps, dispatches, preemptions, idle_jumps, resume_at=None):
+        # Stores the run loop's locals, so the engine can be pickled mid-run and continued by run().
+        # resume_at is None at the top of the loop, or 'expired' / 'arrival' right before the
+        # admission that follows an expired slice or an arrival.
+        self.running, self.block_start, self.slice_end = running, block_start, slice_end
+        self.steps, self.dispatches, self.preemptions, self.idle_jumps = steps, dispatches, preemptions, idle_jumps
+        self.resume_at = resume_at
+
+    def run(self, checkpoint=None, on_last_arrival=None):
+
+        # Simulates the whole workload, or the rest of it for an engine restored from a snapshot.
+
+        # Args:
+        #    checkpoint: Optional Checkpoint; the engine is saved to it every
+        #        CHECKPOINT_STEPS events once its interval has passed
+        #    on_last_arrival: Optional callable receiving the engine once, suspended right
+        #        before the last row is admitted; it must copy (e.g. pickle) what it keeps
+
+        # Returns:
+        #    ScheduleResult with the execution log and per-row start/completion columns
+
+        for _ in self.loop(checkpoint, on_last_arrival):
+            pass
+        result = ScheduleResult(self.execution_log, self.start, self.completion, self.counters())
+        if self.switch_cost:
+            result.switch_logs = [self.switch_log]
+        self.finish(result)
+        return result
+
+    def loop(self, checkpoint=None, on_last_arrival=None, emit=False):
+
+        # The event loop, as a generator that runs until no process is running, ready or still to arrive.
+
+        # Args:
+        #    checkpoint, on_last_arrival: As for run() (table-based arrivals only)
+        #    emit: Yield after each block appended to execution_log: the row of the process
+        #        that just completed, or -1 for a block that ended otherwise. The consumer
+        #        may drain execution_log and switch_log meanwhile. Without emit nothing is yielded.
+
+        pids = self.table.pids
+        remaining = self.remaining
+        execution_log = self.execution_log
+        switch_cost = self.switch_cost
+        preemptive = self.preemptive
+
+        running = self.running  # Row index of the process holding the CPU (-1 = none)
+        block_start = self.block_start  # When the current execution block started
+        slice_end = self.slice_end  # When the running process must give up the CPU
+        last_row = self.last_row  # Row that held the CPU last, mirrored into self.last_row
+
+        # Counters are kept in locals so the instrumentation costs next to nothing
+        steps, dispatches, preemptions, idle_jumps = self.steps, self.dispatches, self.preemptions, self.idle_jumps
+
+        # The clock is only read every CHECKPOINT_STEPS events
+        next_check = steps + CHECKPOINT_STEPS if checkpoint is not None else -1
+        # When on_last_arrival is still to be called (None = not watched): at the last row's
+        # arrival, or switch_cost earlier since a context switch admits the arrivals during it
+        last_arrival = None
+        if on_last_arrival is not None and self.next_arrival < len(pids):
+            last_arrival = self.table.arrival[len(pids) - 1] - switch_cost
+
+        resume_at = self.resume_at
+        if resume_at is not None:
+            # Finish the iteration a snapshot at the last arrival was taken in
+            if last_arrival is not None and self.clock >= last_arrival:
+                on_last_arrival(self)
+                last_arrival = None
+            self.admit()
+            if resume_at == 'expired' or self.should_preempt(running):
+                execution_log.append((block_start, self.clock, pids[running]))
+                self.push(running)
+                running = -1
+                preemptions += 1
+
+        while running >= 0 or self.upcoming != NO_ARRIVAL or self.has_ready():
+            if steps == next_check:
+                next_check += CHECKPOINT_STEPS
+                if checkpoint.due():
+                    self.suspend(running, block_start, slice_end, steps, dispatches, preemptions, idle_jumps)
+                    checkpoint.save(self)
+            if last_arrival is not None and self.clock >= last_arrival:
+                self.suspend(running, block_start, slice_end, steps, dispatches, preemptions, idle_jumps)
+                on_last_arrival(self)
+                last_arrival = None
+
+            steps += 1
+            self.admit()
+
+            if running < 0:
+                if not self.has_ready():
+                    # CPU idle - jump to the next arrival
+                    self.clock = self.upcoming
+                    idle_jumps += 1
+                    continue
+
+                self.before_dispatch()
+                running = self.pop()
+                dispatches += 1
+                if running != last_row:
+                    arrived = False
+                    if last_row >= 0:
+                        self.context_switches += 1
+                        if switch_cost:
+                            arrived = self.spend_switch()
+                    last_row = self.last_row = running
+                    if arrived and preemptive and self.should_preempt(running):
+                        # An arrival during the switch outranks the process switched in: it
+                        # goes back before running, and the next dispatch switches again
+                        self.push(running)
+                        running = -1
+                        preemptions += 1
+                        continue
+                block_start = self.clock
+                if self.start[running] < 0:
+                    self.start[running] = self.clock
+                slice_end = self.clock + self.slice_length(running)
+
+            # Run until the slice ends, or until the next arrival for preemptive policies
+            run_until = slice_end
+            if preemptive and self.upcoming < run_until:
+                run_until = self.upcoming
+
+            remaining[running] -= run_until - self.clock
+            self.clock = run_until
+
+            if remaining[running] == 0:
+                # Process completed
+                self.completion[running] = self.clock
+                self.completed += 1
+                self.complete(running)
+                execution_log.append((block_start, self.clock, pids[running]))
+                if emit:
+                    yield running
+                running = -1
+            elif self.clock == slice_end:
+                # Slice expired - processes that arrived meanwhile queue ahead of it
+                if last_arrival is not None and self.clock >= last_arrival:
+                    self.suspend(running, block_start, slice_end, steps, dispatches, preemptions, idle_jumps,
+                                 'expired')
+                    on_last_arrival(self)
+                    last_arrival = None
+                self.admit()
+                execution_log.append((block_start, self.clock, pids[running]))
+                self.push(running)
+                running = -1
+                preemptions += 1
+                if emit:
+                    yield -1
+            else:
+                # A process arrived while this one was running
+                if last_arrival is not None and self.clock >= last_arrival:
+                    self.suspend(running, block_start, slice_end, steps, dispatches, preemptions, idle_jumps,
+                                 'arrival')
+                    on_last_arrival(self)
+                    last_arrival = None
+                self.admit()
+                if self.should_preempt(running):
+                    execution_log.append((block_start, self.clock, pids[running]))
+                    self.push(running)
+                    running = -1
+                    preemptions += 1
+                    if emit:
+                        yield -1
+
+        self.steps = steps
+        self.dispatches = dispatches
+        self.preemptions = preemptions
+        self.idle_jumps = idle_jumps
+        self.running = -1
+        self.resume_at = None
+
+def run_engine(engine_class, table, *args, switch_cost=0, smp=None, checkpoint=None, incremental=None):
+    # Runs an engine over a ProcessTable and returns its ScheduleResult.
+    #
+    # Args:
+    #    engine_class: Engine subclass implementing the policy
+    #    table: ProcessTable
+    #    args: Extra engine arguments (e.g. the RR quantum)
+    #    switch_cost: Time the dispatcher spends on each context switch
+    #    smp: Optional SMPOptions; simulates several cores with SMPSimulator instead
+    #    checkpoint: Optional Checkpoint (single core only); the run resumes from it
+    #        when it holds a snapshot of this run, and it is cleared once the run finishes
+    #    incremental: Optional IncrementalRun (single core only); the run continues the
+    #        snapshot of an earlier, shorter version of the workload when there is one,
+    #        and leaves a snapshot for later, longer versions
+    if smp is None:
+        engine = None
+        if checkpoint is not None:
+            engine = checkpoint.load(table, engine_class)
+        if engine is None and incremental is not None:
+            engine = incremental.load(table, engine_class)
+        if engine is None:
+            engine = engine_class(table, *args)
+            engine.switch_cost = switch_cost
+        result = engine.run(checkpoint, incremental.capture if incremental is not None else None)
+        if checkpoint is not None:
+            checkpoint.clear()
+        return result
+    return SMPSimulator(table, lambda rows: engine_class(rows, *args), smp, switch_cost).run()
+
+def stream_engine(engine_class, records, *args, switch_cost=0):
+    # Sets up an online simulation of an engine over an arrival stream.
+    #
+    # Args:
+    #    engine_class: Engine subclass implementing the policy
+    #    records: Iterable of (pid, arrival_time, burst_time, priority) in arrival order
+    #    args: Extra engine arguments (e.g. the RR quantum)
+    #    switch_cost: Time the dispatcher spends on each context switch
+    #
+    # Returns:
+    #    StreamSimulator; iterate its events() to run it
+    from algorithms.stream import StreamSimulator  # algorithms.stream imports this module
+    return StreamSimulator(engine_class, records, *args, switch_cost=switch_cost)
+
+def schedule_dicts(engine_class, processes, *args):
+    # Runs a table-based engine on a list of process dictionaries.
+    #
+    # Kept so dictionary-based callers continue to work: results are written back
+    # into the dictionaries ('start_time', 'completion_time', ...) as before.
+    #
+    # Returns:
+    #     execution_log: List of tuples (start_time, end_time, pid)
+    ordered = sorted(processes, key=lambda p: (p['arrival_time'], p['pid']))
+    result = engine_class(ProcessTable.from_dicts(ordered), *args).run()
+
+    for i, p in enumerate(ordered):
+        p['remaining_time'] = 0
+        p['completed'] = True
+        p['start_time'] = result.start[i]
+        p['completion_time'] = result.completion[i]
+
+    return result.execution_log
@@ -1,36 +1,43 @@
-def schedule(processes):
+from collections import deque
+from algorithms.engine import Engine, run_engine, stream_engine, schedule_dicts
+
+class FCFSEngine(Engine):
     # First-Come First-Served (FCFS) Scheduling Algorithm.
-# 
+#
 # This is a non-preemptive scheduling algorithm where processes are executed
 # in the order they arrive. Simple but can suffer from the convoy effect.
-# 
+#
+# Rows of the process table are already ordered by arrival time, then PID,
+# so the ready queue is a plain FIFO of arrived processes.
+
+    def __init__(self, table):
+        super().__init__(table)
+        self.queue = deque()  # Ready queue in arrival order
+
+    def push(self, i):
+        self.queue.append(i)
+
+    def pop(self):
+        return self.queue.popleft()
+
+    def has_ready(self):
+        return bool(self.queue)
+
+def simulate(table, switch_cost=0, smp=None, checkpoint=None, incremental=None):
+    # Runs FCFS over a ProcessTable (on several cores with smp) and returns a ScheduleResult.
+    return run_engine(FCFSEngine, table, switch_cost=switch_cost, smp=smp, checkpoint=checkpoint,
+                      incremental=incremental)
+
+def stream(records, switch_cost=0):
+    # Runs FCFS online over (pid, arrival, burst, priority) records in arrival order; returns a StreamSimulator.
+    return stream_engine(FCFSEngine, records, switch_cost=switch_cost)
+
+def schedule(processes):
+    # Dictionary-based entry point.
+#
 # Args:
 #     processes: List of process dictionaries with 'arrival_time', 'burst_time', 'pid'
-# 
+#
 # Returns:
 #     execution_log: List of tuples (start_time, end_time, pid) representing execution blocks
-    current_time = 0  # Tracks the current system time
-    execution_log = []  # Stores execution history as (start, end, pid) tuples
-    
-    # Sort processes by arrival time, then by PID for deterministic tie-breaking
-    processes.sort(key=lambda x: (x['arrival_time'], x['pid']))
-    
-    # Execute each process in order
-    for p in processes:
-        # If CPU is idle, fast-forward to process arrival time
-        if current_time < p['arrival_time']:
-            current_time = p['arrival_time']
-            
-        # Record when this process first gets CPU (for response time calculation)
-        start_time = current_time
-        p['start_time'] = start_time
-        
-        # Execute process to completion (non-preemptive)
-        current_time += p['burst_time']
-        p['completion_time'] = current_time
-        
-        # Log this execution block
-        execution_log.append((start_time, current_time, p['pid']))
-        
-    return execution_log
-
+    return schedule_dicts(FCFSEngine, processes)
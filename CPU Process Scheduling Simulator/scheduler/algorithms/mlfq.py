@@ -0,0 +1,166 @@
+from array import array
+from collections import deque
+from algorithms.engine import Engine, run_engine, stream_engine, schedule_dicts
+
+class MLFQEngine(Engine):
+    # Multilevel Feedback Queue (MLFQ) - Preemptive, adaptive scheduling.
+#
+# Processes enter the top level (0) and drop one level every time they use up a
+# whole quantum, so CPU-bound jobs sink while short, interactive ones stay near
+# the top. Each level is a FIFO deque with its own quantum; the highest non-empty
+# level runs, and an arrival preempts a process running on a lower level. Every
+# boost_period time units all processes go back to the top level, so long jobs
+# cannot starve.
+#
+# Nothing is scanned per time unit: the shared engine loop only wakes at arrivals
+# and slice ends, and a boost is applied at the first queue operation after it is
+# due. A process's level counts only within the boost epoch (clock // boost_period)
+# it was recorded in, so a boost never has to visit every process: it sets the
+# level deques aside whole, in level order, to be served ahead of the top level.
+
+    preemptive = True
+    row_columns = Engine.row_columns + ('level', 'epoch', 'dispatched', 'granted')
+    shared_columns = row_columns + ('level_time',)
+
+    def __init__(self, table, quantum=2, levels=3, quanta=None, boost_period=None):
+
+        # Args:
+        #    table: ProcessTable
+        #    quantum: Quantum of the top level; level k gets quantum * 2^k
+        #    levels: Number of levels (ignored when quanta is given)
+        #    quanta: Explicit quantum per level, top level first
+        #    boost_period: Move every process back to the top level this often (None = never)
+
+        super().__init__(table)
+        if quanta is None:
+            quanta = [quantum * 2 ** k for k in range(levels)]
+        if not quanta or min(quanta) < 1:
+            raise ValueError(f"MLFQ needs at least one level and positive quanta, got {list(quanta)}")
+        if boost_period is not None and boost_period < 1:
+            raise ValueError(f"boost period must be positive, got {boost_period}")
+        n = len(table)
+        self.quanta = list(quanta)  # Quantum per level
+        self.boost_period = boost_period
+        self.queues = [deque() for _ in self.quanta]  # Ready queue (FIFO) per level
+        self.boosted = deque()  # Non-empty level deques set aside by boosts, served before queues[0]
+        self.level = array('q', [0]) * n  # Level per row, valid within epoch[row]
+        self.epoch = array('q', [0]) * n  # Boost epoch in which level was recorded
+        self.dispatched = array('q', [0]) * n  # Remaining time when the current slice was granted
+        self.granted = array('q', [0]) * n  # Length of the current slice (0 = not running)
+        self.level_time = [0] * len(self.quanta)  # CPU time run on each level
+        self.queue_epoch = 0  # Boost epoch the queues were last arranged for
+        self.boosts = 0
+        self.demotions = 0
+
+    def add_row(self, i):
+        super().add_row(i)
+        self.level[i] = self.epoch[i] = self.dispatched[i] = self.granted[i] = 0
+
+    def current_epoch(self):
+        return self.clock // self.boost_period if self.boost_period else 0
+
+    def level_of(self, i):
+        return self.level[i] if self.epoch[i] == self.current_epoch() else 0
+
+    def boost(self):
+        # Moves every queued process to the top level if a boost came due since the last call.
+        epoch = self.current_epoch()
+        if epoch == self.queue_epoch:
+            return
+        self.queue_epoch = epoch
+        # The top level now starts with the queued processes, level by level, in O(levels)
+        self.boosted.extend(queue for queue in self.queues if queue)
+        self.queues = [deque() for _ in self.quanta]
+        self.boosts += 1
+
+    def push(self, i):
+        self.boost()
+        level = self.level_of(i)
+        granted = self.granted[i]
+        if granted:
+            # Back from the CPU: settle the slice, and demote if it used the whole quantum
+            # (unless a boost came due meanwhile)
+            used = self.dispatched[i] - self.remaining[i]
+            self.level_time[self.level[i]] -= granted - used
+            if used == granted and self.epoch[i] == self.queue_epoch and level < len(self.quanta) - 1:
+                level += 1
+                self.demotions += 1
+            self.granted[i] = 0
+        self.level[i] = level
+        self.epoch[i] = self.queue_epoch
+        self.queues[level].append(i)
+
+    def pop(self):
+        self.boost()
+        boosted = self.boosted
+        if boosted:
+            queue = boosted[0]
+            i = queue.popleft()
+            if not queue:
+                boosted.popleft()
+            return i
+        for queue in self.queues:
+            if queue:
+                return queue.popleft()
+        raise IndexError("pop from empty MLFQ")
+
+    def has_ready(self):
+        return bool(self.boosted) or any(self.queues)
+
+    def slice_length(self, i):
+        # Quantum of the process's level, or its remaining time if shorter.
+        # The full slice is credited to the level now and corrected in push() if cut short.
+        level = self.level_of(i)
+        granted = min(self.quanta[level], self.remaining[i])
+        self.level[i] = level
+        self.epoch[i] = self.current_epoch()
+        self.dispatched[i] = self.remaining[i]
+        self.granted[i] = granted
+        self.level_time[level] += granted
+        return granted
+
+    def should_preempt(self, i):
+        # An arrival preempts only a process running on a lower level
+        self.boost()
+        level = self.level_of(i)
+        return level > 0 and (bool(self.boosted) or any(self.queues[k] for k in range(level)))
+
+    def preempt_rank(self, i):
+        # Lower levels are preempted first
+        return self.level_of(i)
+
+    def preempt_order(self, i):
+        # A level lapses to 0 with its epoch, so the latest epoch orders first: whenever any
+        # running process's rank is above 0, the highest one is also the highest key
+        return 0, (self.epoch[i], self.level[i])
+
+    def counters(self):
+        counters = super().counters()
+        counters['boosts'] = self.boosts
+        counters['demotions'] = self.demotions
+        return counters
+
+    def finish(self, result):
+        result.level_time = list(self.level_time)
+
+def simulate(table, quantum=2, levels=3, quanta=None, boost_period=None,
+             switch_cost=0, smp=None, checkpoint=None, incremental=None):
+    # Runs MLFQ over a ProcessTable (on several cores with smp) and returns a ScheduleResult.
+    return run_engine(MLFQEngine, table, quantum, levels, quanta, boost_period,
+                      switch_cost=switch_cost, smp=smp, checkpoint=checkpoint,
+                      incremental=incremental)
+
+def stream(records, quantum=2, levels=3, quanta=None, boost_period=None, switch_cost=0):
+    # Runs MLFQ online over (pid, arrival, burst, priority) records in arrival order; returns a StreamSimulator.
+    return stream_engine(MLFQEngine, records, quantum, levels, quanta, boost_period, switch_cost=switch_cost)
+
+def schedule(processes, quantum=2, levels=3, quanta=None, boost_period=None):
+    # Dictionary-based entry point.
+#
+# Args:
+#     processes: List of process dictionaries with 'arrival_time', 'burst_time', 'pid'
+#     quantum, levels, quanta, boost_period: As for MLFQEngine
+#
+# Returns:
+#     execution_log: List of tuples (start_time, end_time, pid) representing execution blocks
+    return schedule_dicts(MLFQEngine, processes, quantum, levels, quanta, boost_period)
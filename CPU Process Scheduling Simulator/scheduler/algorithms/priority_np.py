@@ -1,52 +1,45 @@
-def schedule(processes):
+import heapq
+from algorithms.engine import Engine, run_engine, stream_engine, schedule_dicts
+
+class PriorityNPEngine(Engine):
     # Priority Scheduling (Non-preemptive) Algorithm.
-# 
+#
 # Selects the process with highest priority (lowest numeric value).
 # Important processes run first, but low priority processes may starve.
-# 
+#
 # Priority Convention: Lower integer value = Higher priority
-# 
+#
+# Arrived processes sit in a min-heap keyed on (priority, row). Rows are ordered
+# by arrival time, then PID, so the row index breaks ties the same way.
+
+    def __init__(self, table):
+        super().__init__(table)
+        self.ready = []  # Min-heap of (priority, row)
+
+    def push(self, i):
+        heapq.heappush(self.ready, (self.table.priority[i], i))
+
+    def pop(self):
+        return heapq.heappop(self.ready)[1]
+
+    def has_ready(self):
+        return bool(self.ready)
+
+def simulate(table, switch_cost=0, smp=None, checkpoint=None, incremental=None):
+    # Runs non-preemptive priority scheduling over a ProcessTable (on several cores with smp) and returns a ScheduleResult.
+    return run_engine(PriorityNPEngine, table, switch_cost=switch_cost, smp=smp, checkpoint=checkpoint,
+                      incremental=incremental)
+
+def stream(records, switch_cost=0):
+    # Runs non-preemptive priority scheduling online over (pid, arrival, burst, priority) records in arrival order; returns a StreamSimulator.
+    return stream_engine(PriorityNPEngine, records, switch_cost=switch_cost)
+
+def schedule(processes):
+    # Dictionary-based entry point.
+#
 # Args:
 #     processes: List of process dictionaries with 'arrival_time', 'burst_time', 'priority', 'pid'
-# 
+#
 # Returns:
 #     execution_log: List of tuples (start_time, end_time, pid) representing execution blocks
-    current_time = 0  # Tracks current system time
-    completed = 0  # Number of completed processes
-    n = len(processes)  # Total number of processes
-    execution_log = []  # Stores execution history
-    
-    # Initialize completion status
-    for p in processes:
-        p['completed'] = False
-        
-    # Continue until all processes are completed
-    while completed < n:
-        # Find all available processes (arrived and not completed)
-        available = [p for p in processes if p['arrival_time'] <= current_time and not p.get('completed', False)]
-        
-        if not available:
-            # No process available - CPU idle, fast-forward to next arrival
-            next_arrival = min(p['arrival_time'] for p in processes if not p.get('completed', False))
-            current_time = next_arrival
-            continue
-            
-        # Select process with highest priority (lowest numeric value)
-        # Tie-breaker: arrival time first, then process ID
-        highest_prio = min(available, key=lambda x: (x['priority'], x['arrival_time'], x['pid']))
-        
-        # Record start time (for response time calculation)
-        start_time = current_time
-        highest_prio['start_time'] = start_time
-        
-        # Execute process to completion (non-preemptive)
-        current_time += highest_prio['burst_time']
-        highest_prio['completion_time'] = current_time
-        highest_prio['completed'] = True
-        completed += 1
-        
-        # Log this execution block
-        execution_log.append((start_time, current_time, highest_prio['pid']))
-        
-    return execution_log
-
+    return schedule_dicts(PriorityNPEngine, processes)
@@ -1,87 +1,117 @@
 from collections import deque
+from algorithms.engine import NO_ARRIVAL, Engine, run_engine, stream_engine, schedule_dicts
 
-def schedule(processes, quantum):
+class RREngine(Engine):
    # Round Robin (RR) - Preemptive Scheduling Algorithm.
-# 
+#
 # Each process gets a fixed time slice (quantum). If not completed, it goes
 # to the back of the ready queue. Provides good response time and fairness.
-# 
+#
+# Processes that arrive during a slice are queued BEFORE the preempted process
+# is re-added (fairness); the shared engine loop admits arrivals before pushing
+# an expired slice back.
+
+    def __init__(self, table, quantum):
+        super().__init__(table)
+        self.quantum = quantum  # Time slice allocated to each process
+        self.queue = deque()  # Ready queue (FIFO for RR)
+        self.until_round_check = 0  # Dispatches left before the next fast-forward check
+        self.rounds_skipped = 0  # Whole rounds run by fast_forward_rounds
+        self.slices_skipped = 0  # Slices logged by fast_forward_rounds instead of being dispatched
+
+    def push(self, i):
+        self.queue.append(i)
+
+    def pop(self):
+        return self.queue.popleft()
+
+    def has_ready(self):
+        return bool(self.queue)
+
+    def slice_length(self, i):
+        # Execute for quantum or remaining time, whichever is smaller
+        return min(self.quantum, self.remaining[i])
+
+    def counters(self):
+        counters = super().counters()
+        counters['rounds_skipped'] = self.rounds_skipped
+        counters['slices_skipped'] = self.slices_skipped
+        return counters
+
+    def before_dispatch(self):
+        # Checking once per round keeps the fast-forward check amortized O(1) per slice
+        if self.until_round_check == 0:
+            self.fast_forward_rounds()
+            self.until_round_check = len(self.queue)
+        self.until_round_check -= 1
+
+    def fast_forward_rounds(self):
+        # Runs whole rounds of the ready queue in one step.
+        #
+        # If every queued process still needs more than k quanta and nothing arrives
+        # before k full rounds are over, those rounds just rotate the queue back to
+        # its current order. The slices are logged arithmetically instead of being
+        # dispatched one by one, which keeps small quanta over long bursts tractable.
+        #
+        # With several processes queued every slice of the rounds is a context switch
+        # and with one none is, so the rounds are only skipped when the first slice
+        # agrees (it does except at the very first dispatch, or when a lone process
+        # follows another one).
+        quantum = self.quantum
+        queue = self.queue
+        remaining = self.remaining
+        pids = self.table.pids
+        switching = len(queue) > 1
+        if switching != (self.last_row >= 0 and queue[0] != self.last_row):
+            return
+        switch_cost = self.switch_cost if switching else 0
+        slot = quantum + switch_cost  # Each slice, after the switch to it
+        round_length = len(queue) * slot
+
+        rounds = (min(remaining[i] for i in queue) - 1) // quantum
+        if self.upcoming != NO_ARRIVAL:
+            # Arrivals at the very end of a round would be queued ahead of its last process,
+            # and the switch after the rounds must not admit the watched last arrival (see Engine.run)
+            rounds = min(rounds, (self.upcoming - self.switch_cost - self.clock - 1) // round_length)
+        if rounds <= 0:
+            return
+
+        for j, i in enumerate(queue):
+            # Record first start time (for response time calculation)
+            if self.start[i] < 0:
+                self.start[i] = self.clock + j * slot + switch_cost
+            remaining[i] -= rounds * quantum
+
+        for r in range(rounds):
+            round_start = self.clock + r * round_length
+            if switch_cost:
+                self.switch_log.extend((round_start + j * slot, round_start + j * slot + switch_cost)
+                                       for j in range(len(queue)))
+            self.execution_log.extend((round_start + j * slot + switch_cost, round_start + (j + 1) * slot, pids[i])
+                                      for j, i in enumerate(queue))
+        self.clock += rounds * round_length
+        if switching:
+            # The next dispatch switches away from last_row (checked above) as from queue[-1], so it can stay
+            self.context_switches += rounds * len(queue)
+        self.rounds_skipped += rounds
+        self.slices_skipped += rounds * len(queue)
+
+def simulate(table, quantum, switch_cost=0, smp=None, checkpoint=None, incremental=None):
+    # Runs Round Robin over a ProcessTable (on several cores with smp) and returns a ScheduleResult.
+    return run_engine(RREngine, table, quantum, switch_cost=switch_cost, smp=smp, checkpoint=checkpoint,
+                      incremental=incremental)
+
+def stream(records, quantum, switch_cost=0):
+    # Runs Round Robin online over (pid, arrival, burst, priority) records in arrival order; returns a StreamSimulator.
+    return stream_engine(RREngine, records, quantum, switch_cost=switch_cost)
+
+def schedule(processes, quantum):
+    # Dictionary-based entry point.
+#
 # Args:
 #     processes: List of process dictionaries with 'arrival_time', 'burst_time', 'pid'
 #     quantum: Time slice allocated to each process
-# 
+#
 # Returns:
 #     execution_log: List of tuples (start_time, end_time, pid) representing execution blocks
-    current_time = 0  # Tracks current system time
-    completed = 0  # Number of completed processes
-    n = len(processes)  # Total number of processes
-    execution_log = []  # Stores execution history
-    
-    # Initialize remaining time for each process
-    for p in processes:
-        p['remaining_time'] = p['burst_time']  # Track how much time is left
-        p['completed'] = False
-        p['start_time'] = None  # Will be set on first CPU access
-        
-    # Sort by arrival time for initial processing
-    processes.sort(key=lambda x: (x['arrival_time'], x['pid']))
-    
-    queue = deque()  # Ready queue (FIFO for RR)
-    added_to_queue = set()  # Track which processes are already queued
-    
-    def add_new_arrivals(time):
-        # Helper function: Add all processes that have arrived by given time to the queue.
-        for p in processes:
-            if p['arrival_time'] <= time and p['pid'] not in added_to_queue:
-                queue.append(p)
-                added_to_queue.add(p['pid'])
-                
-    # Add processes that arrive at time 0
-    add_new_arrivals(current_time)
-    
-    # Continue until all processes are completed
-    while completed < n:
-        if not queue:
-            # Queue is empty but processes remain - CPU is idle
-            # Fast-forward to next process arrival
-            remaining = [p for p in processes if not p['completed']]
-            if remaining:
-                next_arrival = min(p['arrival_time'] for p in remaining)
-                current_time = next_arrival
-                add_new_arrivals(current_time)
-            else:
-                break
-                
-        # Get next process from front of queue
-        current_process = queue.popleft()
-        
-        # Record first start time (for response time calculation)
-        if current_process['start_time'] is None:
-            current_process['start_time'] = current_time
-            
-        # Execute for quantum or remaining time, whichever is smaller
-        exec_time = min(quantum, current_process['remaining_time'])
-        
-        start_block = current_time
-        current_time += exec_time
-        current_process['remaining_time'] -= exec_time
-        
-        # Log this execution block
-        execution_log.append((start_block, current_time, current_process['pid']))
-        
-        # Add any processes that arrived while this process was executing
-        # Important: New arrivals are added BEFORE re-adding current process (fairness)
-        add_new_arrivals(current_time)
-        
-        # Check if process is complete or needs more time
-        if current_process['remaining_time'] > 0:
-            # Not finished - send to back of queue for next turn
-            queue.append(current_process)
-        else:
-            # Process completed
-            current_process['completed'] = True
-            current_process['completion_time'] = current_time
-            completed += 1
-            
-    return execution_log
-
+    return schedule_dicts(RREngine, processes, quantum)
@@ -1,51 +1,43 @@
-def schedule(processes):
+import heapq
+from algorithms.engine import Engine, run_engine, stream_engine, schedule_dicts
+
+class SJFEngine(Engine):
     # Shortest Job First (SJF) - Non-preemptive Scheduling Algorithm.
-# 
+#
 # Selects the process with the shortest burst time among available processes.
 # Minimizes average waiting time but can cause starvation for long processes.
-# 
+#
+# Arrived processes sit in a min-heap keyed on (burst_time, row). Rows are ordered
+# by arrival time, then PID, so the row index breaks ties the same way.
+
+    def __init__(self, table):
+        super().__init__(table)
+        self.ready = []  # Min-heap of (burst_time, row)
+
+    def push(self, i):
+        heapq.heappush(self.ready, (self.table.burst[i], i))
+
+    def pop(self):
+        return heapq.heappop(self.ready)[1]
+
+    def has_ready(self):
+        return bool(self.ready)
+
+def simulate(table, switch_cost=0, smp=None, checkpoint=None, incremental=None):
+    # Runs SJF over a ProcessTable (on several cores with smp) and returns a ScheduleResult.
+    return run_engine(SJFEngine, table, switch_cost=switch_cost, smp=smp, checkpoint=checkpoint,
+                      incremental=incremental)
+
+def stream(records, switch_cost=0):
+    # Runs SJF online over (pid, arrival, burst, priority) records in arrival order; returns a StreamSimulator.
+    return stream_engine(SJFEngine, records, switch_cost=switch_cost)
+
+def schedule(processes):
+    # Dictionary-based entry point.
+#
 # Args:
 #     processes: List of process dictionaries with 'arrival_time', 'burst_time', 'pid'
-# 
+#
 # Returns:
 #     execution_log: List of tuples (start_time, end_time, pid) representing execution blocks
-    current_time = 0  # Tracks the current system time
-    completed = 0  # Number of processes completed
-    n = len(processes)  # Total number of processes
-    execution_log = []  # Stores execution history
-    
-    # Initialize completion status for all processes
-    for p in processes:
-        p['completed'] = False
-        
-    # Continue until all processes are completed
-    while completed < n:
-        # Find all processes that have arrived and are not yet completed
-        available = [p for p in processes if p['arrival_time'] <= current_time and not p.get('completed', False)]
-        
-        if not available:
-            # No process available right now - CPU is idle
-            # Fast-forward to the next process arrival time
-            next_arrival = min(p['arrival_time'] for p in processes if not p.get('completed', False))
-            current_time = next_arrival
-            continue
-            
-        # Select the process with shortest burst time (SJF policy)
-        # Tie-breaker: arrival time first, then process ID
-        shortest = min(available, key=lambda x: (x['burst_time'], x['arrival_time'], x['pid']))
-        
-        # Record start time (for response time calculation)
-        start_time = current_time
-        shortest['start_time'] = start_time
-        
-        # Execute process to completion (non-preemptive)
-        current_time += shortest['burst_time']
-        shortest['completion_time'] = current_time
-        shortest['completed'] = True
-        completed += 1
-        
-        # Log this execution block
-        execution_log.append((start_time, current_time, shortest['pid']))
-        
-    return execution_log
-
+    return schedule_dicts(SJFEngine, processes)
@@ -0,0 +1,462 @@
+import heapq
+from array import array
+from utils.process_table import ProcessTable, ScheduleResult
+
+# Ready queue placements
+PLACEMENTS = ('global', 'per-core')
+
+class SMPOptions:
+
+    # Multi-core settings of a run (see SMPSimulator).
+
+    __slots__ = ('cores', 'placement', 'migration_cost', 'steal')
+
+    def __init__(self, cores, placement='global', migration_cost=0, steal=True):
+        if cores < 1:
+            raise ValueError(f"need at least one core, got {cores}")
+        if placement not in PLACEMENTS:
+            raise ValueError(f"unknown placement '{placement}', expected one of {', '.join(PLACEMENTS)}")
+        if migration_cost < 0:
+            raise ValueError(f"migration cost must not be negative, got {migration_cost}")
+        self.cores = cores  # Number of CPU cores
+        self.placement = placement  # 'global': one shared ready queue, 'per-core': one queue per core
+        self.migration_cost = migration_cost  # Time lost when a process resumes on another core
+        self.steal = steal  # Idle per-core cores take work from the longest queue
+
+class LoadIndex:
+
+    # Cores keyed on a load, answering which core has the least load in O(log cores).
+
+    # Every change pushes a new heap entry and outdated ones are dropped when they
+    # reach the top; the heap is rebuilt once it grows past a few entries per core.
+    # Ties go to the lowest core index. A sign of -1 answers the most loaded core instead.
+
+    def __init__(self, cores, sign=1):
+        self.load = [0] * cores
+        self.sign = sign
+        self.heap = [(0, k) for k in range(cores)]
+
+    def add(self, k, delta):
+        self.load[k] += delta
+        if len(self.heap) > 4 * len(self.load):
+            self.heap = [(self.sign * load, j) for j, load in enumerate(self.load)]
+            heapq.heapify(self.heap)
+        else:
+            heapq.heappush(self.heap, (self.sign * self.load[k], k))
+
+    def top(self):
+        heap = self.heap
+        while heap[0][0] != self.sign * self.load[heap[0][1]]:
+            heapq.heappop(heap)
+        return heap[0][1]
+
+class Descending:
+
+    # Heap key wrapper ordering keys largest first, for max-heaps on heapq.
+
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __eq__(self, other):
+        # Tuples holding a key compare it with == before <, so equal keys fall through to ties
+        return self.key == other.key
+
+class SMPSimulator:
+
+    # Event-driven simulation of a scheduling policy on several cores.
+
+    # The policy is any Engine subclass: its ready-queue hooks (push, pop, has_ready,
+    # slice_length, should_preempt, complete, finish) are reused unchanged, with the policy's
+    # clock kept at the simulation time and its shared_columns (per-row state such as
+    # the remaining times) shared by all instances. With the global placement
+    # one policy instance holds the single shared ready queue; with the per-core
+    # placement every core gets its own instance, arrivals go to the least loaded core
+    # and, with stealing on, an idle core pulls a process from the longest queue; both
+    # are looked up in LoadIndex heaps rather than by visiting every core.
+
+    # A process that runs on a different core than last time pays migration_cost
+    # before its block starts; that time is spent on the core but not on the process.
+    # Context switches are counted per core, and each one spends switch_cost on the
+    # core the same way, ahead of any migration. As in Engine.spend_switch, processes
+    # arriving during a switch or migration are queued, and once it is over a preemptive
+    # policy is asked whether one of them takes the core before the process switched in
+    # runs; otherwise its slice is sized then, with those arrivals in the queue.
+
+    # As in the single-core engine the clock only visits events: arrivals and the
+    # end of running slices, kept in a heap keyed on time. An event only touches the
+    # cores it affects (plus the idle ones), so adding cores does not multiply the
+    # simulation cost. Preemption checks against a global queue look for the running
+    # process with the highest preempt_rank in max-heaps of the running blocks, one per
+    # preempt_order group; a block is keyed at the first check it is running for, and
+    # stale entries are dropped when they reach the top. That process is preempted
+    # first, and only while the queue's best process still outranks it, so an arrival
+    # never preempts more than one core.
+    # RR's whole-round fast-forwarding assumes a single core and is not used here.
+
+    def __init__(self, table, make_policy, options, switch_cost=0):
+
+        # Args:
+        #    table: ProcessTable (read-only)
+        #    make_policy: Callable returning a fresh Engine instance for the ProcessTable it is given
+        #    options: SMPOptions
+        #    switch_cost: Time a core's dispatcher spends on each context switch
+
+        self.table = table
+        self.options = options
+        cores = options.cores
+        queues = cores if options.placement == 'per-core' else 1
+        # Only the first instance builds the per-row state; the others start over an empty
+        # table and take over the shared columns, so each extra core costs O(1) to set up
+        self.policies = [make_policy(table)]
+        for _ in range(queues - 1):
+            policy = make_policy(ProcessTable())
+            policy.table = table
+            for name in policy.shared_columns:
+                setattr(policy, name, getattr(self.policies[0], name))
+            self.policies.append(policy)
+        self.remaining = self.policies[0].remaining  # Shared by every policy instance
+        self.clock = 0  # Current system time, mirrored into the policies before each hook
+        self.queued = [0] * queues  # Processes waiting in each queue
+        self.waiting = 0  # Processes waiting in all queues together
+        self.least_loaded = None  # Per-core: LoadIndex of waiting plus running processes per core
+        self.most_queued = None  # Per-core: LoadIndex of waiting processes per core, most first
+        if queues > 1:
+            self.least_loaded = LoadIndex(cores)
+            self.most_queued = LoadIndex(cores, -1)
+        self.arrivals = [0] * queues  # Arrivals pushed to each queue so far
+        self.core_logs = [[] for _ in range(cores)]  # Per-core (start, end, pid) blocks
+        self.start = array('q', [-1]) * len(table)
+        self.completion = array('q', [0]) * len(table)
+        self.migrations = 0
+        self.steals = 0
+        self.migration_time = 0  # Core time spent on migrations
+        self.switch_cost = switch_cost
+        self.context_switches = 0
+        self.switch_logs = [[] for _ in range(cores)]  # Per-core (start, end) context switch blocks
+
+    def queue_of(self, core):
+        # Index of the ready queue a core dispatches from.
+        return core if len(self.policies) > 1 else 0
+
+    def policy(self, q):
+        # The policy instance of queue q, with its clock set to the current time.
+        policy = self.policies[q]
+        policy.clock = self.clock
+        return policy
+
+    def push(self, q, i):
+        self.policy(q).push(i)
+        self.queued[q] += 1
+        self.waiting += 1
+        if self.least_loaded is not None:
+            self.least_loaded.add(q, 1)
+            self.most_queued.add(q, 1)
+
+    def pop(self, q):
+        self.queued[q] -= 1
+        self.waiting -= 1
+        if self.least_loaded is not None:
+            self.least_loaded.add(q, -1)
+            self.most_queued.add(q, -1)
+        return self.policy(q).pop()
+
+    def run(self):
+
+        # Simulates the whole workload.
+
+        # Returns:
+        #    ScheduleResult whose execution_log merges the per-core logs by start time,
+        #    with the per-core logs in core_logs
+
+        table = self.table
+        arrival = table.arrival
+        pids = table.pids
+        remaining = self.remaining
+        policies = self.policies
+        cores = self.options.cores
+        migration_cost = self.options.migration_cost
+        per_core = len(policies) > 1
+        steal = per_core and self.options.steal
+        preemptive = policies[0].preemptive
+        n = len(pids)
+
+        running = [-1] * cores  # Row running on each core (-1 = idle)
+        idle = set(range(cores))  # Cores with nothing running
+        idle_order = list(range(cores))  # Min-heap of idle cores, with entries of cores busy again left in
+        freed = []  # Cores that stopped in the current step
+        sized_by = {}  # Per-core: queues whose policy sized a slice of each unfinished row
+        block_start = [0] * cores  # When each core's current block started (after any migration)
+        synced = [0] * cores  # Up to when the running process's remaining time is accounted for
+        generation = [0] * cores  # Invalidates slice-end events of preempted blocks
+        starting = [-1] * cores  # Queue of a core still switching or migrating, whose slice is not sized yet
+        arrivals_seen = [0] * cores  # Arrivals to the core's own queue when its switch or migration began
+        last_core = array('q', [-1]) * n  # Core each row last ran on
+        last_row = [-1] * cores  # Row each core ran last
+        events = []  # Min-heap of (slice_end, core, generation), or switch end while starting
+        # Global preemptive queue: per preempt_order group, max-heap of (key, core, generation)
+        ranked = {} if preemptive and not per_core else None
+        unranked = []  # (core, generation) of blocks started since the last check, keyed when it comes
+        switched_in = []  # Cores whose block started at their switch end in the current step
+
+        clock = 0
+        next_arrival = 0
+        completed = 0
+        steps = dispatches = preemptions = idle_jumps = 0
+
+        def sync(c):
+            # Charges the running process of core c for the time run so far.
+            if clock > synced[c]:
+                remaining[running[c]] -= clock - synced[c]
+                synced[c] = clock
+
+        def stop(c):
+            # Ends the block on core c and returns its row.
+            i = running[c]
+            sync(c)
+            if clock > block_start[c]:
+                self.core_logs[c].append((block_start[c], clock, pids[i]))
+            running[c] = -1
+            idle.add(c)
+            freed.append(c)
+            generation[c] += 1
+            if per_core:
+                self.least_loaded.add(c, -1)
+            return i
+
+        def size(q, i):
+            # Sizes row i's slice with queue q's policy, which complete() must reach later.
+            if per_core:
+                sized_by.setdefault(i, set()).add(q)
+            return self.policy(q).slice_length(i)
+
+        def started(c):
+            # Notes core c's block, if one started running now, for preemption checks.
+            if ranked is None or running[c] < 0 or starting[c] >= 0:
+                return
+            unranked.append((c, generation[c]))
+            if len(unranked) > 4 * cores:
+                unranked[:] = [(k, gen) for k, gen in unranked if gen == generation[k]]
+
+        def least_deserving():
+            # Running core whose process has the highest preempt_rank (lowest core on ties), or -1.
+            # Blocks are keyed here, at their first check, rather than each time one starts:
+            # most end before an arrival finds the shared queue non-empty
+            policy = self.policies[0]
+            for c, gen in unranked:
+                if gen == generation[c]:
+                    # Keyed as of the time the process's remaining time was last charged
+                    policy.clock = synced[c]
+                    group, key = policy.preempt_order(running[c])
+                    heap = ranked.setdefault(group, [])
+                    if len(heap) > 4 * cores:
+                        heap[:] = [entry for entry in heap if entry[2] == generation[entry[1]]]
+                        heapq.heapify(heap)
+                    heapq.heappush(heap, (Descending(key), c, gen))
+            unranked.clear()
+            policy.clock = self.clock
+            tops = []
+            for group in list(ranked):
+                heap = ranked[group]
+                while heap and heap[0][2] != generation[heap[0][1]]:
+                    heapq.heappop(heap)
+                if heap:
+                    tops.append(heap[0][1])
+                else:
+                    del ranked[group]
+            if len(tops) < 2:
+                return tops[0] if tops else -1
+            # Groups order differently over time: compare their tops' ranks now
+            policy = self.policy(0)
+            for c in tops:
+                sync(c)
+            return max(tops, key=lambda c: (policy.preempt_rank(running[c]), -c))
+
+        def take_work(c):
+            # Dispatches the next process of core c's queue (or a stolen one) onto idle core c.
+            q = self.queue_of(c)
+            if not self.queued[q]:
+                if not steal:
+                    return False
+                q = self.most_queued.top()
+                if not self.queued[q]:
+                    return False
+                self.steals += 1
+            i = self.pop(q)
+            cost = 0
+            if i != last_row[c]:
+                if last_row[c] >= 0:
+                    cost = self.switch_cost
+                    self.context_switches += 1
+                    if cost:
+                        self.switch_logs[c].append((clock, clock + cost))
+                last_row[c] = i
+            if last_core[i] >= 0 and last_core[i] != c:
+                cost += migration_cost
+                self.migrations += 1
+                self.migration_time += migration_cost
+            last_core[i] = c
+            running[c] = i
+            idle.discard(c)
+            if per_core:
+                self.least_loaded.add(c, 1)
+            block_start[c] = synced[c] = clock + cost
+            if cost:
+                # The slice is sized when the switch and migration are over
+                starting[c] = q
+                arrivals_seen[c] = self.arrivals[self.queue_of(c)]
+                heapq.heappush(events, (clock + cost, c, generation[c]))
+            else:
+                if self.start[i] < 0:
+                    self.start[i] = clock
+                heapq.heappush(events, (clock + size(q, i), c, generation[c]))
+            return True
+
+        while completed < n:
+            steps += 1
+            self.clock = clock
+
+            # 1. Cores whose slice ends now: completions and expired slices
+            expired = []
+            freed.clear()
+            switched = []  # Cores whose switch or migration ends now
+            while events and events[0][0] <= clock:
+                _, c, gen = heapq.heappop(events)
+                if gen != generation[c]:
+                    continue  # Block was preempted earlier
+                if starting[c] >= 0:
+                    switched.append(c)
+                    continue
+                i = stop(c)
+                if remaining[i] == 0:
+                    self.completion[i] = clock
+                    completed += 1
+                    for q in (sized_by.pop(i, ()) if per_core else (0,)):
+                        policies[q].complete(i)
+                else:
+                    expired.append((c, i))
+                    preemptions += 1
+            if completed == n:
+                break
+
+            # 2. Arrivals, queued ahead of expired slices as on a single core
+            arrived = set()  # Queues that received arrivals
+            while next_arrival < n and arrival[next_arrival] <= clock:
+                q = 0
+                if per_core:
+                    # Least loaded core: waiting processes plus the running one
+                    q = self.least_loaded.top()
+                self.push(q, next_arrival)
+                self.arrivals[q] += 1
+                arrived.add(q)
+                next_arrival += 1
+
+            for c, i in expired:
+                self.push(self.queue_of(c), i)
+
+            # Slices starting now: arrivals during the switch may preempt the process switched
+            # in before it runs, otherwise its slice is sized with them queued
+            if len(switched) > 1 and not per_core:
+                # Least deserving first, so one arrival does not preempt several of them
+                rank = policies[0].preempt_rank
+                switched.sort(key=lambda c: rank(running[c]), reverse=True)
+            for c in switched:
+                q, starting[c] = starting[c], -1
+                own = self.queue_of(c)
+                i = running[c]
+                if (preemptive and self.arrivals[own] != arrivals_seen[c] and self.queued[own]
+                        and self.policy(own).should_preempt(i)):
+                    self.push(own, stop(c))
+                    preemptions += 1
+                    dispatches += take_work(c)
+                    switched_in.append(c)
+                    continue
+                if self.start[i] < 0:
+                    self.start[i] = clock
+                heapq.heappush(events, (clock + size(q, i), c, generation[c]))
+                switched_in.append(c)
+
+            # 3. Idle cores take work, lowest core first, while there is any
+            if per_core and not steal:
+                # Only a core freed or given an arrival now can have work in its own queue
+                if self.waiting:
+                    for c in sorted(idle.intersection(arrived.union(freed))):
+                        dispatches += take_work(c)
+            else:
+                # Any idle core finds work while some is waiting
+                for c in freed:
+                    heapq.heappush(idle_order, c)
+                if len(idle_order) > 4 * cores:
+                    idle_order = sorted(idle)
+                while self.waiting and idle_order:
+                    c = heapq.heappop(idle_order)
+                    if c in idle:
+                        dispatches += take_work(c)
+                        started(c)
+
+            # 4. Arrivals may preempt running processes (only cores of queues that received them)
+            if preemptive and arrived and per_core:
+                for c in sorted(arrived):
+                    if running[c] < 0 or clock < block_start[c] or c in switched:
+                        continue  # Idle, still switching or migrating, or just checked at its switch end
+                    sync(c)
+                    if self.queued[c] and self.policy(c).should_preempt(running[c]):
+                        self.push(c, stop(c))
+                        preemptions += 1
+                        dispatches += take_work(c)
+            elif preemptive and arrived:
+                # One shared queue: preempt the least deserving running process, as long as
+                # the queue's best process outranks it (cores just checked at their switch
+                # end join the candidates after this step)
+                policy = self.policy(0)
+                while self.queued[0]:
+                    worst = least_deserving()
+                    if worst < 0:
+                        break
+                    sync(worst)
+                    if not policy.should_preempt(running[worst]):
+                        break
+                    self.push(0, stop(worst))
+                    preemptions += 1
+                    dispatches += take_work(worst)
+                    started(worst)
+            for c in switched_in:
+                started(c)
+            switched_in.clear()
+
+            # 5. Jump to the next event, dropping events of preempted blocks
+            while events and events[0][2] != generation[events[0][1]]:
+                heapq.heappop(events)
+            if next_arrival < n and (not events or arrival[next_arrival] < events[0][0]):
+                if not events:
+                    idle_jumps += 1
+                clock = arrival[next_arrival]
+            else:
+                clock = events[0][0]
+
+        self.counters = {
+            'steps': steps,
+            'dispatches': dispatches,
+            'preemptions': preemptions,
+            'idle_jumps': idle_jumps,
+            'queue_pushes': n + preemptions,
+            'queue_pops': dispatches,
+            'ticks_total': clock,
+            'ticks_skipped': max(0, clock - steps),
+            'cores': cores,
+            'migrations': self.migrations,
+            'migration_time': self.migration_time,
+            'steals': self.steals,
+            'context_switches': self.context_switches,
+            'switch_time': self.context_switches * self.switch_cost
+        }
+        execution_log = list(heapq.merge(*self.core_logs))
+        result = ScheduleResult(execution_log, self.start, self.completion, self.counters, self.core_logs)
+        if self.switch_cost:
+            result.switch_logs = self.switch_logs
+        policies[0].finish(result)
+        return result
@@ -0,0 +1,120 @@
+from algorithms.engine import NO_ARRIVAL
+from utils.process_table import StreamTable
+from utils.statistics import StreamMetrics
+
+class StreamArrivals:
+
+    # Arrival source of a streaming run, mixed in ahead of the policy's Engine subclass.
+
+    # admit() reads processes from the record iterator instead of a ProcessTable read
+    # up front, appending each to a StreamTable when the clock reaches its arrival.
+    # Exactly one record is read ahead, which is all Engine.loop() needs: upcoming is
+    # its arrival time. The per-row columns, start and completion included, become
+    # dictionaries so that a completed process can be retired from every column.
+
+    def attach(self, records):
+        # Switches the engine over to the records, before its loop starts.
+        self.start = {}
+        self.completion = {}
+        for name in self.row_columns:
+            setattr(self, name, {})
+        self.records = iter(records)
+        self.pending = next(self.records, None)  # The next arrival, read ahead
+        self.upcoming = self.pending[1] if self.pending is not None else NO_ARRIVAL
+        self.peak_live = 0  # Most processes held in memory at once
+
+    def admit(self):
+        # Moves every arrival up to the clock into the ready queue.
+        if self.upcoming > self.clock:
+            return
+        table = self.table
+        records = self.records
+        pending = self.pending
+        while pending is not None and pending[1] <= self.clock:
+            i = table.append(*pending)
+            self.add_row(i)
+            self.push(i)
+            following = next(records, None)
+            if following is not None and following[1] < pending[1]:
+                raise ValueError(f"{following[0]} arrives at {following[1]}, before {pending[0]} at {pending[1]}")
+            pending = following
+        self.pending = pending
+        self.upcoming = pending[1] if pending is not None else NO_ARRIVAL
+        self.peak_live = max(self.peak_live, table.live())
+
+    def add_row(self, i):
+        self.start[i] = -1
+        self.completion[i] = 0
+        super().add_row(i)
+
+    def retire(self, i):
+        # Drops completed row i from the table and every per-row column.
+        del self.start[i], self.completion[i]
+        for name in self.row_columns:
+            del getattr(self, name)[i]
+        self.table.retire(i)
+
+class StreamSimulator:
+
+    # Online simulation of a scheduling policy over an unbounded arrival stream.
+
+    # The policy is any Engine subclass, run by its own event loop (Engine.loop) with
+    # StreamArrivals as the arrival source, so the schedule, the counters and RR's
+    # whole-round fast-forwarding are exactly the batch run's. The loop yields after
+    # every execution block; the blocks are then reported and dropped, and a completed
+    # process is reported and retired. Memory therefore follows the number of live
+    # processes, not the stream length.
+
+    # Arrivals must come in arrival order. The clock never runs past the latest known
+    # arrival, so each process's completion is reported as soon as it is final.
+    # Context switches cost switch_cost as in the engine; they are counted but not
+    # reported as blocks.
+
+    def __init__(self, engine_class, records, *args, switch_cost=0):
+
+        # Args:
+        #    engine_class: Engine subclass implementing the policy
+        #    records: Iterable of (pid, arrival_time, burst_time, priority) in arrival order
+        #    args: Extra engine arguments (e.g. the RR quantum)
+        #    switch_cost: Time the dispatcher spends on each context switch
+
+        self.table = StreamTable()
+        policy_class = type(engine_class.__name__, (StreamArrivals, engine_class), {})
+        self.policy = policy_class(self.table, *args)
+        self.policy.switch_cost = switch_cost
+        self.records = records
+        self.metrics = StreamMetrics()
+        self.counters = None  # Engine counters, set once the stream is exhausted
+
+    def events(self):
+
+        # Runs the simulation, yielding results as they become final.
+
+        # Yields:
+        #    ('block', (start, end, pid)) when an execution block ends
+        #    ('process', (pid, arrival, burst, priority, start, completion,
+        #                 turnaround, waiting, response, slowdown)) when a process completes
+
+        # Raises:
+        #    ValueError if a record arrives before the previous one
+
+        table = self.table
+        policy = self.policy
+        metrics = self.metrics
+        execution_log = policy.execution_log
+
+        policy.attach(self.records)
+        for i in policy.loop(emit=True):
+            for block in execution_log:
+                yield 'block', block
+            execution_log.clear()
+            policy.switch_log.clear()
+            if i >= 0:
+                # Process completed: report it and retire it from memory
+                arrival, burst, start, completion = table.arrival[i], table.burst[i], policy.start[i], policy.completion[i]
+                stats = metrics.add(arrival, burst, start, completion)
+                yield 'process', (table.pids[i], arrival, burst, table.priority[i], start, completion) + stats
+                policy.retire(i)
+
+        self.counters = policy.counters()
+        self.counters['peak_live'] = policy.peak_live
@@ -0,0 +1,286 @@
+import argparse
+import io
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+# Run from anywhere: make the scheduler package importable
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from scheduler import ALGORITHMS, simulate_algorithm
+from utils.parser import parse_input
+from utils.binary_workload import write_binary_workload, read_binary_workload
+from utils.gantt import print_gantt_chart
+from utils.event_log import iter_events, write_events
+from utils.statistics import StatsCalculator
+from utils.workload_generator import generate_workload, write_text_workload
+
+# Scaling benchmark for every stage of a simulation run.
+#
+# Two sweeps are measured:
+#   n sweep:     n = 10^2 .. max_n processes, mean burst 10
+#   burst sweep: n = BURST_SWEEP_N processes, mean burst 10 .. 10^7
+# Workloads come from the generator at 75% load (the arrival rate is scaled with
+# the mean burst), and RR uses a quantum of a fifth of the mean burst so that
+# its slice count does not grow with the burst scale.
+#
+# For each sweep the empirical complexity exponent of every stage is fitted as
+# the least-squares slope of log(time) against log(size).
+#
+# Usage:
+#   python benchmarks/bench.py run --output baseline.json
+#   python benchmarks/bench.py compare baseline.json current.json
+#   python benchmarks/bench.py startup
+
+BURST_SWEEP_N = 10**4
+BURST_SCALES = (10, 10**3, 10**5, 10**7)
+LOAD = 0.75
+SEED = 42
+
+# Fast stages are repeated until they have run for at least this long, keeping the best run
+MIN_TOTAL_TIME = 0.2
+
+# Timings below this are dominated by noise and never flagged as regressions
+NOISE_FLOOR = 0.001
+
+def quantum_for(mean_burst):
+    # RR quantum used for a given burst scale.
+    return max(2, int(mean_burst) // 5)
+
+def stage_functions(table, text_path, binary_path, mean_burst):
+    # Returns (stage name, callable) pairs for one workload.
+    #
+    # Reporting stages (stats, Gantt, event log) run on an SRTF result computed
+    # once up front, so their timings do not include scheduling.
+    reference = ALGORITHMS['SRTF'].simulate(table)
+    quantum = quantum_for(mean_burst)
+
+    def run_algorithm(name):
+        return lambda: simulate_algorithm(name, table, quantum)
+
+    stages = [
+        ('parse_text', lambda: parse_input(text_path)),
+        ('load_binary', lambda: read_binary_workload(binary_path))
+    ]
+    stages += [(f"algo_{name}", run_algorithm(name)) for name in ALGORITHMS]
+    stages += [
+        ('stats', lambda: StatsCalculator(table, reference).summarize()),
+        ('gantt', lambda: print_gantt_chart(reference.execution_log, stream=io.StringIO())),
+        ('event_log', lambda: write_events(iter_events(table, reference), io.StringIO()))
+    ]
+    return stages
+
+def measure(fn, memory):
+    # Returns (best wall seconds, peak traced bytes or None) for fn.
+    #
+    # Wall time is measured without tracemalloc; the peak is taken from an extra,
+    # traced run because tracing slows allocations down considerably.
+    seconds = float('inf')
+    total = 0.0
+    while total < MIN_TOTAL_TIME:
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        seconds = min(seconds, elapsed)
+        total += elapsed
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return seconds, peak
+
+def bench_workload(sweep, n, mean_burst, memory, results):
+    # Measures every stage on one generated workload and appends the records to results.
+    table = generate_workload(n, SEED, arrival_rate=LOAD / mean_burst, mean_burst=mean_burst)
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = os.path.join(tmp, 'workload.txt')
+        binary_path = os.path.join(tmp, 'workload.bin')
+        write_text_workload(table, text_path)
+        write_binary_workload(table, binary_path)
+
+        for stage, fn in stage_functions(table, text_path, binary_path, mean_burst):
+            seconds, peak = measure(fn, memory)
+            results.append({'sweep': sweep, 'stage': stage, 'n': n, 'burst_scale': mean_burst,
+                            'seconds': seconds, 'peak_bytes': peak})
+            print(f"{sweep:<6} {stage:<14} n={n:<8} burst={mean_burst:<9} {seconds:>10.6f}s"
+                  + (f" {peak / 2**20:>9.1f} MiB" if peak is not None else ""), flush=True)
+
+def fit_exponent(points):
+    # Least-squares slope of log(seconds) against log(size), or None with fewer than 2 points.
+    if len(points) < 2:
+        return None
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(seconds) for _, seconds in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    denominator = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / denominator
+
+def fit_exponents(results):
+    # {sweep: {stage: exponent}} fitted over each sweep's sizes.
+    exponents = {}
+    for sweep, size_key in (('n', 'n'), ('burst', 'burst_scale')):
+        stages = {}
+        for record in results:
+            if record['sweep'] == sweep:
+                stages.setdefault(record['stage'], []).append((record[size_key], record['seconds']))
+        exponents[sweep] = {stage: fit_exponent(points) for stage, points in stages.items()}
+    return exponents
+
+def run_main(args):
+    sizes = [10**k for k in range(2, 7) if 10**k <= args.max_n]
+    results = []
+    for n in sizes:
+        bench_workload('n', n, 10, not args.no_memory, results)
+    for mean_burst in BURST_SCALES:
+        if mean_burst <= args.max_burst:
+            bench_workload('burst', BURST_SWEEP_N, mean_burst, not args.no_memory, results)
+
+    baseline = {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+        'exponents': fit_exponents(results)
+    }
+    with open(args.output, 'w') as f:
+        json.dump(baseline, f, indent=2)
+
+    print("\nEmpirical complexity exponents (time ~ size^k):")
+    print(f"{'Stage':<14} {'k (n)':<10} {'k (burst)':<10}")
+    for stage in baseline['exponents']['n']:
+        k_n = baseline['exponents']['n'].get(stage)
+        k_burst = baseline['exponents']['burst'].get(stage)
+        print(f"{stage:<14} {'-' if k_n is None else f'{k_n:.2f}':<10} {'-' if k_burst is None else f'{k_burst:.2f}':<10}")
+    print(f"\nBaseline written to {args.output}")
+
+def compare_main(args):
+    # Flags stages that got slower than threshold x baseline, or whose exponent grew.
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    def key(record):
+        return record['sweep'], record['stage'], record['n'], record['burst_scale']
+
+    base_records = {key(record): record for record in baseline['results']}
+    regressions = []
+
+    print(f"{'Sweep':<6} {'Stage':<14} {'n':<8} {'Burst':<9} {'Base (s)':>10} {'Now (s)':>10} {'Ratio':>7}")
+    for record in current['results']:
+        base = base_records.get(key(record))
+        if base is None:
+            continue
+        ratio = record['seconds'] / base['seconds'] if base['seconds'] > 0 else float('inf')
+        flag = ''
+        if ratio > args.threshold and record['seconds'] >= NOISE_FLOOR:
+            flag = '  REGRESSION'
+            regressions.append(key(record))
+        print(f"{record['sweep']:<6} {record['stage']:<14} {record['n']:<8} {record['burst_scale']:<9} "
+              f"{base['seconds']:>10.6f} {record['seconds']:>10.6f} {ratio:>7.2f}{flag}")
+
+    print("\nComplexity exponents:")
+    for sweep, stages in current['exponents'].items():
+        for stage, exponent in stages.items():
+            base_exponent = baseline['exponents'].get(sweep, {}).get(stage)
+            if exponent is None or base_exponent is None:
+                continue
+            flag = ''
+            if exponent - base_exponent > args.exponent_tolerance:
+                flag = '  REGRESSION'
+                regressions.append((sweep, stage, 'exponent'))
+            print(f"{sweep:<6} {stage:<14} {base_exponent:>6.2f} -> {exponent:>6.2f}{flag}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) found.")
+        sys.exit(1)
+    print("\nNo regressions.")
+
+def startup_commands():
+    # (name, argv) pairs timed by the startup benchmark.
+    #
+    # 'python' is the bare interpreter and 'import_pyplot' the matplotlib import that
+    # used to run at every CLI start; the CLI runs show what a short call costs now.
+    # They bypass the result cache, which would otherwise turn every run after the
+    # first into a cache hit (and fill the user's cache directory).
+    scheduler_path = os.path.join(ROOT, 'scheduler.py')
+    workload = os.path.join(ROOT, 'processes.txt')
+    cli = [sys.executable, scheduler_path, '--input', workload, '--no-cache']
+    return [
+        ('python', [sys.executable, '-c', 'pass']),
+        ('import_pyplot', [sys.executable, '-c', "import matplotlib; matplotlib.use('Agg'); import matplotlib.pyplot"]),
+        ('cli_fcfs', cli + ['--algo', 'FCFS', '--quiet']),
+        ('cli_fcfs_json', cli + ['--algo', 'FCFS', '--format', 'json']),
+        ('cli_all_graphs', cli + ['--algo', 'ALL', '--quiet'])
+    ]
+
+def startup_main(args):
+    # Times short CLI invocations end to end, each in a fresh interpreter.
+    results = []
+    print(f"{'Command':<16} {'Min (s)':>10} {'Median (s)':>11}")
+    # The ALL run writes its graphs to graphs/ under the working directory: run every
+    # command in a scratch directory so the tracked graphs/*.png are left alone
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, argv in startup_commands():
+            times = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                subprocess.run(argv, cwd=tmp, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+                times.append(time.perf_counter() - start)
+            results.append({'command': name, 'min_seconds': min(times), 'median_seconds': statistics.median(times)})
+            print(f"{name:<16} {min(times):>10.4f} {statistics.median(times):>11.4f}", flush=True)
+
+    timings = {record['command']: record['min_seconds'] for record in results}
+    saved = timings['import_pyplot'] - timings['python']
+    print(f"\nEager matplotlib import avoided per run: {saved:.4f}s "
+          f"(cli_fcfs would take about {timings['cli_fcfs'] + saved:.4f}s with it)")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'created': datetime.now(timezone.utc).isoformat(), 'python': platform.python_version(),
+                       'platform': platform.platform(), 'repeat': args.repeat, 'results': results}, f, indent=2)
+        print(f"Startup timings written to {args.output}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling benchmark for the scheduling simulator")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="Run the benchmark and write a JSON baseline")
+    run.add_argument('--output', default='benchmark.json', help="JSON file to write (default: benchmark.json)")
+    run.add_argument('--max-n', type=int, default=10**6, help="Largest process count of the n sweep (default: 10^6)")
+    run.add_argument('--max-burst', type=int, default=10**7, help="Largest mean burst of the burst sweep (default: 10^7)")
+    run.add_argument('--no-memory', action='store_true', help="Skip the traced second run that measures peak memory")
+
+    compare = commands.add_parser('compare', help="Compare a run against a baseline")
+    compare.add_argument('baseline', help="Baseline JSON file")
+    compare.add_argument('current', help="JSON file of the run to check")
+    compare.add_argument('--threshold', type=float, default=1.5, help="Flag stages slower than this ratio (default: 1.5)")
+    compare.add_argument('--exponent-tolerance', type=float, default=0.15,
+                         help="Flag exponents that grew by more than this (default: 0.15)")
+
+    startup = commands.add_parser('startup', help="Time short CLI invocations, including interpreter startup")
+    startup.add_argument('--repeat', type=int, default=10, help="Runs per command (default: 10)")
+    startup.add_argument('--output', help="Optional JSON file to write the timings to")
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        run_main(args)
+    elif args.command == 'startup':
+        startup_main(args)
+    else:
+        compare_main(args)
+
+if __name__ == "__main__":
+    main()
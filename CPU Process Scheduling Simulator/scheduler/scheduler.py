@@ -1,22 +1,69 @@
 
 import argparse
+import contextlib
+import csv
+import importlib
+import io
+import shutil
 import sys
-import copy
 import os
-from utils.parser import parse_input
-from utils.gantt import print_gantt_chart
-from utils.statistics import StatsCalculator, save_graphs
+import tempfile
+import types
+from collections.abc import Mapping
+from utils.parser import load_workload, convert_workload, parse_lines, read_lines
+from utils.binary_workload import is_binary_workload, write_binary_workload
+from utils.gantt import print_gantt_chart, print_core_gantt_charts
+from utils.event_log import iter_events, write_events
+from utils.profiler import PhaseProfiler, NullProfiler
+from utils.report import PROCESS_FIELDS, BLOCK_FIELDS, REPORT_FORMATS, NdjsonReportWriter, iter_process_records, open_output
+from utils.result_cache import ResultCache, workload_identity
+from utils.checkpoint import CheckpointDirectory, IncrementalRun
+from utils.statistics import Metrics, StatsCalculator, RunningStats, save_graphs, save_sweep_graphs
+from utils.workload_generator import (ARRIVAL_DISTRIBUTIONS, BURST_DISTRIBUTIONS, PRIORITY_DISTRIBUTIONS,
+                                      generate_workload, write_text_workload)
+from algorithms.smp import PLACEMENTS, SMPOptions
 
-from algorithms import fcfs, sjf, srtf, rr, priority_np, priority_p
+class AlgorithmRegistry(Mapping):
+    
+    # Read-only mapping of algorithm names to their implementation modules.
+    
+    # Modules are imported the first time they are looked up, so a run of a single
+    # algorithm only loads that algorithm. Iteration and membership tests use the
+    # names alone and import nothing.
+    
+    def __init__(self, modules):
+        self.modules = modules  # Algorithm name -> module path
+        
+    def __getitem__(self, name):
+        return importlib.import_module(self.modules[name])
+    
+    def __contains__(self, name):
+        return name in self.modules
+    
+    def __iter__(self):
+        return iter(self.modules)
+    
+    def __len__(self):
+        return len(self.modules)
 
 # Mapping of algorithm names to their implementation modules
-ALGORITHMS = {
-    'FCFS': fcfs,
-    'SJF': sjf,
-    'SRTF': srtf,
-    'RR': rr,
-    'PRIO_NP': priority_np,
-    'PRIO_P': priority_p
+ALGORITHMS = AlgorithmRegistry({
+    'FCFS': 'algorithms.fcfs',
+    'SJF': 'algorithms.sjf',
+    'SRTF': 'algorithms.srtf',
+    'RR': 'algorithms.rr',
+    'PRIO_NP': 'algorithms.priority_np',
+    'PRIO_P': 'algorithms.priority_p',
+    'MLFQ': 'algorithms.mlfq',
+    'CFS': 'algorithms.cfs'
+})
+
+# Algorithms that take the --quantum value, and the simulate() argument it is passed as
+# (MLFQ uses it for its top level, CFS as its minimum granularity)
+QUANTUM_ALGORITHMS = {
+    'RR': 'quantum',
+    'MLFQ': 'quantum',
+    'CFS': 'min_granularity'
 }
 
 class Tee:
@@ -44,176 +91,868 @@ class Tee:
         # Close the log file.
         self.log.close()
 
-def generate_execution_log(processes, execution_log):
+def generate_execution_log(table, result, stream=None):
     
-   # Generates a detailed chronological text log of all scheduling events.
+   # Writes a detailed chronological text log of all scheduling events.
     
    # Events include:
    # - Process arrivals
    # - Process starts running
+   # - Process preemptions
    # - Process completions
     
+   # Events are produced lazily by utils.event_log.iter_events (linear time) and
+   # written line by line, so the log is never held in memory.
+    
    # Args:
-   # processes: List of process dictionaries (used for arrival times and completion checking)
-   # execution_log: List of (start, end, pid) tuples from the scheduling algorithm
+   # table: ProcessTable (used for arrival times)
+   # result: ScheduleResult with the execution log and completion times
+   # stream: File-like object to write to (default: sys.stdout)
         
     # Returns:
-    #    List of (time, event_message) tuples sorted chronologically
+    #    Number of events written
     
-    events = []
+    if stream is None:
+        stream = sys.stdout
     
-    # Add all process arrival events
-    for p in processes:
-        events.append((p['arrival_time'], f"{p['pid']} arrives"))
-        
-    # Track previous process to detect context switches
-    last_pid = None
-    
-    # Sort execution log by start time to ensure correct ordering
-    execution_log.sort(key=lambda x: x[0])
-    
-    # Process each execution block
-    for start, end, pid in execution_log:
-        # Context switch detection (for logging purposes)
-        if last_pid is not None and last_pid != pid:
-            # Process changed - this is a context switch or preemption
-            pass
-            
-        # Record when this process starts running
-        events.append((start, f"{pid} starts running"))
-        
-        # Check if this process completed at the end of this block
-        # Find the process object to check completion time
-        proc = next((p for p in processes if p['pid'] == pid), None)
-        if proc and proc['completion_time'] == end:
-             events.append((end, f"{pid} completes"))
-             
-        last_pid = pid
-
-    # Define priority for event ordering when multiple events occur at same time
-    # Priority order: Arrival -> Completion -> Start (logical real-world order)
-    def event_priority(msg):
-        # Helper function to determine event priority for tie-breaking.
-        if "arrives" in msg: return 0  # Arrivals happen first
-        if "completes" in msg: return 1  # Then completions
-        if "starts" in msg: return 2  # Then starts
-        return 3
-        
-    # Sort events by time, then by priority
-    events.sort(key=lambda x: (x[0], event_priority(x[1])))
+    stream.write("\nExecution Log:\n")
+    return write_events(iter_events(table, result), stream)
+
+class DisplayOptions:
+    
+    # Which parts of each algorithm's report run_algorithm prints, and where.
     
-    # Print formatted execution log
-    print("\nExecution Log:")
-    for time, msg in events:
-        print(f"t={time}: {msg}")
+    def __init__(self, process_table=True, gantt=True, gantt_window=None, gantt_width=None,
+                 event_log=True, event_stream=None):
+        self.process_table = process_table  # Per-process statistics table
+        self.gantt = gantt  # Gantt chart (False for headless runs)
+        self.gantt_window = gantt_window  # Optional (start, end) time range for the Gantt chart
+        self.gantt_width = gantt_width  # Optional Gantt chart width in characters
+        self.event_log = event_log  # Chronological event log
+        self.event_stream = event_stream  # Where the event log goes (default: stdout)
         
-    return events
+    @classmethod
+    def from_args(cls, args, event_stream=None):
+        return cls(not args.no_process_table, not args.no_gantt, args.gantt_window, args.gantt_width,
+                   not args.no_event_log, event_stream)
 
-def run_algorithm(algo_name, processes, quantum=None):
+def run_algorithm(algo_name, processes, quantum=None, display=None, profiler=None, smp=None, params=None,
+                  cache=None, checkpoints=None):
     # Executes a single scheduling algorithm and displays all results.
 # 
 # Steps:
 # 1. Run the scheduling algorithm
 # 2. Generate and display Gantt chart
 # 3. Generate and display execution log
-# 4. Calculate context switches
+# 4. Report the context switches counted by the engine
 # 5. Calculate and display performance statistics
 # 
 # Args:
 #     algo_name: Name of the algorithm (e.g., 'FCFS', 'RR')
-#     processes: List of process dictionaries
+#     processes: ProcessTable shared by all runs (never modified)
 #     quantum: Time quantum (required only for Round Robin)
+#     display: DisplayOptions (default: print everything to stdout)
+#     profiler: Optional PhaseProfiler timing each step and recording the engine counters
+#     smp: Optional SMPOptions to simulate several cores (one Gantt lane per core)
+#     params: Optional {algorithm: keyword arguments} of algorithm settings (see simulate_algorithm)
+#     cache: Optional ResultCache; a hit skips scheduling and summarizing
+#     checkpoints: Optional CheckpointDirectory; a single-core run is checkpointed there and can be resumed
 #     
 # Returns:
-#     Tuple of (metrics_dict, processes_list) or (None, None) on error
+#     Tuple of (Metrics, ScheduleResult) or (None, None) on error
 
+    if display is None:
+        display = DisplayOptions()
+    if profiler is None:
+        profiler = NullProfiler()
+    
     print(f"--- Running {algo_name} ---")
     
-    # Deep copy to avoid modifying original process data
-    proc_copy = copy.deepcopy(processes)
+    # Round Robin requires quantum parameter
+    if algo_name == 'RR' and quantum is None:
+        print("Error: Quantum required for RR.")
+        return None, None
     
-    # Execute the scheduling algorithm
-    if algo_name == 'RR':
-        # Round Robin requires quantum parameter
-        if quantum is None:
-            print("Error: Quantum required for RR.")
-            return None, None
-        execution_log = ALGORITHMS[algo_name].schedule(proc_copy, quantum)
-    else:
-        # Other algorithms don't need quantum
-        execution_log = ALGORITHMS[algo_name].schedule(proc_copy)
+    # Algorithms read the table and write into fresh result columns, so no copy is needed
+    with profiler.phase(algo_name, 'schedule'):
+        result, cached = cached_simulation(algo_name, processes, quantum, smp, params, cache, checkpoints)
+    profiler.record_counters(algo_name, result.counters)
         
-    # Display visual Gantt chart
-    print_gantt_chart(execution_log)
+    # Display visual Gantt chart (one lane per core on multi-core runs)
+    if display.gantt:
+        with profiler.phase(algo_name, 'gantt'):
+            if result.core_logs is not None:
+                print_core_gantt_charts(result.core_logs, display.gantt_window, display.gantt_width,
+                                        switch_logs=result.switch_logs)
+            else:
+                print_gantt_chart(result.execution_log, display.gantt_window, display.gantt_width,
+                                  switch_log=result.switch_logs[0] if result.switch_logs else None)
     
     # Display detailed event log
-    generate_execution_log(proc_copy, execution_log)
+    if display.event_log:
+        with profiler.phase(algo_name, 'event_log'):
+            if display.event_stream is not None:
+                display.event_stream.write(f"--- {algo_name} ---\n")
+            generate_execution_log(processes, result, display.event_stream)
     
-    # Calculate context switches (number of CPU switches between processes)
-    context_switches = 0
-    if len(execution_log) > 0:
-        execution_log_sorted = sorted(execution_log, key=lambda x: x[0])
-        # Count switches: when PID changes between consecutive blocks
-        for i in range(1, len(execution_log_sorted)):
-            if execution_log_sorted[i][2] != execution_log_sorted[i-1][2]:
-                context_switches += 1
-    
-    print(f"\nTotal Context Switches: {context_switches}")
+    # Context switches (dispatches of a different process than the core ran last) are counted while scheduling
+    print(f"\nTotal Context Switches: {result.counters['context_switches']}")
     
     # Calculate performance metrics (turnaround, waiting, response times)
-    stats_calc = StatsCalculator(proc_copy)
-    metrics = stats_calc.compute_metrics()
-    metrics['context_switches'] = context_switches
+    with profiler.phase(algo_name, 'stats'):
+        stats_calc = StatsCalculator(processes, result)
+        metrics = stats_calc.compute_metrics(display.process_table, cached)
+    if cache is not None and cached is None:
+        store_result(cache, algo_name, processes, quantum, smp, params, result, metrics)
     
-    return metrics, proc_copy
+    return metrics, result
+
+def run_algorithm_worker(algo_name, workload_path, quantum, display, event_path, trace_memory=None, smp=None,
+                         params=None, cache=None, checkpoints=None):
+    # Process-pool entry point for parallel --algo ALL.
+#
+# Every worker memory-maps the same binary workload file, so the parsed workload
+# is shared read-only through the page cache instead of being pickled per task.
+# The printed report is captured and returned so the parent can print the
+# reports in a deterministic order; the event log goes to a per-algorithm file.
+# When trace_memory is not None the run is profiled in the worker (with or without
+# tracemalloc) and the profile records are returned for the parent to replay.
+#
+# Returns:
+#     Tuple of (Metrics or None, captured report text, list of profile records)
+    processes = load_workload(workload_path)
+    output = io.StringIO()
+    event_file = open(event_path, 'w') if event_path else None
+    display.event_stream = event_file
+    profiler = PhaseProfiler(trace_memory) if trace_memory is not None else None
+    try:
+        if profiler:
+            profiler.start()
+        with contextlib.redirect_stdout(output):
+            metrics, _ = run_algorithm(algo_name, processes, quantum, display, profiler, smp, params, cache,
+                                       checkpoints)
+    finally:
+        if profiler:
+            profiler.stop()
+        if event_file:
+            event_file.close()
+    return metrics, output.getvalue(), profiler.records if profiler else []
+
+def process_pool(jobs):
+    # ProcessPoolExecutor with the given number of workers. concurrent.futures is
+    # imported here because loading it (and multiprocessing) slows down every serial run.
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers=jobs)
+
+@contextlib.contextmanager
+def shared_workload_file(processes, input_path):
+    # Yields the path of a binary workload file worker processes can memory-map.
+    # Binary inputs are used as they are; text inputs are written to a temporary file.
+    if is_binary_workload(input_path):
+        yield input_path
+        return
+    fd, temp_path = tempfile.mkstemp(suffix='.bin')
+    os.close(fd)
+    try:
+        write_binary_workload(processes, temp_path)
+        yield temp_path
+    finally:
+        os.remove(temp_path)
+
+def run_all_parallel(processes, input_path, quantum, display, jobs, profiler=None, smp=None, params=None,
+                     cache=None, checkpoints=None):
+    # Runs every algorithm in ALGORITHMS on a process pool.
+#
+# Reports are printed in ALGORITHMS order, exactly as the serial loop prints them.
+#
+# Args:
+#     processes: Parsed ProcessTable
+#     input_path: Workload file given on the command line
+#     quantum: Time quantum for RR
+#     display: DisplayOptions (its event_stream receives the per-algorithm event logs in order)
+#     jobs: Number of worker processes
+#     profiler: Optional PhaseProfiler receiving the records profiled in the workers
+#     smp: Optional SMPOptions to simulate several cores
+#     params: Optional {algorithm: keyword arguments} of algorithm settings
+#     cache: Optional ResultCache shared by the workers
+#     checkpoints: Optional CheckpointDirectory shared by the workers
+#
+# Returns:
+#     Dictionary mapping algorithm names to their Metrics
+    trace_memory = profiler.trace_memory if profiler else None
+    event_stream = display.event_stream
+    display.event_stream = None  # Open files cannot be sent to workers
+    event_paths = {}
+    if event_stream is not None:
+        for name in ALGORITHMS:
+            fd, event_paths[name] = tempfile.mkstemp(suffix=f'.{name}.log')
+            os.close(fd)
+    
+    results = {}
+    try:
+        # Share the workload through a memory-mapped binary file
+        with shared_workload_file(processes, input_path) as workload_path, \
+                process_pool(jobs) as pool:
+            futures = {name: pool.submit(run_algorithm_worker, name, workload_path, quantum, display,
+                                         event_paths.get(name), trace_memory, smp, params, cache, checkpoints)
+                       for name in ALGORITHMS}
+            for name, future in futures.items():
+                metrics, report, records = future.result()
+                print(report, end='')
+                for record in records:
+                    profiler.add_record(record)
+                if metrics:
+                    results[name] = metrics
+                print("-" * 50)
+                
+                if event_stream is not None:
+                    with open(event_paths[name]) as f:
+                        shutil.copyfileobj(f, event_stream)
+    finally:
+        display.event_stream = event_stream
+        for path in event_paths.values():
+            os.remove(path)
+    
+    return results
+
+def algorithm_kwargs(algo_name, quantum=None, params=None):
+    # Keyword arguments of an algorithm's simulate() / stream(): its entry in params
+    # (e.g. {'MLFQ': {'levels': 4}}) plus the quantum for QUANTUM_ALGORITHMS.
+    kwargs = dict(params.get(algo_name, {})) if params else {}
+    if algo_name in QUANTUM_ALGORITHMS and quantum is not None:
+        kwargs[QUANTUM_ALGORITHMS[algo_name]] = quantum
+    return kwargs
+
+def simulate_algorithm(algo_name, processes, quantum=None, smp=None, params=None, checkpoints=None, cache=None):
+    # Runs one algorithm over a ProcessTable without printing and returns its ScheduleResult.
+    # smp (SMPOptions) simulates several cores instead of one, and params maps algorithm
+    # names to extra keyword arguments of their simulate() (see algorithm_kwargs).
+    # checkpoints (CheckpointDirectory) snapshots single-core runs so they can be resumed,
+    # and an incremental cache (ResultCache) lets them continue the run over an earlier,
+    # shorter version of the workload.
+    kwargs = algorithm_kwargs(algo_name, quantum, params)
+    checkpoint = checkpoints.for_run(algo_name, kwargs) if checkpoints is not None and smp is None else None
+    incremental = IncrementalRun(cache, algo_name, kwargs) if cache is not None and cache.incremental \
+        and smp is None else None
+    return ALGORITHMS[algo_name].simulate(processes, smp=smp, checkpoint=checkpoint, incremental=incremental, **kwargs)
+
+def cached_simulation(algo_name, processes, quantum=None, smp=None, params=None, cache=None, checkpoints=None):
+    # simulate_algorithm() through an optional ResultCache.
+    # Returns (ScheduleResult, Metrics stored with it on a hit or None on a miss).
+    if cache is not None:
+        run = cache.get(cache.key(algo_name, algorithm_kwargs(algo_name, quantum, params), smp), processes)
+        if run is not None:
+            return run.result, Metrics.from_dict(run.metrics)
+    return simulate_algorithm(algo_name, processes, quantum, smp, params, checkpoints, cache), None
+
+def store_result(cache, algo_name, processes, quantum, smp, params, result, metrics):
+    # Saves a run missed by cached_simulation() together with its Metrics.
+    cache.put(cache.key(algo_name, algorithm_kwargs(algo_name, quantum, params), smp), processes, result, metrics)
+
+def simulate_worker(algo_name, workload_path, quantum, smp=None, params=None, checkpoints=None, cache=None):
+    # Process-pool entry point for structured output: maps the shared workload and runs one algorithm.
+    return simulate_algorithm(algo_name, load_workload(workload_path), quantum, smp, params, checkpoints, cache)
+
+def write_structured(algo_name, processes, result, writer, profiler, include_processes, include_log,
+                     event_stream=None, cached=None):
+    # Computes the metrics of one finished run (unless cached holds them) and hands them to a ReportWriter.
+    profiler.record_counters(algo_name, result.counters)
+    if event_stream is not None:
+        with profiler.phase(algo_name, 'event_log'):
+            event_stream.write(f"--- {algo_name} ---\n")
+            generate_execution_log(processes, result, event_stream)
+    
+    with profiler.phase(algo_name, 'stats'):
+        stats_calc = StatsCalculator(processes, result)
+        if cached is None:
+            metrics = stats_calc.summarize()
+        else:
+            metrics = cached
+            if include_processes:
+                stats_calc.process_columns()
+    
+    with profiler.phase(algo_name, 'write'):
+        writer.write_algorithm(algo_name, metrics,
+                               iter_process_records(processes, result, stats_calc) if include_processes else None,
+                               result.execution_log if include_log else None)
+    return metrics
+
+def run_structured(names, processes, input_path, quantum, writer, jobs=1, profiler=None,
+                   include_processes=True, include_log=False, event_stream=None, smp=None, params=None,
+                   cache=None, checkpoints=None):
+    # Runs algorithms headlessly and writes their results through a ReportWriter (--format).
+#
+# Nothing is printed: no Gantt chart, per-process table or console event log. The
+# writer receives the metrics, the per-process results and optionally the execution
+# log of every algorithm, in the order given. With jobs > 1 the algorithms run on a
+# process pool sharing the memory-mapped workload (see run_all_parallel).
+#
+# Args:
+#     names: Algorithm names to run
+#     processes: Parsed ProcessTable
+#     input_path: Workload file given on the command line
+#     quantum: Time quantum for RR
+#     writer: ReportWriter (see utils/report.py)
+#     jobs: Number of worker processes
+#     profiler: Optional PhaseProfiler (schedule phases are only timed in serial runs)
+#     include_processes: Write one record per process
+#     include_log: Write the execution log blocks
+#     event_stream: Optional file receiving the text event log
+#     smp: Optional SMPOptions to simulate several cores
+#     params: Optional {algorithm: keyword arguments} of algorithm settings
+#     cache: Optional ResultCache; only missed algorithms are simulated
+#     checkpoints: Optional CheckpointDirectory for the simulated single-core runs
+#
+# Returns:
+#     Dictionary mapping algorithm names to their Metrics
+    if profiler is None:
+        profiler = NullProfiler()
+    
+    info = {'input': input_path, 'quantum': quantum, 'processes': len(processes)}
+    if smp is not None:
+        info.update(cores=smp.cores, placement=smp.placement, migration_cost=smp.migration_cost, steal=smp.steal)
+    writer.begin(info)
+    results = {}
+    hits = {}  # Algorithm -> (ScheduleResult, Metrics) found in the cache
+    misses = names
+    if cache is not None:
+        misses = []
+        for name in names:
+            run = cache.get(cache.key(name, algorithm_kwargs(name, quantum, params), smp), processes)
+            if run is not None:
+                hits[name] = (run.result, Metrics.from_dict(run.metrics))
+            else:
+                misses.append(name)
+    
+    def write(name, result, cached=None):
+        results[name] = write_structured(name, processes, result, writer, profiler, include_processes,
+                                         include_log, event_stream, cached)
+        if cache is not None and cached is None:
+            store_result(cache, name, processes, quantum, smp, params, result, results[name])
+    
+    if jobs > 1 and len(misses) > 1:
+        with shared_workload_file(processes, input_path) as workload_path, \
+                process_pool(jobs) as pool:
+            runs = dict(zip(misses, pool.map(simulate_worker, misses, [workload_path] * len(misses),
+                                             [quantum] * len(misses), [smp] * len(misses),
+                                             [params] * len(misses), [checkpoints] * len(misses),
+                                             [cache] * len(misses))))
+            for name in names:
+                if name in hits:
+                    write(name, *hits[name])
+                else:
+                    write(name, runs[name])
+    else:
+        for name in names:
+            if name in hits:
+                write(name, *hits[name])
+                continue
+            with profiler.phase(name, 'schedule'):
+                result = simulate_algorithm(name, processes, quantum, smp, params, checkpoints, cache)
+            write(name, result)
+    writer.end()
+    return results
+
+def run_stream(algo_name, source, quantum, out, structured=False, every=1000, include_log=False,
+               show_processes=True, strict=False, params=None):
+    # Simulates one algorithm online over arrivals read from a pipe, FIFO or file (--stream).
+# 
+# Lines are read one at a time in the text workload format and must come in arrival
+# order. Each completed process is reported as soon as its completion is final and
+# then dropped from memory, and running metrics are reported every `every`
+# completions and once more at the end of the stream.
+# 
+# Args:
+#     algo_name: Algorithm to run
+#     source: Path of the input ('-' for stdin)
+#     quantum: Time quantum (required for RR)
+#     out: Text stream receiving the results; flushed before every blocking read
+#     structured: Write NDJSON records instead of text lines
+#     every: Completions between running metrics reports (0 = only at the end)
+#     include_log: Also report every execution block
+#     show_processes: Report each completed process
+#     strict: Stop at the first malformed or out-of-order line instead of skipping it
+#     params: Extra algorithm arguments (see algorithm_kwargs)
+# 
+# Returns:
+#     The StreamSimulator, with its final metrics and counters
+    writer = NdjsonReportWriter(out) if structured else None
+    # Skipped lines are reported right away instead of being collected
+    warnings = types.SimpleNamespace(append=lambda e: print(f"Warning: skipped {e}", file=sys.stderr))
+    
+    def report_metrics(metrics, counters=None):
+        if writer:
+            record = {'record': 'metrics', 'algorithm': algo_name, **metrics.to_dict()}
+            if counters is not None:
+                record['final'] = True
+                record['counters'] = counters
+            writer.write_record(record)
+            return
+        summary = metrics.to_dict()
+        out.write(f"[t={summary['clock']}] {summary['completed']} completed: "
+                  f"avg turnaround {summary['turnaround']['mean']:.2f}, avg waiting {summary['waiting']['mean']:.2f}, "
+                  f"avg response {summary['response']['mean']:.2f}, throughput {summary['throughput']:.4f}, "
+                  f"CPU utilization {summary['cpu_utilization']:.2%}\n")
+    
+    f = sys.stdin if source == '-' else open(source, 'r')
+    try:
+        records = parse_lines(read_lines(f, out.flush), '<stdin>' if source == '-' else source,
+                              strict, warnings, require_sorted=True)
+        simulator = ALGORITHMS[algo_name].stream(records, **algorithm_kwargs(algo_name, quantum, params))
+        if writer:
+            writer.begin({'input': source, 'algorithm': algo_name, 'quantum': quantum, 'stream': True})
+        else:
+            out.write(f"Streaming {algo_name} from {'stdin' if source == '-' else source}...\n")
+        
+        for kind, row in simulator.events():
+            if kind == 'block':
+                if not include_log:
+                    continue
+                if writer:
+                    writer.write_record({'record': 'block', 'algorithm': algo_name, **dict(zip(BLOCK_FIELDS, row))})
+                else:
+                    out.write(f"  {row[2]} ran {row[0]}-{row[1]}\n")
+                continue
+            if show_processes:
+                if writer:
+                    writer.write_record({'record': 'process', 'algorithm': algo_name, **dict(zip(PROCESS_FIELDS, row))})
+                else:
+                    out.write(f"{row[0]} completed at {row[5]} (turnaround {row[6]}, waiting {row[7]}, response {row[8]})\n")
+            if every and simulator.metrics.completed % every == 0:
+                report_metrics(simulator.metrics)
+        
+        if writer:
+            report_metrics(simulator.metrics, simulator.counters)
+        else:
+            out.write("End of stream.\n")
+            if not every or simulator.metrics.completed % every:
+                report_metrics(simulator.metrics)  # Not reported by the last periodic report
+        out.flush()
+        return simulator
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+def evaluate_quantum(workload_path, quantum, smp=None, params=None):
+    # Runs Round Robin with one quantum, without printing, and returns its Metrics.
+    # Takes a workload path so it can run in a worker process (see shared_workload_file).
+    processes = load_workload(workload_path)
+    result = simulate_algorithm('RR', processes, quantum, smp, params)
+    return StatsCalculator(processes, result).summarize()
+
+def run_quantum_sweep(processes, input_path, quanta, jobs=1, csv_path=None, smp=None, params=None):
+    # Evaluates Round Robin for every quantum in a range and compares the results.
+#
+# The workload is parsed once and shared with the workers through a memory-mapped
+# binary file; with jobs > 1 the quanta are evaluated on a process pool.
+#
+# Args:
+#     processes: Parsed ProcessTable
+#     input_path: Workload file given on the command line
+#     quanta: Iterable of quantum values
+#     jobs: Number of worker processes
+#     csv_path: Optional path of a CSV file to write the results to
+#     smp: Optional SMPOptions to simulate several cores
+#     params: Optional {algorithm: keyword arguments} of algorithm settings (e.g. the switch cost)
+#
+# Returns:
+#     List of (quantum, Metrics) tuples
+    quanta = list(quanta)
+    with shared_workload_file(processes, input_path) as workload_path:
+        paths = [workload_path] * len(quanta)
+        options = [smp] * len(quanta)
+        settings = [params] * len(quanta)
+        if jobs > 1:
+            with process_pool(jobs) as pool:
+                sweep = list(zip(quanta, pool.map(evaluate_quantum, paths, quanta, options, settings)))
+        else:
+            sweep = list(zip(quanta, map(evaluate_quantum, paths, quanta, options, settings)))
+    
+    print(f"Round Robin Quantum Sweep on {input_path}:")
+    print(f"{'Quantum':<10} {'Avg Turnaround':<15} {'Avg Waiting':<15} {'Avg Response':<15} {'Context Switches':<18}")
+    for quantum, metrics in sweep:
+        print(f"{quantum:<10} {metrics.avg_turnaround:<15.2f} {metrics.avg_waiting:<15.2f} {metrics.avg_response:<15.2f} {metrics.context_switches:<18}")
+    
+    if csv_path:
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['quantum', 'avg_turnaround', 'avg_waiting', 'avg_response', 'context_switches'])
+            for quantum, metrics in sweep:
+                writer.writerow([quantum, metrics.avg_turnaround, metrics.avg_waiting, metrics.avg_response,
+                                 metrics.context_switches])
+        print(f"\nSweep results saved to {csv_path}")
+    
+    save_sweep_graphs(sweep)
+    return sweep
+
+def parse_sweep(text):
+    # argparse type for --quantum-sweep: 'start:stop[:step]' -> range of quanta, stop included
+    try:
+        parts = [int(part) for part in text.split(':')]
+        start, stop = parts[0], parts[1]
+        step = parts[2] if len(parts) == 3 else 1
+        if len(parts) not in (2, 3):
+            raise ValueError
+    except (ValueError, IndexError):
+        raise argparse.ArgumentTypeError(f"expected start:stop[:step], got '{text}'")
+    if start < 1 or step < 1 or stop < start:
+        raise argparse.ArgumentTypeError(f"expected 1 <= start <= stop and step >= 1, got '{text}'")
+    return range(start, stop + 1, step)
+
+def parse_quanta(text):
+    # argparse type for --mlfq-quanta: '2,4,8' -> [2, 4, 8]
+    try:
+        quanta = [int(part) for part in text.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers, got '{text}'")
+    if min(quanta) < 1:
+        raise argparse.ArgumentTypeError(f"quanta must be positive, got '{text}'")
+    return quanta
+
+def parse_window(text):
+    # argparse type for --gantt-window: 'start:end' -> (start, end)
+    try:
+        start, end = (int(part) for part in text.split(':'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected start:end, got '{text}'")
+    if end <= start:
+        raise argparse.ArgumentTypeError(f"window end must be after its start, got '{text}'")
+    return start, end
+
+def convert_main(argv):
+    # 'convert' subcommand: turns a text workload into the binary (memory-mapped) format.
+    parser = argparse.ArgumentParser(prog="scheduler.py convert",
+                                     description="Convert a text workload into the binary workload format")
+    parser.add_argument('source', help="Text process description file (PID arrival burst priority)")
+    parser.add_argument('destination', help="Binary workload file to write")
+    parser.add_argument('--strict', action='store_true', help="Fail on the first malformed line instead of skipping it")
+    args = parser.parse_args(argv)
+    
+    count = convert_workload(args.source, args.destination, args.strict)
+    if not count:
+        sys.exit(1)
+    print(f"Wrote {count} processes to {args.destination}")
+
+def add_generator_arguments(parser):
+    # Workload generator options shared by the 'generate' and 'batch' subcommands.
+    parser.add_argument('--processes', type=int, default=100, help="Processes per workload (default: 100)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument('--arrival', choices=ARRIVAL_DISTRIBUTIONS, default='poisson', help="Inter-arrival time distribution")
+    parser.add_argument('--arrival-rate', type=float, default=0.15, help="Mean arrivals per time unit (default: 0.15, 75% load with the default bursts)")
+    parser.add_argument('--burst', choices=BURST_DISTRIBUTIONS, default='exponential', help="Burst time distribution")
+    parser.add_argument('--mean-burst', type=float, default=5, help="Mean burst time (default: 5)")
+    parser.add_argument('--pareto-alpha', type=float, default=1.5, help="Shape of the heavy-tailed pareto distributions, > 1 (default: 1.5)")
+    parser.add_argument('--priority', choices=PRIORITY_DISTRIBUTIONS, default='uniform', help="Priority distribution")
+    parser.add_argument('--priority-levels', type=int, default=5, help="Number of priority levels (default: 5)")
+
+def generator_options(args):
+    # Keyword arguments for generate_workload taken from add_generator_arguments options.
+    return {
+        'arrival': args.arrival,
+        'arrival_rate': args.arrival_rate,
+        'burst': args.burst,
+        'mean_burst': args.mean_burst,
+        'pareto_alpha': args.pareto_alpha,
+        'priority': args.priority,
+        'priority_levels': args.priority_levels
+    }
+
+def generate_main(argv):
+    # 'generate' subcommand: writes one synthetic workload (binary if the name ends in .bin).
+    parser = argparse.ArgumentParser(prog="scheduler.py generate", description="Generate a synthetic workload file")
+    parser.add_argument('destination', help="Workload file to write (.bin for the binary format, text otherwise)")
+    add_generator_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    table = generate_workload(args.processes, args.seed, **generator_options(args))
+    if args.destination.endswith('.bin'):
+        write_binary_workload(table, args.destination)
+    else:
+        write_text_workload(table, args.destination)
+    print(f"Wrote {len(table)} processes to {args.destination}")
+
+# Metrics aggregated by the 'batch' subcommand, in summary column order
+BATCH_METRICS = ('avg_turnaround', 'avg_waiting', 'avg_response', 'context_switches')
+
+def batch_worker(first, count, seed, n, options, quantum, params=None):
+    # Simulates replications first .. first + count - 1 with every algorithm, without any output.
+#
+# Replication r uses the workload generated from seed "<seed>:<r>", so results do
+# not depend on how replications are split between workers.
+#
+# Returns:
+#     Dictionary {algorithm: {metric: RunningStats}} over the replications
+    totals = {name: {metric: RunningStats() for metric in BATCH_METRICS} for name in ALGORITHMS}
+    for r in range(first, first + count):
+        processes = generate_workload(n, f"{seed}:{r}", **options)
+        for name in ALGORITHMS:
+            result = simulate_algorithm(name, processes, quantum, params=params)
+            metrics = StatsCalculator(processes, result).summarize()
+            for metric in BATCH_METRICS:
+                totals[name][metric].add(getattr(metrics, metric))
+    return totals
+
+def batch_main(argv):
+    # 'batch' subcommand: Monte Carlo comparison of all algorithms over generated workloads.
+    parser = argparse.ArgumentParser(prog="scheduler.py batch",
+                                     description="Simulate many generated workloads with every algorithm and aggregate the metrics")
+    parser.add_argument('--replications', type=int, default=1000, help="Number of generated workloads (default: 1000)")
+    parser.add_argument('--quantum', type=int, default=2, help="Time quantum for RR (default: 2)")
+    parser.add_argument('--switch-cost', type=int, default=0, help="Time the dispatcher spends on every context switch (default: 0)")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    add_generator_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.quantum < 1 or args.switch_cost < 0:
+        parser.error("--quantum must be positive and --switch-cost not negative")
+    
+    options = generator_options(args)
+    params = {name: {'switch_cost': args.switch_cost} for name in ALGORITHMS} if args.switch_cost else None
+    jobs = max(1, args.jobs)
+    # A few tasks per worker keeps the pool balanced without per-replication overhead
+    tasks = min(args.replications, jobs * 4)
+    bounds = [args.replications * k // tasks for k in range(tasks + 1)]
+    
+    totals = {name: {metric: RunningStats() for metric in BATCH_METRICS} for name in ALGORITHMS}
+    with process_pool(jobs) as pool:
+        futures = [pool.submit(batch_worker, bounds[k], bounds[k + 1] - bounds[k], args.seed, args.processes,
+                               options, args.quantum, params)
+                   for k in range(tasks)]
+        for future in futures:
+            for name, partial in future.result().items():
+                for metric, stats in partial.items():
+                    totals[name][metric].merge(stats)
+    
+    print(f"Monte Carlo comparison: {args.replications} workloads of {args.processes} processes "
+          f"(arrival={args.arrival}, burst={args.burst}, priority={args.priority}, seed={args.seed})")
+    print("Mean ± 95% confidence interval over replications\n")
+    print(f"{'Algorithm':<10} {'Avg Turnaround':<22} {'Avg Waiting':<22} {'Avg Response':<22} {'Context Switches':<22}")
+    for name in ALGORITHMS:
+        cells = [f"{totals[name][m].mean:.2f} ± {totals[name][m].confidence_interval():.2f}" for m in BATCH_METRICS]
+        print(f"{name:<10} " + " ".join(f"{cell:<22}" for cell in cells))
+
+# Subcommands dispatched before the main parser (which requires --input)
+SUBCOMMANDS = {
+    'convert': convert_main,
+    'generate': generate_main,
+    'batch': batch_main
+}
+
+def run_stream_command(args, params):
+    # --stream: runs the online simulation and maps its errors to exit statuses.
+    if args.algo not in ALGORITHMS:
+        print(f"Unknown algorithm: {args.algo}", file=sys.stderr)
+        sys.exit(1)
+    if args.algo == 'RR' and args.quantum is None:
+        print("Error: Quantum required for RR.", file=sys.stderr)
+        sys.exit(1)
+    out = open_output(args.output)
+    try:
+        run_stream(args.algo, args.input, args.quantum, out, args.format == 'ndjson', args.stream_every,
+                   args.include_log, not (args.no_process_table or args.quiet), args.strict, params)
+    except (OSError, ValueError) as e:
+        out.flush()
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        out.close()
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+        SUBCOMMANDS[sys.argv[1]](sys.argv[2:])
+        return
+    
     parser = argparse.ArgumentParser(description="CPU Process Scheduling Simulator")
-    parser.add_argument('--input', required=True, help="Path to process description file")
-    parser.add_argument('--algo', required=True, help="Algorithm to run: FCFS, SJF, SRTF, RR, PRIO_NP, PRIO_P, or ALL")
-    parser.add_argument('--quantum', type=int, help="Time quantum for RR")
-    parser.add_argument('--output', help="Optional output file to save logs")
+    parser.add_argument('--input', required=True, help="Path to process description file (text or binary workload; with --stream a text file, FIFO or - for stdin)")
+    parser.add_argument('--algo', help="Algorithm to run: FCFS, SJF, SRTF, RR, PRIO_NP, PRIO_P, MLFQ, CFS, or ALL")
+    parser.add_argument('--quantum', type=int, help="Time quantum for RR (also the MLFQ top-level quantum and the CFS minimum granularity)")
+    parser.add_argument('--output', help="Optional output file to save logs (with --format: the structured output, '-' for stdout)")
+    parser.add_argument('--format', choices=('text',) + tuple(REPORT_FORMATS), default='text',
+                        help="text (default) prints the full report; json, csv and ndjson write machine-readable metrics and per-process results instead, without Gantt chart or console log")
+    parser.add_argument('--quiet', action='store_true', help="Skip the Gantt chart, event log and per-process table; with --format, also silence status messages")
+    parser.add_argument('--include-log', action='store_true', help="With --format, also write the execution log blocks")
+    parser.add_argument('--strict', action='store_true', help="Fail on the first malformed input line instead of skipping it")
+    parser.add_argument('--no-process-table', action='store_true', help="Skip the per-process statistics table (summary and tail statistics only)")
+    parser.add_argument('--gantt-window', type=parse_window, help="Only draw the Gantt chart for this time range, as start:end")
+    parser.add_argument('--gantt-width', type=int, help="Gantt chart width in characters; longer timelines are bucketed")
+    parser.add_argument('--no-gantt', action='store_true', help="Headless mode: skip rendering the Gantt chart")
+    parser.add_argument('--event-log', help="Write the execution event log to this file instead of the console")
+    parser.add_argument('--no-event-log', action='store_true', help="Skip generating the execution event log")
+    parser.add_argument('--jobs', type=int, default=1, help="Worker processes for --algo ALL and --quantum-sweep (default: 1, run serially)")
+    parser.add_argument('--quantum-sweep', type=parse_sweep, help="Evaluate RR for every quantum in start:stop[:step] (stop included) instead of running --algo")
+    parser.add_argument('--sweep-csv', help="Also save the quantum sweep results to this CSV file")
+    parser.add_argument('--cores', type=int, default=1, help="Simulate this many CPU cores (default: 1)")
+    parser.add_argument('--placement', choices=PLACEMENTS, default='global',
+                        help="With --cores: one global ready queue (default) or one queue per core")
+    parser.add_argument('--migration-cost', type=int, default=0, help="With --cores: time lost when a process resumes on another core (default: 0)")
+    parser.add_argument('--no-steal', action='store_true', help="With --placement per-core: idle cores do not steal work from other queues")
+    parser.add_argument('--switch-cost', type=int, default=0, help="Time the dispatcher spends on every context switch, charged by all algorithms (default: 0)")
+    parser.add_argument('--mlfq-levels', type=int, default=3, help="MLFQ: number of queue levels (default: 3)")
+    parser.add_argument('--mlfq-quanta', type=parse_quanta, help="MLFQ: comma-separated quantum per level, top first (default: --quantum doubled per level)")
+    parser.add_argument('--mlfq-boost', type=int, help="MLFQ: move every process back to the top level this often (default: never)")
+    parser.add_argument('--cfs-latency', type=int, help="CFS: target latency, the period in which every ready process runs once (default: 8 * minimum granularity)")
+    parser.add_argument('--cfs-wakeup-granularity', type=int, help="CFS: how far ahead of an arrival the running process may be before it is preempted (default: minimum granularity)")
+    parser.add_argument('--stream', action='store_true',
+                        help="Simulate online: read arrivals one line at a time from --input ('-' for stdin, or a FIFO) in arrival order, reporting each completion as it becomes final")
+    parser.add_argument('--stream-every', type=int, default=1000, help="With --stream: report running metrics every this many completions (default: 1000, 0 = only at the end)")
+    parser.add_argument('--no-cache', action='store_true', help="Always re-run the simulation instead of reusing cached results")
+    parser.add_argument('--cache-dir', help="Result cache directory (default: $XDG_CACHE_HOME/cpu-scheduler or ~/.cache/cpu-scheduler)")
+    parser.add_argument('--cache-size', type=int, default=256, help="Result cache size limit in MiB; least recently used entries are evicted (default: 256)")
+    parser.add_argument('--checkpoint', metavar='DIR', help="Periodically save the state of each running simulation to DIR so an interrupted run can be resumed (single core only)")
+    parser.add_argument('--checkpoint-interval', type=float, default=60, help="With --checkpoint: seconds between snapshots (default: 60)")
+    parser.add_argument('--resume', action='store_true', help="With --checkpoint: continue from the snapshots in DIR left by an interrupted run of the same workload and settings")
+    parser.add_argument('--incremental', action='store_true', help="When the input file has grown by appended lines since an earlier --incremental run, continue that run's simulations from their last arrival instead of starting over (single core, uses the result cache)")
+    parser.add_argument('--profile', help="Write per-phase timings, allocations and engine counters as JSON to this file ('-' for stdout)")
+    parser.add_argument('--profile-no-memory', action='store_true', help="Profile without tracemalloc (less overhead, no byte counts)")
     
     args = parser.parse_args()
+    if args.algo is None and args.quantum_sweep is None:
+        parser.error("--algo is required unless --quantum-sweep is used")
+    structured = args.format != 'text'
+    if structured and args.quantum_sweep is not None:
+        parser.error("--format applies to --algo runs; use --sweep-csv for quantum sweeps")
+    if args.format == 'csv' and args.output in (None, '-'):
+        # The per-process and log tables go to files next to --output (see CsvReportWriter)
+        if args.include_log:
+            parser.error("--format csv writes the execution log next to the --output file; pass --output FILE")
+        if not args.no_process_table and not args.quiet:
+            print("Warning: --format csv on stdout has only the metrics table; pass --output FILE for the "
+                  "per-process table (or --no-process-table)", file=sys.stderr)
+    if args.quantum is not None and args.quantum < 1:
+        # RR divides by it, and MLFQ and CFS derive their quanta and granularity from it
+        parser.error("--quantum must be positive")
+    if args.cores < 1 or args.migration_cost < 0:
+        parser.error("--cores must be at least 1 and --migration-cost not negative")
+    smp = SMPOptions(args.cores, args.placement, args.migration_cost, not args.no_steal) if args.cores > 1 else None
+    if args.mlfq_levels < 1 or (args.mlfq_boost is not None and args.mlfq_boost < 1):
+        parser.error("--mlfq-levels and --mlfq-boost must be positive")
+    if (args.cfs_latency is not None and args.cfs_latency < 1) or (args.cfs_wakeup_granularity is not None and args.cfs_wakeup_granularity < 0):
+        parser.error("--cfs-latency must be positive and --cfs-wakeup-granularity not negative")
+    if args.switch_cost < 0:
+        parser.error("--switch-cost must not be negative")
+    params = {
+        'MLFQ': {'levels': args.mlfq_levels, 'quanta': args.mlfq_quanta, 'boost_period': args.mlfq_boost},
+        'CFS': {'target_latency': args.cfs_latency, 'wakeup_granularity': args.cfs_wakeup_granularity}
+    }
+    if args.switch_cost:
+        for name in ALGORITHMS:
+            params.setdefault(name, {})['switch_cost'] = args.switch_cost
+    if args.stream:
+        if args.algo in (None, 'ALL') or args.quantum_sweep is not None:
+            parser.error("--stream runs a single --algo")
+        if args.format not in ('text', 'ndjson') or smp is not None or args.profile:
+            parser.error("--stream supports --format text or ndjson on a single core, without --profile")
+        if args.stream_every < 0:
+            parser.error("--stream-every must not be negative")
+        run_stream_command(args, params)
+        return
+    if args.quiet and not structured:
+        args.no_gantt = args.no_event_log = args.no_process_table = True
+    if args.cache_size < 0:
+        parser.error("--cache-size must not be negative")
+    if args.resume and not args.checkpoint:
+        parser.error("--resume requires --checkpoint")
+    if args.checkpoint and (smp is not None or args.quantum_sweep is not None):
+        parser.error("--checkpoint applies to single-core --algo runs")
+    if args.checkpoint_interval <= 0:
+        parser.error("--checkpoint-interval must be positive")
+    if args.incremental and (args.no_cache or args.profile or smp is not None):
+        parser.error("--incremental needs the result cache (no --no-cache or --profile) and a single core")
+    # Profiles time the real work, so they bypass the cache
+    cache = None if args.no_cache or args.profile else ResultCache(args.cache_dir, args.cache_size << 20,
+                                                                   args.incremental)
     
-    # Redirect stdout if output file is specified
     original_stdout = sys.stdout
     tee = None
-    if args.output:
+    report_stream = None
+    if structured:
+        # Data goes through a buffered writer; console messages move to stderr (or nowhere)
+        report_stream = open_output(args.output)
+        sys.stdout = open(os.devnull, 'w') if args.quiet else sys.stderr
+    elif args.output:
+        # Redirect stdout if output file is specified
         tee = Tee(args.output)
         sys.stdout = tee
+    event_file = open(args.event_log, 'w') if args.event_log and not args.no_event_log else None
+    display = DisplayOptions.from_args(args, event_file)
+    profiler = PhaseProfiler(not args.profile_no_memory) if args.profile else None
     
     try:
-        processes = parse_input(args.input)
+        if profiler:
+            profiler.start()
+            with profiler.phase(None, 'load'):
+                processes = cache.load_workload(args.input, args.strict) if cache else load_workload(args.input, args.strict)
+        else:
+            processes = cache.load_workload(args.input, args.strict) if cache else load_workload(args.input, args.strict)
         if not processes:
             sys.exit(1)
+        checkpoints = None
+        if args.checkpoint:
+            # Snapshots are tied to the workload's contents, like cache entries
+            digest = cache.workload_digest if cache else workload_identity(args.input)
+            checkpoints = CheckpointDirectory(args.checkpoint, digest, args.checkpoint_interval, args.resume)
+        if smp is not None:
+            print(f"Simulating {smp.cores} cores ({smp.placement} ready queue"
+                  + (f", migration cost {smp.migration_cost}" if smp.migration_cost else "") + ")\n")
+        if args.switch_cost:
+            print(f"Context switch cost: {args.switch_cost}\n")
+            
+        if args.quantum_sweep is not None:
+            run_quantum_sweep(processes, args.input, args.quantum_sweep, args.jobs, args.sweep_csv, smp, params)
+            
+        elif args.algo != 'ALL' and args.algo not in ALGORITHMS:
+            print(f"Unknown algorithm: {args.algo}")
+            sys.exit(1)
             
-        if args.algo == 'ALL':
+        elif structured:
+            names = list(ALGORITHMS) if args.algo == 'ALL' else [args.algo]
+            q = (args.quantum if args.quantum else 2) if args.algo == 'ALL' else args.quantum
+            if 'RR' in names and q is None:
+                print("Error: Quantum required for RR.")
+                sys.exit(1)
+            writer = REPORT_FORMATS[args.format](report_stream, None if args.output in (None, '-') else args.output)
+            run_structured(names, processes, args.input, q, writer, args.jobs, profiler,
+                           not args.no_process_table, args.include_log, event_file, smp, params, cache,
+                           checkpoints)
+            
+        elif args.algo == 'ALL':
             results = {}
             print(f"Running ALL algorithms on {args.input}...\n")
+            q = args.quantum if args.quantum else 2
             
-            for name in ALGORITHMS.keys():
-                q = args.quantum if args.quantum else 2
-                metrics, _ = run_algorithm(name, processes, q)
-                if metrics:
-                    results[name] = metrics
-                print("-" * 50)
+            if args.jobs > 1:
+                results = run_all_parallel(processes, args.input, q, display, args.jobs, profiler, smp, params, cache,
+                                           checkpoints)
+            else:
+                for name in ALGORITHMS.keys():
+                    metrics, _ = run_algorithm(name, processes, q, display, profiler, smp, params, cache, checkpoints)
+                    if metrics:
+                        results[name] = metrics
+                    print("-" * 50)
                 
             print("\nAlgorithm Comparison Summary:")
             print(f"{'Algorithm':<10} {'Avg Turnaround':<15} {'Avg Waiting':<15} {'Avg Response':<15} {'Context Switches':<18}")
             for name, metrics in results.items():
-                ctx_switches = metrics.get('context_switches', 0)
-                print(f"{name:<10} {metrics['avg_turnaround']:<15.2f} {metrics['avg_waiting']:<15.2f} {metrics['avg_response']:<15.2f} {ctx_switches:<18}")
+                print(f"{name:<10} {metrics.avg_turnaround:<15.2f} {metrics.avg_waiting:<15.2f} {metrics.avg_response:<15.2f} {metrics.context_switches:<18}")
                 
             save_graphs(results)
             
-        elif args.algo in ALGORITHMS:
-            run_algorithm(args.algo, processes, args.quantum)
         else:
-            print(f"Unknown algorithm: {args.algo}")
-            sys.exit(1)
+            run_algorithm(args.algo, processes, args.quantum, display, profiler, smp, params, cache, checkpoints)
             
     finally:
+        if event_file:
+            event_file.close()
+            print(f"Execution event log written to {args.event_log}")
+        if profiler:
+            profiler.stop()
+            profiler.write_json(args.profile)
+            if args.profile != '-':
+                print(f"Profile written to {args.profile}")
+        if report_stream:
+            report_stream.close()
+            if sys.stdout is not sys.stderr:
+                sys.stdout.close()
+            sys.stdout = original_stdout
         if tee:
             sys.stdout = original_stdout
             tee.close()
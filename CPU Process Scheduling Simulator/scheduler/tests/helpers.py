@@ -0,0 +1,27 @@
+import itertools
+from utils.workload_generator import generate_workload
+
+# Shared fixtures of the test suite.
+
+# (arrival_rate, mean_burst) pairs: a light load, a saturated one, and bursts of
+# simultaneous arrivals that exercise the tie-breaking
+LOADS = ((0.05, 4), (0.3, 6), (2.0, 3))
+PRIORITIES = ('uniform', 'skewed', 'constant')
+
+def random_workloads(count, max_processes=40, seed=0):
+    # Yields count seeded random ProcessTables of 1..max_processes processes, cycling through LOADS and PRIORITIES.
+    shapes = itertools.cycle(itertools.product(LOADS, PRIORITIES))
+    for k in range(count):
+        (rate, burst), priority = next(shapes)
+        n = 1 + (seed + k * 7919) % max_processes
+        yield generate_workload(n, seed=seed + k, arrival_rate=rate, mean_burst=burst, priority=priority)
+
+def as_dicts(table):
+    # Process dictionaries of a ProcessTable, in row order.
+    return [{'pid': table.pids[i], 'arrival_time': table.arrival[i], 'burst_time': table.burst[i],
+             'priority': table.priority[i]} for i in range(len(table))]
+
+def schedule_of(table, result):
+    # Comparable form of a run: its execution log and every process's (start, completion) times.
+    return (list(result.execution_log),
+            {table.pids[i]: (result.start[i], result.completion[i]) for i in range(len(table))})
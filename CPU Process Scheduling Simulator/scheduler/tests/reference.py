@@ -0,0 +1,142 @@
+from collections import deque
+
+# Reference implementations of the original algorithms, kept as the regression baseline.
+#
+# These are the straightforward list-scanning (and, for the preemptive policies,
+# tick-by-tick) loops the event-driven engines replaced. They are far too slow for
+# real workloads but easy to check by eye, so the tests compare every engine
+# against them on small seeded workloads.
+#
+# One deliberate difference from the originals: a preemptive block is closed when
+# the CPU goes idle, instead of being stretched over the idle gap up to the next
+# dispatch (the engines fixed that along with the rewrite).
+#
+# Every function takes a list of process dictionaries ('pid', 'arrival_time',
+# 'burst_time', 'priority'), fills in 'start_time' and 'completion_time', and
+# returns the execution log as a list of (start_time, end_time, pid) tuples.
+
+def fcfs(processes):
+    # First-Come First-Served: run in (arrival_time, pid) order.
+    current_time = 0
+    execution_log = []
+    for p in sorted(processes, key=lambda x: (x['arrival_time'], x['pid'])):
+        current_time = max(current_time, p['arrival_time'])
+        p['start_time'] = current_time
+        current_time += p['burst_time']
+        p['completion_time'] = current_time
+        execution_log.append((p['start_time'], current_time, p['pid']))
+    return execution_log
+
+def non_preemptive(processes, key):
+    # Runs the available process with the smallest key(p) to completion, scanning every process per dispatch.
+    current_time = 0
+    execution_log = []
+    waiting = list(processes)
+    while waiting:
+        available = [p for p in waiting if p['arrival_time'] <= current_time]
+        if not available:
+            current_time = min(p['arrival_time'] for p in waiting)
+            continue
+        chosen = min(available, key=key)
+        waiting.remove(chosen)
+        chosen['start_time'] = current_time
+        current_time += chosen['burst_time']
+        chosen['completion_time'] = current_time
+        execution_log.append((chosen['start_time'], current_time, chosen['pid']))
+    return execution_log
+
+def preemptive(processes, key):
+    # Runs the available process with the smallest key(p) for one time unit at a time.
+    current_time = 0
+    completed = 0
+    execution_log = []
+    for p in processes:
+        p['remaining_time'] = p['burst_time']
+        p['start_time'] = None
+    last_pid = None  # Process of the open block (None = no block open)
+    start_of_block = 0
+
+    while completed < len(processes):
+        available = [p for p in processes if p['arrival_time'] <= current_time and p['remaining_time'] > 0]
+        if not available:
+            if last_pid is not None:
+                # The CPU goes idle: close the block at the last completion
+                execution_log.append((start_of_block, current_time, last_pid))
+                last_pid = None
+            current_time += 1
+            continue
+
+        chosen = min(available, key=key)
+        if chosen['start_time'] is None:
+            chosen['start_time'] = current_time
+        if chosen['pid'] != last_pid:
+            if last_pid is not None:
+                execution_log.append((start_of_block, current_time, last_pid))
+            start_of_block = current_time
+            last_pid = chosen['pid']
+
+        chosen['remaining_time'] -= 1
+        current_time += 1
+        if chosen['remaining_time'] == 0:
+            chosen['completion_time'] = current_time
+            completed += 1
+
+    if last_pid is not None:
+        execution_log.append((start_of_block, current_time, last_pid))
+    return execution_log
+
+def sjf(processes):
+    # Shortest Job First (non-preemptive); ties by arrival time, then PID.
+    return non_preemptive(processes, lambda p: (p['burst_time'], p['arrival_time'], p['pid']))
+
+def priority_np(processes):
+    # Priority scheduling (non-preemptive, lower value = higher priority); ties by arrival time, then PID.
+    return non_preemptive(processes, lambda p: (p['priority'], p['arrival_time'], p['pid']))
+
+def srtf(processes):
+    # Shortest Remaining Time First; ties by arrival time, then PID.
+    return preemptive(processes, lambda p: (p['remaining_time'], p['arrival_time'], p['pid']))
+
+def priority_p(processes):
+    # Priority scheduling (preemptive); ties by arrival time, then PID.
+    return preemptive(processes, lambda p: (p['priority'], p['arrival_time'], p['pid']))
+
+def rr(processes, quantum):
+    # Round Robin; processes arriving during a slice queue ahead of the preempted one.
+    processes = sorted(processes, key=lambda x: (x['arrival_time'], x['pid']))
+    current_time = 0
+    completed = 0
+    execution_log = []
+    queue = deque()
+    admitted = 0  # Processes moved into the queue so far, in arrival order
+    for p in processes:
+        p['remaining_time'] = p['burst_time']
+        p['start_time'] = None
+
+    def add_new_arrivals(time):
+        nonlocal admitted
+        while admitted < len(processes) and processes[admitted]['arrival_time'] <= time:
+            queue.append(processes[admitted])
+            admitted += 1
+
+    add_new_arrivals(current_time)
+    while completed < len(processes):
+        if not queue:
+            current_time = processes[admitted]['arrival_time']
+            add_new_arrivals(current_time)
+
+        p = queue.popleft()
+        if p['start_time'] is None:
+            p['start_time'] = current_time
+        exec_time = min(quantum, p['remaining_time'])
+        execution_log.append((current_time, current_time + exec_time, p['pid']))
+        current_time += exec_time
+        p['remaining_time'] -= exec_time
+
+        add_new_arrivals(current_time)
+        if p['remaining_time'] > 0:
+            queue.append(p)
+        else:
+            p['completion_time'] = current_time
+            completed += 1
+    return execution_log
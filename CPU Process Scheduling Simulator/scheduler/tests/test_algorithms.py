@@ -0,0 +1,124 @@
+import heapq
+import math
+import os
+import unittest
+from unittest import mock
+from algorithms import fcfs, sjf, srtf, rr, priority_np, priority_p
+from utils.process_table import ProcessTable
+from utils.workload_generator import generate_workload
+from tests import reference
+from tests.helpers import random_workloads, as_dicts, schedule_of
+
+# (algorithm module, reference function, extra arguments)
+CASES = (
+    ('FCFS', fcfs, reference.fcfs, ()),
+    ('SJF', sjf, reference.sjf, ()),
+    ('SRTF', srtf, reference.srtf, ()),
+    ('PRIO_NP', priority_np, reference.priority_np, ()),
+    ('PRIO_P', priority_p, reference.priority_p, ()),
+    ('RR q=1', rr, reference.rr, (1,)),
+    ('RR q=3', rr, reference.rr, (3,)),
+    ('RR q=8', rr, reference.rr, (8,))
+)
+
+class BaselineEquivalenceTest(unittest.TestCase):
+
+    # The event-driven engines must schedule exactly like the original loops (tests/reference.py).
+
+    def test_matches_reference(self):
+        for table in random_workloads(300):
+            for name, module, schedule, args in CASES:
+                processes = as_dicts(table)
+                log = schedule(processes, *args)
+                expected = (log, {p['pid']: (p['start_time'], p['completion_time']) for p in processes})
+                with self.subTest(algorithm=name, processes=len(table)):
+                    self.assertEqual(schedule_of(table, module.simulate(table, *args)), expected)
+
+    def test_rr_fast_forward(self):
+        # Few long processes: most of the run is skipped as whole rounds
+        for seed in range(20):
+            table = generate_workload(1 + seed % 5, seed=seed, arrival_rate=0.02, mean_burst=300)
+            processes = as_dicts(table)
+            log = reference.rr(processes, 2)
+            with self.subTest(seed=seed):
+                self.assertEqual(schedule_of(table, rr.simulate(table, 2))[0], log)
+
+    def test_dictionary_entry_points(self):
+        # schedule() still writes the times into the dictionaries it is given
+        table = next(random_workloads(1, seed=3))
+        for name, module, schedule, args in CASES:
+            expected, processes = as_dicts(table), as_dicts(table)
+            with self.subTest(algorithm=name):
+                self.assertEqual(module.schedule(processes, *args), schedule(expected, *args))
+                self.assertEqual([(p['start_time'], p['completion_time']) for p in processes],
+                                 [(p['start_time'], p['completion_time']) for p in expected])
+
+class SwitchPreemptionTest(unittest.TestCase):
+
+    # A process arriving during a context switch must be able to preempt the process switched in.
+
+    def test_arrival_during_switch(self):
+        # P2 arrives while the dispatcher switches from P0 to P1, and outranks P1 under both policies
+        pids, arrival, burst, priority = ['P0', 'P1', 'P2'], [0, 0, 2], [1, 20, 3], [1, 5, 0]
+        expected = [(0, 1, 'P0'), (5, 8, 'P2'), (10, 30, 'P1')]
+        for name, module in (('SRTF', srtf), ('PRIO_P', priority_p)):
+            with self.subTest(algorithm=name):
+                result = module.simulate(ProcessTable(pids, arrival, burst, priority), switch_cost=2)
+                self.assertEqual(result.execution_log, expected)
+                self.assertEqual(result.switch_logs, [[(1, 3), (3, 5), (8, 10)]])
+                self.assertEqual(list(result.start), [0, 10, 5])
+
+    def test_unrelated_arrival_changes_nothing(self):
+        # A later, low-priority P3 must not decide when P2 gets the CPU
+        table = ProcessTable(['P0', 'P1', 'P2', 'P3'], [0, 0, 2, 15], [1, 20, 3, 1], [1, 5, 0, 9])
+        self.assertEqual(priority_p.simulate(table, switch_cost=2).execution_log,
+                         [(0, 1, 'P0'), (5, 8, 'P2'), (10, 30, 'P1'), (32, 33, 'P3')])
+
+class CountedEntry(tuple):
+
+    # Ready-queue heap entry that counts the comparisons made on it.
+
+    comparisons = 0
+
+    def __lt__(self, other):
+        CountedEntry.comparisons += 1
+        return tuple.__lt__(self, other)
+
+class CountingHeapq:
+
+    # Stand-in for an algorithm module's heapq whose entries count their comparisons.
+
+    heappop = staticmethod(heapq.heappop)
+
+    @staticmethod
+    def heappush(heap, item):
+        heapq.heappush(heap, CountedEntry(item))
+
+class ScalingTest(unittest.TestCase):
+
+    # Every ready-queue operation must cost O(log n) comparisons and the loop O(1) steps per
+    # process, counted rather than timed; benchmarks/bench.py times the same engines up to 10^6.
+
+    def check_scaling(self, sizes, cases):
+        for n in sizes:
+            table = generate_workload(n, seed=1, arrival_rate=1.0)
+            for name, module, _, args in cases:
+                CountedEntry.comparisons = 0
+                with mock.patch.object(module, 'heapq', CountingHeapq):
+                    counters = module.simulate(table, *args).counters
+                operations = counters['queue_pushes'] + counters['queue_pops']
+                with self.subTest(algorithm=name, processes=n):
+                    self.assertGreater(CountedEntry.comparisons, 0)
+                    self.assertLess(CountedEntry.comparisons, operations * math.log2(n))
+                    self.assertLess(counters['steps'], 2 * counters['queue_pushes'])
+
+    def test_ready_queue_scaling(self):
+        self.check_scaling((1000, 10000, 100000), CASES[1:5])
+
+    @unittest.skipUnless(os.environ.get('SCHEDULER_LARGE_TESTS'), "set SCHEDULER_LARGE_TESTS=1 to run (about 30 s)")
+    def test_ready_queue_scaling_to_a_million(self):
+        # Counting every comparison slows the heaps down about fourfold, so 10^6 runs only on request
+        self.check_scaling((1000000,), [case for case in CASES if case[0] in ('SJF', 'PRIO_NP')])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+from algorithms import cfs
+from utils.process_table import ProcessTable
+
+class CFSTest(unittest.TestCase):
+
+    # Hand-checked CFS decisions on two processes.
+
+    def setUp(self):
+        # Nice 0 (weight 1024) against nice 5 (weight 335), both ready from the start
+        self.table = ProcessTable(['A', 'B'], [0, 0], [200, 200], [0, 5])
+
+    def test_cpu_share_follows_weights(self):
+        cpu = {'A': 0, 'B': 0}
+        for start, end, pid in cfs.simulate(self.table, 1).execution_log:
+            if start < 130:
+                cpu[pid] += min(end, 130) - start
+        self.assertEqual(cpu, {'A': 98, 'B': 32})
+        self.assertAlmostEqual(cpu['A'] / cpu['B'], 1024 / 335, delta=0.01)
+
+    def test_slice_lengths(self):
+        # A gets target_latency * 1024 / 1359; B's share is stretched to min_granularity
+        self.assertEqual(cfs.simulate(self.table, 1, 8).execution_log[:2], [(0, 6, 'A'), (6, 7, 'B')])
+        self.assertEqual(cfs.simulate(self.table, 2, 8).execution_log[:2], [(0, 6, 'A'), (6, 8, 'B')])
+        self.assertEqual(cfs.simulate(self.table, 1, 16).execution_log[:2], [(0, 12, 'A'), (12, 15, 'B')])
+
+    def test_wakeup_preemption(self):
+        # B arrives 3 time units behind A: it preempts only if that exceeds wakeup_granularity
+        table = ProcessTable(['A', 'B'], [0, 3], [20, 5], [0, 0])
+        self.assertEqual(cfs.simulate(table, 1, 16, 2).execution_log,
+                         [(0, 3, 'A'), (3, 8, 'B'), (8, 24, 'A'), (24, 25, 'A')])
+        for granularity in (3, 4):
+            with self.subTest(wakeup_granularity=granularity):
+                self.assertEqual(cfs.simulate(table, 1, 16, granularity).execution_log,
+                                 [(0, 16, 'A'), (16, 21, 'B'), (21, 25, 'A')])
+
+if __name__ == '__main__':
+    unittest.main()
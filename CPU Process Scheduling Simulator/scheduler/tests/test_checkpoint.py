@@ -0,0 +1,55 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+from scheduler import ALGORITHMS, algorithm_kwargs, simulate_algorithm
+from utils.checkpoint import Checkpoint
+from utils.workload_generator import generate_workload
+from tests.helpers import schedule_of
+
+QUANTUM = 2
+
+class Interrupted(Exception):
+    pass
+
+class InterruptingCheckpoint(Checkpoint):
+
+    # Checkpoint that saves at every opportunity and then stops the run, like a kill right after a save.
+
+    def save(self, engine):
+        super().save(engine)
+        raise Interrupted
+
+class CheckpointTest(unittest.TestCase):
+
+    # A run resumed from its snapshots, however often it is interrupted, must match an uninterrupted run.
+
+    @mock.patch('algorithms.engine.CHECKPOINT_STEPS', 97)
+    def test_resume_matches_uninterrupted_run(self):
+        table = generate_workload(1000, seed=7, arrival_rate=0.3)
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ALGORITHMS:
+                for switch_cost in (0, 2):
+                    params = {name: {'switch_cost': switch_cost}}
+                    expected = simulate_algorithm(name, table, QUANTUM, params=params)
+                    path = os.path.join(directory, f"{name}-{switch_cost}.ckpt")
+                    interruptions = 0
+                    with contextlib.redirect_stderr(io.StringIO()):
+                        while True:
+                            checkpoint = InterruptingCheckpoint(path, name, interval=0, resume=True)
+                            try:
+                                result = ALGORITHMS[name].simulate(table, checkpoint=checkpoint,
+                                                                   **algorithm_kwargs(name, QUANTUM, params))
+                                break
+                            except Interrupted:
+                                interruptions += 1
+                    with self.subTest(algorithm=name, switch_cost=switch_cost):
+                        self.assertGreater(interruptions, 5)
+                        self.assertEqual(schedule_of(table, result), schedule_of(table, expected))
+                        self.assertEqual(result.switch_logs, expected.switch_logs)
+                        self.assertFalse(os.path.exists(path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class QuantumValidationTest(unittest.TestCase):
+
+    # A quantum below 1 is a usage error, for every command that takes one.
+
+    def run_cli(self, *args):
+        return subprocess.run([sys.executable, 'scheduler.py', *args], cwd=ROOT, capture_output=True, text=True)
+
+    def test_rejects_non_positive_quantum(self):
+        for algo in ('RR', 'MLFQ', 'CFS', 'ALL'):
+            for quantum in ('0', '-1'):
+                with self.subTest(algo=algo, quantum=quantum):
+                    run = self.run_cli('--input', 'processes.txt', '--algo', algo, '--quantum', quantum, '--no-cache')
+                    self.assertEqual(run.returncode, 2)
+                    self.assertIn("--quantum must be positive", run.stderr)
+                    self.assertNotIn("Traceback", run.stderr)
+
+    def test_rejects_non_positive_stream_quantum(self):
+        run = self.run_cli('--input', 'processes.txt', '--algo', 'RR', '--quantum', '0', '--stream')
+        self.assertEqual(run.returncode, 2)
+        self.assertIn("--quantum must be positive", run.stderr)
+
+    def test_rejects_non_positive_sweep(self):
+        run = self.run_cli('--input', 'processes.txt', '--quantum-sweep', '0:4')
+        self.assertEqual(run.returncode, 2)
+        self.assertIn("expected 1 <= start <= stop", run.stderr)
+
+    def test_rejects_non_positive_batch_quantum(self):
+        run = self.run_cli('batch', '--quantum', '0', '--replications', '1')
+        self.assertEqual(run.returncode, 2)
+        self.assertIn("--quantum must be positive", run.stderr)
+
+    def test_accepts_quantum_one(self):
+        run = self.run_cli('--input', 'processes.txt', '--algo', 'RR', '--quantum', '1', '--no-cache', '--no-gantt',
+                           '--no-event-log')
+        self.assertEqual(run.returncode, 0, run.stderr)
+        self.assertIn("--- Running RR ---", run.stdout)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import contextlib
+import io
+import statistics
+import unittest
+from scheduler import ALGORITHMS, BATCH_METRICS, batch_main, batch_worker, simulate_algorithm
+from utils.statistics import StatsCalculator
+from utils.workload_generator import (ARRIVAL_DISTRIBUTIONS, BURST_DISTRIBUTIONS, PRIORITY_DISTRIBUTIONS,
+                                      generate_workload)
+
+def columns(table):
+    return list(table.pids), list(table.arrival), list(table.burst), list(table.priority)
+
+class GeneratorTest(unittest.TestCase):
+
+    # A seed fixes the workload, for every distribution.
+
+    def test_same_seed_same_workload(self):
+        for arrival in ARRIVAL_DISTRIBUTIONS:
+            for burst in BURST_DISTRIBUTIONS:
+                for priority in PRIORITY_DISTRIBUTIONS:
+                    options = {'arrival': arrival, 'burst': burst, 'priority': priority}
+                    table = generate_workload(200, seed=42, **options)
+                    with self.subTest(**options):
+                        self.assertEqual(columns(generate_workload(200, seed=42, **options)), columns(table))
+                        self.assertNotEqual(columns(generate_workload(200, seed=43, **options)), columns(table))
+                        self.assertEqual(list(table.arrival), sorted(table.arrival))
+                        self.assertGreaterEqual(min(table.burst), 1)
+                        self.assertTrue(all(0 <= p < 5 for p in table.priority))
+
+    def test_string_seeds(self):
+        # Batch replications seed with "<seed>:<replication>"
+        self.assertEqual(columns(generate_workload(50, '7:3')), columns(generate_workload(50, '7:3')))
+        self.assertNotEqual(columns(generate_workload(50, '7:3')), columns(generate_workload(50, '7:4')))
+
+    def test_constant_priority(self):
+        self.assertEqual(set(generate_workload(100, seed=1, priority='constant').priority), {0})
+
+class BatchTest(unittest.TestCase):
+
+    # Batch statistics aggregate the per-replication metrics, however replications are split.
+
+    OPTIONS = {'arrival_rate': 0.2, 'mean_burst': 4}
+
+    def test_aggregates_replications(self):
+        totals = batch_worker(0, 6, 5, 30, self.OPTIONS, 2)
+        values = {name: {metric: [] for metric in BATCH_METRICS} for name in ALGORITHMS}
+        for r in range(6):
+            processes = generate_workload(30, f"5:{r}", **self.OPTIONS)
+            for name in ALGORITHMS:
+                metrics = StatsCalculator(processes, simulate_algorithm(name, processes, 2)).summarize()
+                for metric in BATCH_METRICS:
+                    values[name][metric].append(getattr(metrics, metric))
+        for name in ALGORITHMS:
+            for metric in BATCH_METRICS:
+                stats, expected = totals[name][metric], values[name][metric]
+                with self.subTest(algorithm=name, metric=metric):
+                    self.assertEqual(stats.count, 6)
+                    self.assertAlmostEqual(stats.mean, statistics.mean(expected))
+                    self.assertAlmostEqual(stats.std, statistics.stdev(expected))
+                    self.assertEqual(stats.max, max(expected))
+
+    def test_split_matches_single_worker(self):
+        whole = batch_worker(0, 6, 5, 30, self.OPTIONS, 2)
+        merged = batch_worker(0, 2, 5, 30, self.OPTIONS, 2)
+        for name, partial in batch_worker(2, 4, 5, 30, self.OPTIONS, 2).items():
+            for metric, stats in partial.items():
+                merged[name][metric].merge(stats)
+        for name in ALGORITHMS:
+            for metric in BATCH_METRICS:
+                with self.subTest(algorithm=name, metric=metric):
+                    self.assertAlmostEqual(merged[name][metric].mean, whole[name][metric].mean)
+                    self.assertAlmostEqual(merged[name][metric].std, whole[name][metric].std)
+
+    def test_report(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            batch_main(['--replications', '4', '--processes', '20', '--seed', '3', '--jobs', '2'])
+        totals = batch_worker(0, 4, 3, 20, {'arrival': 'poisson', 'arrival_rate': 0.15, 'burst': 'exponential',
+                                            'mean_burst': 5, 'pareto_alpha': 1.5, 'priority': 'uniform',
+                                            'priority_levels': 5}, 2)
+        lines = output.getvalue().splitlines()
+        self.assertIn("4 workloads of 20 processes", lines[0])
+        for name in ALGORITHMS:
+            stats = totals[name]['avg_turnaround']
+            with self.subTest(algorithm=name):
+                self.assertTrue(any(line.startswith(f"{name:<10} {stats.mean:.2f} ± {stats.confidence_interval():.2f}")
+                                    for line in lines))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs scheduler.py with the given arguments and reports, on an 'imports:' stderr line, the
+# algorithm modules that were loaded and every attempt to import a plotting package
+# (recorded by a finder, so the check holds whether or not matplotlib is installed).
+PROBE = """
+import runpy, sys
+
+class Recorder:
+    attempted = set()
+
+    def find_spec(self, name, path=None, target=None):
+        if name.split('.')[0] in ('matplotlib', 'numpy', 'concurrent', 'multiprocessing'):
+            self.attempted.add(name.split('.')[0])
+        return None
+
+sys.meta_path.insert(0, Recorder())
+sys.argv = ['scheduler.py'] + sys.argv[1:]
+try:
+    runpy.run_path('scheduler.py', run_name='__main__')
+finally:
+    loaded = sorted(m for m in sys.modules if m.startswith('algorithms.'))
+    sys.stderr.write('\\nimports:' + ' '.join(loaded) + '|' + ' '.join(sorted(Recorder.attempted)) + '\\n')
+"""
+
+class LazyImportTest(unittest.TestCase):
+
+    # Startup only loads what the command needs: no plotting packages, no process pools,
+    # and only the algorithm modules that actually run.
+
+    def imports(self, *args):
+        run = subprocess.run([sys.executable, '-c', PROBE, *args], cwd=ROOT, capture_output=True, text=True)
+        report = next(line for line in run.stderr.splitlines() if line.startswith('imports:'))
+        loaded, attempted = report[len('imports:'):].split('|')
+        return set(loaded.split()), set(attempted.split())
+
+    def test_help(self):
+        loaded, attempted = self.imports('--help')
+        self.assertEqual(attempted, set())
+        self.assertEqual(loaded, {'algorithms.smp'})
+
+    def test_single_algorithm(self):
+        loaded, attempted = self.imports('--input', 'processes.txt', '--algo', 'RR', '--quantum', '2',
+                                         '--no-cache', '--no-gantt', '--no-event-log')
+        self.assertEqual(attempted, set())
+        self.assertEqual(loaded, {'algorithms.smp', 'algorithms.engine', 'algorithms.rr'})
+
+    def test_structured_single_algorithm(self):
+        loaded, attempted = self.imports('--input', 'processes.txt', '--algo', 'PRIO_P', '--format', 'json',
+                                         '--no-cache', '--output', os.devnull)
+        self.assertEqual(attempted, set())
+        self.assertEqual(loaded, {'algorithms.smp', 'algorithms.engine', 'algorithms.priority_p'})
+
+if __name__ == '__main__':
+    unittest.main()
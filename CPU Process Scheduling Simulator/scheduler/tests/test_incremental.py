@@ -0,0 +1,54 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from scheduler import ALGORITHMS, simulate_algorithm, store_result
+from utils.process_table import ProcessTable
+from utils.result_cache import ResultCache
+from utils.statistics import StatsCalculator
+from utils.workload_generator import generate_workload, write_text_workload
+from tests.helpers import schedule_of
+
+QUANTUM = 2
+
+class IncrementalTest(unittest.TestCase):
+
+    # A run continued over a workload extended by appending lines must match a fresh run.
+
+    def test_extension_matches_fresh_run(self):
+        full = generate_workload(2000, seed=11, arrival_rate=0.3)
+        rows = next(k for k in range(1200, len(full)) if full.arrival[k] > full.arrival[k - 1])
+        prefix = ProcessTable(full.pids[:rows], full.arrival[:rows], full.burst[:rows], full.priority[:rows],
+                              presorted=True)
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ALGORITHMS:
+                for switch_cost in (0, 2):
+                    params = {name: {'switch_cost': switch_cost}}
+                    cache_dir = os.path.join(directory, f"cache-{name}-{switch_cost}")
+                    path = os.path.join(directory, f"{name}-{switch_cost}.txt")
+                    write_text_workload(prefix, path)
+
+                    cache = ResultCache(cache_dir, incremental=True)
+                    table = cache.load_workload(path)
+                    result = simulate_algorithm(name, table, QUANTUM, params=params, cache=cache)
+                    store_result(cache, name, table, QUANTUM, None, params, result,
+                                 StatsCalculator(table, result).summarize())
+
+                    with open(path, 'a') as f:
+                        for i in range(rows, len(full)):
+                            f.write(f"{full.pids[i]} {full.arrival[i]} {full.burst[i]} {full.priority[i]}\n")
+                    cache = ResultCache(cache_dir, incremental=True)
+                    table = cache.load_workload(path)
+                    messages = io.StringIO()
+                    with contextlib.redirect_stderr(messages):
+                        result = simulate_algorithm(name, table, QUANTUM, params=params, cache=cache)
+                    expected = simulate_algorithm(name, table, QUANTUM, params=params)
+                    with self.subTest(algorithm=name, switch_cost=switch_cost):
+                        self.assertIn("continuing from the run over the first", messages.getvalue())
+                        self.assertEqual(schedule_of(table, result), schedule_of(table, expected))
+                        self.assertEqual(result.switch_logs, expected.switch_logs)
+                        self.assertEqual(result.counters, expected.counters)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from algorithms import fcfs, mlfq
+from utils.process_table import ProcessTable
+from utils.statistics import StatsCalculator
+
+class MLFQTest(unittest.TestCase):
+
+    # Hand-computed schedules with quantum 1 over 3 levels, i.e. quanta 1, 2 and 4.
+
+    def test_demotion(self):
+        # A sinks one level per used-up quantum; B arrives at level 0 and runs ahead of it
+        table = ProcessTable(['A', 'B'], [0, 1], [5, 1], [0, 0])
+        result = mlfq.simulate(table, 1, 3)
+        self.assertEqual(result.execution_log, [(0, 1, 'A'), (1, 2, 'B'), (2, 4, 'A'), (4, 6, 'A')])
+        self.assertEqual(result.level_time, [2, 2, 2])
+        self.assertEqual(result.counters['demotions'], 2)
+
+    def test_preempted_slice_keeps_level(self):
+        # B preempts A one unit into its level-1 quantum; A is not demoted for that slice
+        table = ProcessTable(['A', 'B'], [0, 2], [6, 1], [0, 0])
+        result = mlfq.simulate(table, 1, 3)
+        self.assertEqual(result.execution_log,
+                         [(0, 1, 'A'), (1, 2, 'A'), (2, 3, 'B'), (3, 5, 'A'), (5, 7, 'A')])
+        self.assertEqual(result.level_time, [2, 3, 2])
+        self.assertEqual(result.counters['demotions'], 2)
+
+    def test_boost(self):
+        # Without boosts A stays on the bottom level; every 5 time units a boost sends it back to the top
+        table = ProcessTable(['A'], [0], [12], [0])
+        result = mlfq.simulate(table, 1, 3)
+        self.assertEqual(result.execution_log, [(0, 1, 'A'), (1, 3, 'A'), (3, 7, 'A'), (7, 11, 'A'), (11, 12, 'A')])
+        self.assertEqual(result.level_time, [1, 2, 9])
+
+        result = mlfq.simulate(table, 1, 3, boost_period=5)
+        self.assertEqual(result.execution_log, [(0, 1, 'A'), (1, 3, 'A'), (3, 7, 'A'), (7, 8, 'A'), (8, 10, 'A'),
+                                                (10, 11, 'A'), (11, 12, 'A')])
+        self.assertEqual(result.level_time, [3, 5, 4])
+        self.assertEqual((result.counters['boosts'], result.counters['demotions']), (2, 4))
+
+    def test_boost_keeps_queue_order(self):
+        # A boost sets the level deques aside: the queued processes reach the top level in
+        # level order, ahead of the processes queued after the boost
+        engine = mlfq.MLFQEngine(ProcessTable(list('ABCDE'), [0] * 5, [9] * 5, [0] * 5), 1, 3, boost_period=10)
+        for i, level in zip(range(4), (2, 0, 1, 2)):
+            engine.level[i] = level
+            engine.push(i)
+        engine.clock = 10
+        engine.push(4)
+        self.assertEqual((engine.boosts, len(engine.boosted)), (1, 3))
+        self.assertEqual([engine.table.pids[engine.pop()] for _ in range(5)], ['B', 'C', 'A', 'D', 'E'])
+        self.assertFalse(engine.has_ready())
+
+    def test_level_residency(self):
+        table = ProcessTable(['A'], [0], [12], [0])
+        metrics = StatsCalculator(table, mlfq.simulate(table, 1, 3, boost_period=5)).summarize()
+        self.assertEqual(metrics.level_residency, [3 / 12, 5 / 12, 4 / 12])
+        self.assertIsNone(StatsCalculator(table, fcfs.simulate(table)).summarize().level_residency)
+
+if __name__ == '__main__':
+    unittest.main()
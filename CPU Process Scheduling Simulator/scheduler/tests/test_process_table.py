@@ -0,0 +1,47 @@
+import unittest
+from utils.process_table import ProcessTable, StreamTable
+
+class ProcessTableTest(unittest.TestCase):
+
+    # Rows are sorted by (arrival_time, pid), so the row index is the engines' tie-breaker.
+
+    def test_rows_sorted_by_arrival_then_pid(self):
+        table = ProcessTable(['P3', 'P1', 'P2', 'P0'], [4, 2, 2, 0], [1, 2, 3, 4], [0, 1, 2, 3])
+        self.assertEqual(table.pids, ['P0', 'P1', 'P2', 'P3'])
+        self.assertEqual(list(table.arrival), [0, 2, 2, 4])
+        self.assertEqual(list(table.burst), [4, 2, 3, 1])
+        self.assertEqual(list(table.priority), [3, 1, 2, 0])
+        self.assertEqual(len(table), 4)
+
+    def test_presorted_keeps_order(self):
+        table = ProcessTable(['B', 'A'], [0, 0], [1, 2], [0, 0], presorted=True)
+        self.assertEqual(table.pids, ['B', 'A'])
+
+    def test_from_dicts(self):
+        table = ProcessTable.from_dicts([
+            {'pid': 'B', 'arrival_time': 3, 'burst_time': 5, 'priority': 1},
+            {'pid': 'A', 'arrival_time': 1, 'burst_time': 2, 'priority': 0}
+        ])
+        self.assertEqual((table.pids, list(table.arrival), list(table.burst)), (['A', 'B'], [1, 3], [2, 5]))
+
+    def test_from_columns_does_not_copy(self):
+        arrival = memoryview(bytearray(16)).cast('q')
+        table = ProcessTable.from_columns(['A', 'B'], arrival, arrival, arrival)
+        arrival[1] = 7
+        self.assertIs(table.arrival, arrival)
+        self.assertEqual(table.arrival[1], 7)
+
+class StreamTableTest(unittest.TestCase):
+
+    def test_retired_rows_keep_live_indices(self):
+        table = StreamTable()
+        rows = [table.append(pid, t, 3, 0) for t, pid in enumerate(('A', 'B', 'C'))]
+        self.assertEqual(rows, [0, 1, 2])
+        table.retire(1)
+        self.assertEqual((len(table), table.live()), (3, 2))
+        self.assertEqual((table.pids[2], table.arrival[2]), ('C', 2))
+        self.assertNotIn(1, table.burst)
+        self.assertEqual(table.append('D', 5, 1, 0), 3)
+
+if __name__ == '__main__':
+    unittest.main()
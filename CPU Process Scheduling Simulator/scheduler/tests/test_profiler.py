@@ -0,0 +1,88 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from algorithms import rr
+from scheduler import ALGORITHMS
+from utils.parser import load_workload
+from utils.profiler import PhaseProfiler
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class PhaseProfilerTest(unittest.TestCase):
+
+    # Records reach the hooks as they are made and are grouped per algorithm in the profile.
+
+    def test_records_grouped_by_algorithm(self):
+        profiler = PhaseProfiler(trace_memory=False)
+        seen = []
+        profiler.add_hook(seen.append)
+        with profiler.phase(None, 'load'):
+            pass
+        with profiler.phase('RR', 'schedule'):
+            pass
+        profiler.record_counters('RR', {'steps': 3})
+        profiler.record_counters('FCFS', None)
+        self.assertEqual(seen, profiler.records)
+        profile = profiler.to_dict()
+        self.assertEqual(set(profile['global']), {'load'})
+        self.assertEqual(set(profile['algorithms']), {'RR'})
+        self.assertEqual(profile['algorithms']['RR']['counters'], {'steps': 3})
+        schedule = profile['algorithms']['RR']['phases']['schedule']
+        self.assertEqual(set(schedule), {'wall_seconds', 'cpu_seconds', 'allocated_blocks'})
+
+class ProfileCommandTest(unittest.TestCase):
+
+    # --profile writes every phase and the engine counters of each run.
+
+    def profile(self, *args):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'profile.json')
+            run = subprocess.run([sys.executable, 'scheduler.py', '--input', 'processes.txt', '--no-gantt',
+                                  '--no-event-log', '--profile', path, *args],
+                                 cwd=ROOT, capture_output=True, text=True)
+            self.assertEqual(run.returncode, 0, run.stderr)
+            self.assertIn(f"Profile written to {path}", run.stdout + run.stderr)
+            with open(path) as f:
+                return json.load(f)
+
+    def test_single_run(self):
+        profile = self.profile('--algo', 'RR', '--quantum', '2')
+        self.assertTrue(profile['trace_memory'])
+        self.assertEqual(set(profile['global']), {'load'})
+        self.assertEqual(set(profile['algorithms']), {'RR'})
+        entry = profile['algorithms']['RR']
+        self.assertEqual(set(entry['phases']), {'schedule', 'stats'})
+        for phase in entry['phases'].values():
+            self.assertGreaterEqual(phase['wall_seconds'], 0)
+            self.assertGreaterEqual(phase['peak_bytes'], 0)
+            self.assertIn('allocated_bytes', phase)
+        expected = rr.simulate(load_workload(os.path.join(ROOT, 'processes.txt')), 2).counters
+        self.assertEqual(entry['counters'], expected)
+        self.assertEqual(entry['counters']['dispatches'], entry['counters']['queue_pops'])
+
+    def test_without_memory_tracing(self):
+        profile = self.profile('--algo', 'FCFS', '--profile-no-memory')
+        self.assertFalse(profile['trace_memory'])
+        for phase in profile['algorithms']['FCFS']['phases'].values():
+            self.assertNotIn('allocated_bytes', phase)
+            self.assertNotIn('peak_bytes', phase)
+
+    def test_structured_output(self):
+        profile = self.profile('--algo', 'SRTF', '--format', 'json', '--output', os.devnull)
+        self.assertEqual(set(profile['algorithms']['SRTF']['phases']), {'schedule', 'stats', 'write'})
+
+    def test_parallel_runs_keep_counters(self):
+        # Schedules run in the workers, the counters still reach the profile
+        profile = self.profile('--algo', 'ALL', '--jobs', '2', '--format', 'json', '--output', os.devnull,
+                               '--profile-no-memory')
+        self.assertEqual(set(profile['algorithms']), set(ALGORITHMS))
+        for name, entry in profile['algorithms'].items():
+            with self.subTest(algorithm=name):
+                self.assertIn('stats', entry['phases'])
+                self.assertGreater(entry['counters']['dispatches'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import csv
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from algorithms import fcfs, mlfq
+from algorithms.smp import SMPOptions
+from utils.report import CsvReportWriter
+from utils.statistics import StatsCalculator
+from utils.workload_generator import generate_workload
+
+class CsvReportTest(unittest.TestCase):
+
+    # Per-core and per-level metrics appear only in their expanded columns.
+
+    def test_summary_columns(self):
+        table = generate_workload(30, seed=2)
+        stream = io.StringIO()
+        writer = CsvReportWriter(stream)
+        writer.begin({})
+        for name, result in (('FCFS', fcfs.simulate(table)), ('MLFQ', mlfq.simulate(table)),
+                             ('FCFS x2', fcfs.simulate(table, smp=SMPOptions(2)))):
+            writer.write_algorithm(name, StatsCalculator(table, result).summarize())
+        writer.end()
+        rows = list(csv.reader(io.StringIO(stream.getvalue())))
+        header = rows[0]
+        self.assertNotIn('core_utilization', header)
+        self.assertNotIn('level_residency', header)
+        self.assertIn('core_utilization_1', header)
+        self.assertIn('level_residency_2', header)
+        self.assertEqual([len(row) for row in rows], [len(header)] * 4)
+
+class CsvStdoutTest(unittest.TestCase):
+
+    # On stdout CSV holds only the summary: tables that need sibling files are refused or reported.
+
+    def run_cli(self, *args):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return subprocess.run([sys.executable, 'scheduler.py', '--input', 'processes.txt', '--algo', 'FCFS',
+                               '--format', 'csv', '--no-cache', *args],
+                              cwd=root, capture_output=True, text=True)
+
+    def test_include_log_needs_output(self):
+        run = self.run_cli('--include-log')
+        self.assertEqual(run.returncode, 2)
+        self.assertIn("--output FILE", run.stderr)
+        self.assertEqual(run.stdout, '')
+
+    def test_dropped_process_table_warns(self):
+        run = self.run_cli()
+        self.assertEqual(run.returncode, 0)
+        self.assertIn("Warning: --format csv on stdout has only the metrics table", run.stderr)
+        self.assertEqual([row[0] for row in csv.reader(io.StringIO(run.stdout))], ['algorithm', 'FCFS'])
+        self.assertNotIn("Warning", self.run_cli('--no-process-table').stderr)
+
+    def test_output_file_gets_tables(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results.csv')
+            run = self.run_cli('--include-log', '--output', path)
+            self.assertEqual(run.returncode, 0)
+            self.assertNotIn("Warning", run.stderr)
+            for suffix in ('processes', 'log'):
+                self.assertTrue(os.path.exists(os.path.join(directory, f"results.{suffix}.csv")))
+
+if __name__ == '__main__':
+    unittest.main()
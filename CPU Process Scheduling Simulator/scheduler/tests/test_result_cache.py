@@ -0,0 +1,131 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+from algorithms import rr
+from utils import result_cache
+from utils.binary_workload import write_binary_workload
+from utils.result_cache import ResultCache
+from utils.statistics import StatsCalculator
+from utils.workload_generator import generate_workload, write_text_workload
+from tests.helpers import schedule_of
+
+class ResultCacheTest(unittest.TestCase):
+
+    # Keys follow the workload and the engine sources, entries are evicted least recently used first,
+    # and a failed write never leaves a partial entry behind.
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.directory.name, 'cache')
+        self.table = generate_workload(40, seed=4)
+        self.text_path = os.path.join(self.directory.name, 'workload.txt')
+        write_text_workload(self.table, self.text_path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def store(self, cache, table, key, quantum=2):
+        result = rr.simulate(table, quantum)
+        cache.put(key, table, result, StatsCalculator(table, result).summarize())
+        return result
+
+    def entries(self):
+        return sorted(name for name in os.listdir(self.cache_dir) if name.startswith('result-'))
+
+    def test_hit_returns_stored_run(self):
+        cache = ResultCache(self.cache_dir)
+        table = cache.load_workload(self.text_path)
+        key = cache.key('RR', {'quantum': 2})
+        self.assertIsNone(cache.get(key, table))
+        result = self.store(cache, table, key)
+        run = ResultCache(self.cache_dir).get(key, table)
+        self.assertEqual(schedule_of(table, run.result), schedule_of(table, result))
+        self.assertEqual(run.result.counters, result.counters)
+
+    def test_key_follows_workload(self):
+        cache = ResultCache(self.cache_dir)
+        cache.load_workload(self.text_path)
+        key = cache.key('RR', {'quantum': 2})
+        with open(self.text_path, 'a') as f:
+            f.write("PX 1000 1 0\n")
+        cache.load_workload(self.text_path)
+        self.assertNotEqual(cache.key('RR', {'quantum': 2}), key)
+        self.assertNotEqual(cache.key('RR', {'quantum': 3}), cache.key('RR', {'quantum': 2}))
+
+    def test_key_follows_engine_sources(self):
+        cache = ResultCache(self.cache_dir)
+        cache.load_workload(self.text_path)
+        key = cache.key('FCFS')
+        with mock.patch.dict(result_cache._source_versions, {result_cache.ENGINE_SOURCES: 'changed'}):
+            self.assertNotEqual(cache.key('FCFS'), key)
+        self.assertEqual(cache.key('FCFS'), key)
+
+    def test_binary_workload_is_not_hashed(self):
+        path = os.path.join(self.directory.name, 'workload.bin')
+        write_binary_workload(self.table, path)
+        cache = ResultCache(self.cache_dir)
+        with mock.patch.object(result_cache, 'file_digests', side_effect=AssertionError("hashed")):
+            table = cache.load_workload(path)
+            key = cache.key('FCFS')
+        self.assertEqual(len(table), len(self.table))
+        self.assertTrue(cache.workload_digest.startswith('stat-'))
+
+        # Rewriting the file, even with the same contents, gives a new key
+        os.remove(path)
+        write_binary_workload(self.table, path)
+        os.utime(path, ns=(time.time_ns() + 10 ** 9,) * 2)
+        cache.load_workload(path)
+        self.assertNotEqual(cache.key('FCFS'), key)
+
+    def test_least_recently_used_eviction(self):
+        cache = ResultCache(self.cache_dir)
+        table = cache.load_workload(self.text_path)
+        keys = [cache.key('RR', {'quantum': q}) for q in (1, 2, 3)]
+        for q, key in zip((1, 2, 3), keys):
+            self.store(cache, table, key, q)
+        sizes = {key: os.path.getsize(cache.path(f"result-{key}.bin")) for key in keys}
+        for age, key in zip((30, 20, 10), keys):
+            path = cache.path(f"result-{key}.bin")
+            os.utime(path, (time.time() - age,) * 2)
+        cache.get(keys[0], table)  # The oldest entry becomes the most recently used
+
+        # Room for two results next to the cached parse: the least recently used one goes
+        parse_size = sum(os.path.getsize(cache.path(name)) for name in os.listdir(self.cache_dir)
+                         if name.startswith('workload-'))
+        cache.max_bytes = parse_size + sizes[keys[0]] + sizes[keys[2]]
+        cache.evict()
+        self.assertEqual(self.entries(), sorted(f"result-{key}.bin" for key in (keys[0], keys[2])))
+
+    def test_failed_write_leaves_no_partial_entry(self):
+        cache = ResultCache(self.cache_dir)
+        table = cache.load_workload(self.text_path)
+        key = cache.key('FCFS')
+        result = self.store(cache, table, key)
+        path = cache.path(f"result-{key}.bin")
+        with open(path, 'rb') as f:
+            stored = f.read()
+
+        def fail(temp_path):
+            with open(temp_path, 'wb') as f:
+                f.write(b'partial')
+            raise OSError("disk full")
+
+        cache.write_atomic(path, fail)
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), stored)
+        self.assertFalse([name for name in os.listdir(self.cache_dir) if name.endswith('.tmp')])
+        self.assertEqual(schedule_of(table, cache.get(key, table).result), schedule_of(table, result))
+
+        def interrupt(temp_path):
+            raise KeyboardInterrupt
+
+        # An interrupt still propagates, after the temporary file is removed
+        with self.assertRaises(KeyboardInterrupt):
+            cache.write_atomic(cache.path("result-other.bin"), interrupt)
+        self.assertFalse([name for name in os.listdir(self.cache_dir) if name.endswith('.tmp')])
+        self.assertFalse(os.path.exists(cache.path("result-other.bin")))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from unittest import mock
+from algorithms import fcfs, priority_p, rr, srtf
+from algorithms.smp import SMPOptions
+from utils.process_table import ProcessTable
+from utils.statistics import StatsCalculator
+from utils.workload_generator import generate_workload
+from tests.helpers import random_workloads, schedule_of
+from tests.test_stream import ALGORITHMS
+
+class SingleCoreTest(unittest.TestCase):
+
+    # The multi-core simulator on one core must schedule exactly like the single-core engine.
+
+    def check_single_core(self, switch_cost):
+        for table in random_workloads(100, seed=switch_cost):
+            for name, module, args in ALGORITHMS:
+                expected = module.simulate(table, *args, switch_cost=switch_cost)
+                result = module.simulate(table, *args, switch_cost=switch_cost, smp=SMPOptions(1))
+                with self.subTest(algorithm=name, processes=len(table)):
+                    self.assertEqual(schedule_of(table, result), schedule_of(table, expected))
+                    self.assertEqual(result.switch_logs, expected.switch_logs)
+                    self.assertEqual(result.level_time, expected.level_time)
+                    self.assertEqual(result.counters['context_switches'], expected.counters['context_switches'])
+
+    def test_matches_engine(self):
+        self.check_single_core(0)
+
+    def test_matches_engine_with_switch_cost(self):
+        # Arrivals during a switch (also right at its end) are checked for preemption when it is over
+        for switch_cost in (1, 3):
+            self.check_single_core(switch_cost)
+
+class MultiCoreTest(unittest.TestCase):
+
+    # Hand-computed two-core schedules.
+
+    def test_per_core_placement_and_stealing(self):
+        # Arrivals alternate between the two queues; core 0 empties its queue first and steals D
+        table = ProcessTable(['A', 'B', 'C', 'D'], [0, 0, 0, 0], [1, 10, 1, 10], [0, 0, 0, 0])
+        result = fcfs.simulate(table, smp=SMPOptions(2, 'per-core'))
+        self.assertEqual(result.core_logs, [[(0, 1, 'A'), (1, 2, 'C'), (2, 12, 'D')], [(0, 10, 'B')]])
+        self.assertEqual(result.counters['steals'], 1)
+        metrics = StatsCalculator(table, result).summarize()
+        self.assertEqual(metrics.core_utilization, [1.0, 10 / 12])
+        self.assertEqual(metrics.cpu_utilization, 22 / 24)
+
+        result = fcfs.simulate(table, smp=SMPOptions(2, 'per-core', steal=False))
+        self.assertEqual(result.core_logs, [[(0, 1, 'A'), (1, 2, 'C')], [(0, 10, 'B'), (10, 20, 'D')]])
+        self.assertEqual(result.counters['steals'], 0)
+        self.assertEqual(StatsCalculator(table, result).summarize().core_utilization, [0.1, 1.0])
+
+    def test_migration_cost(self):
+        # RR slices of A, B and C resume on the other core three times, each losing a time unit
+        table = ProcessTable(['A', 'B', 'C'], [0, 0, 0], [4, 4, 4], [0, 0, 0])
+        result = rr.simulate(table, 2, smp=SMPOptions(2, migration_cost=1))
+        self.assertEqual(result.core_logs, [[(0, 2, 'A'), (2, 4, 'C'), (5, 7, 'B')],
+                                            [(0, 2, 'B'), (3, 5, 'A'), (6, 8, 'C')]])
+        self.assertEqual((result.counters['migrations'], result.counters['migration_time']), (3, 3))
+        self.assertEqual(StatsCalculator(table, result).summarize().core_utilization, [0.75, 0.75])
+
+    def test_arrival_preempts_least_deserving_core(self):
+        # Priority 3 outranks both running processes but only takes the core of the priority-9 one
+        table = ProcessTable(['A', 'B', 'C'], [0, 0, 2], [10, 10, 3], [5, 9, 3])
+        result = priority_p.simulate(table, smp=SMPOptions(2))
+        self.assertEqual(result.core_logs, [[(0, 10, 'A')], [(0, 2, 'B'), (2, 5, 'C'), (5, 13, 'B')]])
+        self.assertEqual(result.counters['preemptions'], 1)
+
+    def test_least_deserving_after_resume(self):
+        # At t=6 B (resumed at 4, 7 left) is further from completion than A (started at 0, 4 left)
+        table = ProcessTable(['A', 'B', 'D', 'E'], [0, 0, 3, 6], [10, 12, 1, 5], [0, 0, 0, 0])
+        result = srtf.simulate(table, smp=SMPOptions(2))
+        self.assertEqual(result.core_logs, [[(0, 10, 'A'), (10, 17, 'B')],
+                                            [(0, 3, 'B'), (3, 4, 'D'), (4, 6, 'B'), (6, 11, 'E')]])
+        self.assertEqual(result.counters['preemptions'], 2)
+
+class GlobalPreemptionCostTest(unittest.TestCase):
+
+    # Arrival preemption on a shared queue keys each running block at most once instead of
+    # visiting every core: the rank lookups follow the dispatches, not steps * cores.
+
+    def test_rank_lookups_independent_of_cores(self):
+        # Overloaded, so nearly every arrival finds the shared queue non-empty
+        table = generate_workload(2000, seed=3, arrival_rate=1.0, mean_burst=1024)
+        rank = priority_p.PriorityPEngine.preempt_rank
+        with mock.patch.object(priority_p.PriorityPEngine, 'preempt_rank', autospec=True, side_effect=rank) as calls:
+            result = priority_p.simulate(table, smp=SMPOptions(256))
+        counters = result.counters
+        self.assertGreater(counters['steps'], 1000)
+        self.assertLessEqual(calls.call_count, counters['dispatches'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from unittest import mock
+from scheduler import simulate_algorithm
+from utils import statistics
+from utils.statistics import Distribution, StatsCalculator
+from utils.workload_generator import generate_workload
+
+METRICS = ('turnaround', 'waiting', 'response', 'slowdown')
+
+class DistributionTest(unittest.TestCase):
+
+    def test_summary(self):
+        dist = Distribution([4, 1, 3, 2])
+        self.assertEqual((dist.mean, dist.p50, dist.max), (2.5, 2.5, 4))
+        self.assertAlmostEqual(dist.std, 1.25 ** 0.5)
+        self.assertAlmostEqual(dist.p90, 3.7)
+        self.assertAlmostEqual(dist.p99, 3.97)
+
+    def test_empty(self):
+        self.assertEqual(Distribution([]).to_dict(), dict.fromkeys(Distribution.__slots__, 0))
+
+class VectorizedSummaryTest(unittest.TestCase):
+
+    # Large runs are summarized with NumPy when it is installed, with the same metrics as the
+    # pure-Python path; small runs never try to import it.
+
+    def setUp(self):
+        self.table = generate_workload(500, seed=11)
+
+    def summarize(self, name, numpy):
+        calc = StatsCalculator(self.table, simulate_algorithm(name, self.table, 3))
+        with mock.patch.object(statistics, 'VECTORIZE_MIN', 100), \
+             mock.patch.object(statistics, 'load_numpy', return_value=numpy):
+            return calc, calc.summarize()
+
+    @unittest.skipUnless(statistics.load_numpy(), "NumPy is not installed")
+    def test_matches_pure_python(self):
+        for name in ('FCFS', 'RR', 'MLFQ'):
+            pure_calc, pure = self.summarize(name, None)
+            calc, vector = self.summarize(name, statistics.load_numpy())
+            with self.subTest(algorithm=name):
+                self.assertEqual((calc.turnaround, calc.waiting, calc.response),
+                                 (pure_calc.turnaround, pure_calc.waiting, pure_calc.response))
+                for metric in METRICS:
+                    expected, actual = getattr(pure, metric).to_dict(), getattr(vector, metric).to_dict()
+                    for stat, value in expected.items():
+                        self.assertIs(type(actual[stat]), type(value))
+                        self.assertAlmostEqual(actual[stat], value)
+
+    def test_falls_back_without_numpy(self):
+        calc, metrics = self.summarize('RR', None)
+        result = calc.result
+        turnaround = [c - a for c, a in zip(result.completion, self.table.arrival)]
+        self.assertEqual(calc.turnaround, turnaround)
+        self.assertEqual(metrics.turnaround.to_dict(), Distribution(turnaround).to_dict())
+        self.assertEqual(metrics.slowdown.to_dict(),
+                         Distribution([t / b for t, b in zip(turnaround, self.table.burst)]).to_dict())
+
+    def test_small_runs_skip_numpy(self):
+        calc = StatsCalculator(self.table, simulate_algorithm('FCFS', self.table, 3))
+        with mock.patch.object(statistics, 'load_numpy') as load_numpy:
+            calc.summarize()
+        load_numpy.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
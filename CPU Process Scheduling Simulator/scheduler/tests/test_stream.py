@@ -0,0 +1,56 @@
+import unittest
+from algorithms import fcfs, sjf, srtf, rr, priority_np, priority_p, mlfq, cfs
+from tests.helpers import random_workloads
+
+# (name, algorithm module, extra arguments)
+ALGORITHMS = (
+    ('FCFS', fcfs, ()),
+    ('SJF', sjf, ()),
+    ('SRTF', srtf, ()),
+    ('RR', rr, (2,)),
+    ('PRIO_NP', priority_np, ()),
+    ('PRIO_P', priority_p, ()),
+    ('MLFQ', mlfq, (1, 3, None, 40)),
+    ('CFS', cfs, (2,))
+)
+
+def records_of(table):
+    # The (pid, arrival, burst, priority) records of a ProcessTable, in arrival order.
+    return [(table.pids[i], table.arrival[i], table.burst[i], table.priority[i]) for i in range(len(table))]
+
+class StreamTest(unittest.TestCase):
+
+    # An online run over the arrival stream must report exactly the batch run's schedule.
+
+    def check_stream(self, switch_cost):
+        for table in random_workloads(60, seed=switch_cost):
+            for name, module, args in ALGORITHMS:
+                result = module.simulate(table, *args, switch_cost=switch_cost)
+                simulator = module.stream(records_of(table), *args, switch_cost=switch_cost)
+                blocks, times = [], {}
+                for kind, event in simulator.events():
+                    if kind == 'block':
+                        blocks.append(event)
+                    else:
+                        times[event[0]] = (event[4], event[5])
+                with self.subTest(algorithm=name, processes=len(table)):
+                    self.assertEqual(blocks, result.execution_log)
+                    self.assertEqual(times, {table.pids[i]: (result.start[i], result.completion[i])
+                                             for i in range(len(table))})
+                    counters = dict(simulator.counters)
+                    del counters['peak_live']
+                    self.assertEqual(counters, result.counters)
+
+    def test_matches_batch(self):
+        self.check_stream(0)
+
+    def test_matches_batch_with_switch_cost(self):
+        self.check_stream(2)
+
+    def test_rejects_out_of_order_arrivals(self):
+        simulator = fcfs.stream([('P1', 5, 1, 0), ('P2', 3, 1, 0)])
+        with self.assertRaises(ValueError):
+            list(simulator.events())
+
+if __name__ == '__main__':
+    unittest.main()
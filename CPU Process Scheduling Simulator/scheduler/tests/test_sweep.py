@@ -0,0 +1,63 @@
+import argparse
+import contextlib
+import csv
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+from algorithms import rr
+from scheduler import parse_sweep, run_quantum_sweep
+from utils.statistics import StatsCalculator
+from utils.workload_generator import generate_workload
+
+class QuantumSweepTest(unittest.TestCase):
+
+    # The sweep reports, for every quantum, exactly the metrics of a plain RR run.
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.table = generate_workload(60, seed=9, arrival_rate=0.3)
+        self.input_path = os.path.join(self.directory.name, 'workload.txt')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def sweep(self, quanta, jobs=1, csv_path=None):
+        output = io.StringIO()
+        with mock.patch('scheduler.save_sweep_graphs') as save, contextlib.redirect_stdout(output):
+            sweep = run_quantum_sweep(self.table, self.input_path, quanta, jobs, csv_path,
+                                      params={'RR': {'switch_cost': 1}})
+        save.assert_called_once_with(sweep)
+        return sweep, output.getvalue()
+
+    def test_matches_single_runs(self):
+        csv_path = os.path.join(self.directory.name, 'sweep.csv')
+        sweep, output = self.sweep(parse_sweep('1:9:4'), csv_path=csv_path)
+        self.assertEqual([quantum for quantum, _ in sweep], [1, 5, 9])
+        with open(csv_path, newline='') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ['quantum', 'avg_turnaround', 'avg_waiting', 'avg_response', 'context_switches'])
+        for (quantum, metrics), row in zip(sweep, rows[1:]):
+            expected = StatsCalculator(self.table, rr.simulate(self.table, quantum, switch_cost=1)).summarize()
+            with self.subTest(quantum=quantum):
+                self.assertEqual(metrics.to_dict(), expected.to_dict())
+                self.assertEqual(row, [str(quantum), str(expected.avg_turnaround), str(expected.avg_waiting),
+                                       str(expected.avg_response), str(expected.context_switches)])
+                self.assertIn(f"{quantum:<10} {expected.avg_turnaround:<15.2f}", output)
+
+    def test_parallel_matches_serial(self):
+        serial, output = self.sweep(range(1, 5))
+        parallel, parallel_output = self.sweep(range(1, 5), jobs=2)
+        self.assertEqual([(q, m.to_dict()) for q, m in parallel], [(q, m.to_dict()) for q, m in serial])
+        self.assertEqual(parallel_output, output)
+
+    def test_parse_sweep(self):
+        self.assertEqual(list(parse_sweep('2:4')), [2, 3, 4])
+        self.assertEqual(list(parse_sweep('1:10:3')), [1, 4, 7, 10])
+        for text in ('0:4', '5:4', '1:4:0', '1', '1:2:3:4', 'a:b'):
+            with self.subTest(text=text), self.assertRaises(argparse.ArgumentTypeError):
+                parse_sweep(text)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import contextlib
+import io
+import os
+import struct
+import tempfile
+import unittest
+from utils.binary_workload import read_binary_workload, write_binary_workload
+from utils.parser import WorkloadError, load_workload
+from utils.workload_generator import generate_workload
+
+class BinaryWorkloadTest(unittest.TestCase):
+
+    # The binary format round-trips, and a file whose length disagrees with its header is rejected.
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'workload.bin')
+        self.table = generate_workload(50, seed=5)
+        write_binary_workload(self.table, self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def rewrite(self, transform):
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        with open(self.path, 'wb') as f:
+            f.write(transform(data))
+
+    def test_round_trip(self):
+        table = read_binary_workload(self.path)
+        self.assertEqual(list(table.pids), self.table.pids)
+        for column in ('arrival', 'burst', 'priority'):
+            self.assertEqual(list(getattr(table, column)), list(getattr(self.table, column)))
+
+    def test_truncated_file(self):
+        for cut in (1, 8, 400, 1200):
+            with self.subTest(cut=cut):
+                self.rewrite(lambda data: data[:-cut])
+                with self.assertRaises(WorkloadError):
+                    read_binary_workload(self.path)
+                write_binary_workload(self.table, self.path)
+
+    def test_trailing_bytes(self):
+        self.rewrite(lambda data: data + b'\0' * 8)
+        with self.assertRaises(WorkloadError):
+            read_binary_workload(self.path)
+
+    def test_corrupted_count(self):
+        for n in (49, 51, 1 << 40):
+            with self.subTest(n=n):
+                self.rewrite(lambda data: data[:16] + struct.pack('<Q', n) + data[24:])
+                with self.assertRaises(WorkloadError):
+                    read_binary_workload(self.path)
+                write_binary_workload(self.table, self.path)
+
+    def test_load_workload_reports_error(self):
+        self.rewrite(lambda data: data[:-3])
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            table = load_workload(self.path)
+        self.assertEqual(len(table), 0)
+        self.assertIn("Error:", output.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
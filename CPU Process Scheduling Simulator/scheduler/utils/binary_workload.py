@@ -0,0 +1,150 @@
+import mmap
+import struct
+import sys
+from array import array
+from utils.process_table import ProcessTable
+
+# Binary workload format (all integers little-endian):
+#
+#   Header (32 bytes):
+#       magic    8s   b'CPUSCHED'
+#       version  u32  FORMAT_VERSION
+#       flags    u32  FLAG_SORTED if rows are ordered by (arrival_time, pid)
+#       count    u64  number of processes n
+#       reserved u64
+#   arrival      int64[n]
+#   burst        int64[n]
+#   priority     int64[n]
+#   pid_offsets  uint64[n + 1]   byte offsets into the pid string table
+#   pid_table    UTF-8 bytes of all pids, concatenated
+#
+# Every section is a multiple of 8 bytes, so the columns can be used in place
+# from a memory-mapped file without any parsing.
+
+MAGIC = b'CPUSCHED'
+FORMAT_VERSION = 1
+FLAG_SORTED = 1
+
+HEADER = struct.Struct('<8sIIQQ')
+
+class PidTable:
+
+    # Read-only sequence of pid strings decoded lazily from the mapped pid table.
+
+    __slots__ = ('offsets', 'blob')
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets  # uint64 offsets, one more than the number of pids
+        self.blob = blob  # memoryview over the concatenated UTF-8 pids
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        return str(self.blob[self.offsets[i]:self.offsets[i + 1]], 'utf-8')
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+def is_binary_workload(filename):
+    # Returns True if the file starts with the binary workload magic bytes.
+    try:
+        with open(filename, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+def write_binary_workload(table, filename, presorted=True):
+
+    # Writes a ProcessTable in the binary workload format.
+
+    # Args:
+    #    table: ProcessTable to store
+    #    filename: Output path
+    #    presorted: Whether the rows are in (arrival_time, pid) order (stored as FLAG_SORTED)
+
+    n = len(table)
+    pid_bytes = [pid.encode('utf-8') for pid in table.pids]
+
+    offsets = array('Q', [0]) * (n + 1)
+    for i, b in enumerate(pid_bytes):
+        offsets[i + 1] = offsets[i] + len(b)
+
+    columns = [array('q', table.arrival), array('q', table.burst), array('q', table.priority), offsets]
+    if sys.byteorder != 'little':
+        for column in columns:
+            column.byteswap()
+
+    with open(filename, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, FLAG_SORTED if presorted else 0, n, 0))
+        for column in columns:
+            column.tofile(f)
+        f.write(b''.join(pid_bytes))
+
+def read_binary_workload(filename):
+
+    # Opens a binary workload file via mmap.
+
+    # When the file is flagged as sorted and the machine is little-endian, the table
+    # columns are memoryviews straight over the mapping: nothing is parsed or copied.
+    # Otherwise the columns are copied (and sorted) into a regular ProcessTable.
+
+    # Returns:
+    #    ProcessTable (empty if the file cannot be mapped)
+
+    # Raises:
+    #    WorkloadError if the file is not a valid binary workload, e.g. truncated
+    #    or with a header that does not match its length
+
+    from utils.parser import WorkloadError  # utils.parser imports this module
+
+    try:
+        with open(filename, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        print(f"Error: Could not map {filename}.")
+        return ProcessTable()
+
+    view = memoryview(mapped)
+    if len(view) < HEADER.size:
+        raise WorkloadError(filename, None, "not a valid binary workload (shorter than its header)")
+
+    magic, version, flags, n, _ = HEADER.unpack_from(view)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise WorkloadError(filename, None, f"not a valid binary workload (version {version})")
+
+    # The fixed-size columns, then the pid table whose length is the last pid offset
+    column_bytes = 8 * n
+    fixed_bytes = HEADER.size + 4 * column_bytes + 8
+    if len(view) < fixed_bytes:
+        raise WorkloadError(filename, None, f"truncated: the header announces {n} processes "
+                                            f"({fixed_bytes} bytes before the pids), the file has {len(view)} bytes")
+    pid_bytes = struct.unpack_from('<Q', view, fixed_bytes - 8)[0]
+    if len(view) != fixed_bytes + pid_bytes:
+        raise WorkloadError(filename, None, f"{len(view)} bytes, but the header and pid offsets of its {n} "
+                                            f"processes describe {fixed_bytes + pid_bytes}")
+
+    pos = HEADER.size
+    arrival = view[pos:pos + column_bytes].cast('q')
+    pos += column_bytes
+    burst = view[pos:pos + column_bytes].cast('q')
+    pos += column_bytes
+    priority = view[pos:pos + column_bytes].cast('q')
+    pos += column_bytes
+    offsets = view[pos:pos + column_bytes + 8].cast('Q')
+    pos += column_bytes + 8
+    pids = PidTable(offsets, view[pos:])
+
+    if sys.byteorder != 'little':
+        columns = [array('q', arrival), array('q', burst), array('q', priority), array('Q', offsets)]
+        for column in columns:
+            column.byteswap()
+        arrival, burst, priority, offsets = columns
+        pids = PidTable(offsets, view[pos:])
+
+    if flags & FLAG_SORTED:
+        return ProcessTable.from_columns(pids, arrival, burst, priority)
+    return ProcessTable(list(pids), arrival, burst, priority)
@@ -0,0 +1,189 @@
+import hashlib
+import itertools
+import os
+import pickle
+import sys
+import tempfile
+import time
+import zlib
+from utils.result_cache import run_key
+
+# Checkpointing of long single-core simulations (--checkpoint / --resume).
+#
+# A snapshot is the pickled engine: the clock, the ready queue, the remaining and
+# start/completion columns, the partial execution log and the counters - every
+# piece of state the event loop needs to carry on (see Engine.run). The workload
+# table is left out and re-attached on resume. Each snapshot is tagged with the
+# run's key (workload contents, algorithm, settings and engine version, see
+# run_key), so a snapshot is only resumed by exactly the run that wrote it.
+#
+# Snapshots are written through a temporary file and renamed into place, so a
+# kill during a save leaves the previous snapshot intact.
+#
+# Incremental runs (--incremental) keep one more snapshot per run in the result
+# cache: the engine suspended right before it admits the workload's last row. Up to
+# that point no scheduling decision can depend on a later row, so when the workload
+# file is later extended by appending lines, the run over the longer file continues
+# from that snapshot (see Engine.extend) instead of starting again at t=0. The
+# execution and context switch logs, by far the largest part of the state, are left
+# out: they are prefixes of the logs in the run's cached result, read back instead.
+
+# Snapshot format version, bumped when the pickled layout changes
+SNAPSHOT_VERSION = 3
+
+# Default seconds between snapshots
+DEFAULT_INTERVAL = 60.0
+
+class Checkpoint:
+
+    # Snapshots of one algorithm run, written at most every interval seconds.
+
+    def __init__(self, path, key, interval=DEFAULT_INTERVAL, resume=False):
+
+        # Args:
+        #    path: Snapshot file
+        #    key: run_key of the run
+        #    interval: Minimum seconds between snapshots
+        #    resume: Whether load() may continue from an existing snapshot
+
+        self.path = path
+        self.key = key
+        self.interval = interval
+        self.resume = resume
+        self.next_save = time.monotonic() + interval
+        self.saves = 0
+
+    def due(self):
+        # Whether the next snapshot should be written now.
+        return time.monotonic() >= self.next_save
+
+    def save(self, engine):
+        # Writes a snapshot of the engine and schedules the next one.
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({'version': SNAPSHOT_VERSION, 'key': self.key, 'engine': engine}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        self.saves += 1
+        self.next_save = time.monotonic() + self.interval
+
+    def load(self, table, engine_class):
+        # Returns the engine restored from the snapshot (with table re-attached),
+        # or None when there is nothing to resume. Snapshots of another run are ignored.
+        if not self.resume:
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            print(f"Warning: ignoring unreadable checkpoint {self.path}: {e}", file=sys.stderr)
+            return None
+        if snapshot.get('version') != SNAPSHOT_VERSION or snapshot.get('key') != self.key \
+                or type(snapshot.get('engine')) is not engine_class:
+            print(f"Warning: ignoring checkpoint {self.path} written by a different run", file=sys.stderr)
+            return None
+        engine = snapshot['engine']
+        engine.table = table
+        print(f"Resuming from {self.path} at t={engine.clock} "
+              f"({engine.completed} of {len(table)} processes completed)", file=sys.stderr)
+        return engine
+
+    def clear(self):
+        # Removes the snapshot once the run has finished.
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+class CheckpointDirectory:
+
+    # Where the runs of one invocation keep their snapshots: <directory>/<algorithm>.ckpt.
+    # Plain data, so it can be passed to worker processes.
+
+    def __init__(self, directory, workload_digest, interval=DEFAULT_INTERVAL, resume=False):
+        self.directory = directory
+        self.workload_digest = workload_digest  # workload_identity of the input workload
+        self.interval = interval
+        self.resume = resume
+
+    def for_run(self, algo_name, kwargs=None):
+        # Checkpoint of one single-core algorithm run.
+        return Checkpoint(os.path.join(self.directory, f"{algo_name}.ckpt"),
+                          run_key(self.workload_digest, algo_name, kwargs), self.interval, self.resume)
+
+def table_digest(table, rows=None):
+    # SHA-256 over the first rows rows of a ProcessTable (default: all of them).
+    if rows is None:
+        rows = len(table)
+    digest = hashlib.sha256()
+    for column in (table.arrival, table.burst, table.priority):
+        digest.update(memoryview(column)[:rows])
+    digest.update('\n'.join(itertools.islice(table.pids, rows)).encode())
+    return digest.hexdigest()
+
+class IncrementalRun:
+
+    # Snapshot at the last arrival of one algorithm run, stored in a ResultCache.
+
+    # load() continues the snapshot of the earlier version of the workload, if the cache
+    # found one (ResultCache.base_digest), and capture() stores this run's snapshot for
+    # the next version. The merged run produces exactly the result of a run from t=0.
+    # A snapshot is only usable while the cache still holds the result of its run.
+
+    def __init__(self, cache, algo_name, kwargs=None):
+        self.cache = cache
+        self.algo_name = algo_name
+        self.key = cache.key(algo_name, kwargs)
+        self.base_key = run_key(cache.base_digest, algo_name, kwargs) if cache.base_digest else None
+
+    def load(self, table, engine_class):
+        # Returns the earlier version's engine extended over table, or None.
+        if self.base_key is None:
+            return None
+        path = self.cache.path(f"snapshot-{self.base_key}.bin")
+        try:
+            with open(path, 'rb') as f:
+                snapshot = pickle.loads(zlib.decompress(f.read()))
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        engine = snapshot.get('engine')
+        rows = snapshot.get('rows', 0)
+        # Appended lines that sort before the earlier last arrival change the leading rows
+        if snapshot.get('version') != SNAPSHOT_VERSION or type(engine) is not engine_class \
+                or rows > len(table) or table_digest(table, rows) != snapshot.get('table'):
+            return None
+        logs = self.cache.get_logs(self.base_key, rows, table.pids, snapshot['blocks'], snapshot['switches'])
+        if logs is None:
+            return None
+        self.cache.touch(path)
+        engine.execution_log, engine.switch_log = logs
+        engine.extend(table)
+        print(f"{self.algo_name}: continuing from the run over the first {rows} processes at t={engine.clock}",
+              file=sys.stderr)
+        return engine
+
+    def capture(self, engine):
+        # Engine.run() callback: stores the engine suspended at its last arrival.
+        log, switch_log = engine.execution_log, engine.switch_log
+        engine.execution_log = engine.switch_log = []
+        try:
+            data = zlib.compress(pickle.dumps({'version': SNAPSHOT_VERSION, 'rows': len(engine.table),
+                                               'table': table_digest(engine.table), 'blocks': len(log),
+                                               'switches': len(switch_log), 'engine': engine},
+                                              protocol=pickle.HIGHEST_PROTOCOL), 1)
+        finally:
+            engine.execution_log, engine.switch_log = log, switch_log
+
+        def write(path):
+            with open(path, 'wb') as f:
+                f.write(data)
+
+        self.cache.write_atomic(self.cache.path(f"snapshot-{self.key}.bin"), write)
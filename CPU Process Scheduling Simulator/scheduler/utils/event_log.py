@@ -0,0 +1,63 @@
+import heapq
+from operator import itemgetter
+
+# Event types
+ARRIVAL = 'arrival'
+START = 'start'
+PREEMPT = 'preempt'
+COMPLETE = 'complete'
+
+# Ordering of events that happen at the same time (logical real-world order):
+# arrivals first, then the running process leaves the CPU, then the next one starts
+EVENT_ORDER = {ARRIVAL: 0, PREEMPT: 1, COMPLETE: 1, START: 2}
+
+EVENT_MESSAGES = {
+    ARRIVAL: "{} arrives",
+    START: "{} starts running",
+    PREEMPT: "{} is preempted",
+    COMPLETE: "{} completes"
+}
+
+def arrival_events(table):
+    # Arrival events in row order (rows are already sorted by arrival time).
+    for i, pid in enumerate(table.pids):
+        yield table.arrival[i], EVENT_ORDER[ARRIVAL], ARRIVAL, pid
+
+def block_events(execution_log, row_of, completion):
+    # Start and preempt/complete events for each block of one execution log.
+    #
+    # Blocks are chronological and non-overlapping, so the events come out sorted.
+    # A block ends in completion when it ends at its process's completion time.
+    for start, end, pid in execution_log:
+        yield start, EVENT_ORDER[START], START, pid
+        kind = COMPLETE if completion[row_of[pid]] == end else PREEMPT
+        yield end, EVENT_ORDER[kind], kind, pid
+
+def iter_events(table, result):
+
+    # Generates the chronological scheduling events of one run.
+
+    # The arrival stream and the execution-log stream (one per core on multi-core
+    # runs) are each already sorted, so they are combined with a single lazy merge:
+    # linear time and constant memory beyond the pid index. On ties arrivals come
+    # first, as listed in EVENT_ORDER.
+
+    # Args:
+    #    table: ProcessTable of the run
+    #    result: ScheduleResult of the run
+
+    # Yields:
+    #    (time, event_type, pid) tuples, event_type being one of ARRIVAL, START, PREEMPT, COMPLETE
+
+    row_of = {pid: i for i, pid in enumerate(table.pids)}  # pid -> row, built once
+    lanes = [block_events(log, row_of, result.completion) for log in result.lane_logs()]
+    for time, _, kind, pid in heapq.merge(arrival_events(table), *lanes, key=itemgetter(0, 1)):
+        yield time, kind, pid
+
+def write_events(events, stream):
+    # Writes events as 't=<time>: <message>' lines and returns how many were written.
+    count = 0
+    for time, kind, pid in events:
+        stream.write(f"t={time}: {EVENT_MESSAGES[kind].format(pid)}\n")
+        count += 1
+    return count
@@ -1,52 +1,210 @@
-def print_gantt_chart(execution_log):
+import heapq
+import sys
+from bisect import bisect_right
+
+# Timelines up to this many time units are drawn in full detail (3 characters per unit)
+DETAIL_LIMIT = 100
+
+# Default number of columns when a long timeline is bucketed
+DEFAULT_WIDTH = 100
+
+# One character per process in bucketed charts; further processes are shown as '*'
+SYMBOLS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+
+# CPU utilization shading for bucketed charts, from idle to fully busy
+SHADES = ' .:-=+*#%@'
+
+# Character filling context switch blocks (and their columns in bucketed charts)
+SWITCH_SYMBOL = '#'
+
+def print_gantt_chart(execution_log, window=None, width=None, stream=None, title="Gantt Chart", switch_log=None):
     # Generates and prints an ASCII Gantt chart visualization of process execution.
-# 
+#
 # The Gantt chart shows:
 # - Time markers along the top
 # - Process IDs in blocks representing when each process ran
 # - Idle periods (if any) shown as dashes
-# 
+# - Context switch overhead (if any) shown as blocks of '#'
+#
+# Short timelines are drawn in full detail. Longer ones (or any timeline wider
+# than an explicit width) are bucketed into columns: each column shows the
+# process that ran most within its time bucket, plus a CPU utilization row.
+# Output is written piecewise to the stream, never built up as one string.
+#
 # Args:
-#     execution_log: List of tuples (start_time, end_time, pid) representing execution blocks
+#     execution_log: List of tuples (start_time, end_time, pid) representing execution blocks,
+#                    in chronological order
+#     window: Optional (start, end) tuple restricting the chart to that time range
+#     width: Target width in characters (default: detailed up to DETAIL_LIMIT time units,
+#            otherwise DEFAULT_WIDTH columns)
+#     stream: File-like object to write to (default: sys.stdout)
+#     title: Heading written above the chart
+#     switch_log: Optional chronological (start_time, end_time) context switch blocks
+#                 (see ScheduleResult.switch_logs)
+    if stream is None:
+        stream = sys.stdout
+
     if not execution_log:
-        print("No execution log to display.")
+        stream.write("No execution log to display.\n")
         return
 
-    print("\nGantt Chart:")
-    
-    # Calculate total simulation time (end of last process)
-    total_time = execution_log[-1][1]
-    
+    # Calculate the time range to draw (default: whole simulation)
+    start, end = window if window else (0, execution_log[-1][1])
+    if end <= start:
+        stream.write("Empty Gantt chart window.\n")
+        return
+
+    # Blocks are chronological and non-overlapping, so they are sorted by end time too;
+    # skip straight to the first block that reaches into the window
+    first = bisect_right(execution_log, start, key=lambda block: block[1])
+    blocks = log_from(execution_log, first)
+    if switch_log:
+        # Switch blocks never overlap the process blocks: merge them in, with pid None
+        first_switch = bisect_right(switch_log, start, key=lambda block: block[1])
+        switches = ((switch_start, switch_end, None)
+                    for switch_start, switch_end in log_from(switch_log, first_switch))
+        blocks = heapq.merge(blocks, switches, key=lambda block: block[0])
+
+    stream.write(f"\n{title}:\n")
+    span = end - start
+    if (width is None and span <= DETAIL_LIMIT) or (width is not None and span * 3 <= width):
+        write_detailed_chart(clipped_blocks(blocks, start, end), start, end, stream)
+    else:
+        write_bucketed_chart(clipped_blocks(blocks, start, end), start, end, width or DEFAULT_WIDTH, stream)
+    stream.write("\n")
+
+def print_core_gantt_charts(core_logs, window=None, width=None, stream=None, switch_logs=None):
+    # Prints one Gantt lane per core of a multi-core run, all over the same time range.
+    #
+    # Args:
+    #     core_logs: Per-core execution logs (see ScheduleResult.core_logs)
+    #     window, width, stream: As for print_gantt_chart
+    #     switch_logs: Optional per-core context switch blocks (see ScheduleResult.switch_logs)
+    if window is None:
+        window = (0, max((log[-1][1] for log in core_logs if log), default=0))
+    for core, log in enumerate(core_logs):
+        print_gantt_chart(log, window, width, stream, title=f"Core {core}",
+                          switch_log=switch_logs[core] if switch_logs else None)
+
+def log_from(log, first):
+    # Yields the entries of a log from index first onwards.
+    for i in range(first, len(log)):
+        yield log[i]
+
+def clipped_blocks(blocks, start, end):
+    # Yields chronological blocks clipped to [start, end), stopping at the first one past the window.
+    for block_start, block_end, pid in blocks:
+        if block_start >= end:
+            break
+        yield max(block_start, start), min(block_end, end), pid
+
+def write_detailed_chart(blocks, start, end, stream):
+    # Draws every time unit with 3 characters, as in the classic chart.
+
     # Print time markers at the top
     # Format: Time: 0  1  2  3  4  ...
-    time_str = "Time: "
-    for i in range(total_time + 1):
-        time_str += f"{i:<3}"  # Each time unit takes 3 characters
-    print(time_str)
-    
+    stream.write("Time: ")
+    for i in range(start, end + 1):
+        stream.write(f"{i:<3}")  # Each time unit takes 3 characters
+    stream.write("\n")
+
     # Build the process execution bar
-    bar_str = "|"
-    current_time = 0
-    
-    for start, end, pid in execution_log:
+    stream.write("|")
+    current_time = start
+    switched = False  # Whether a context switch block was drawn
+
+    for block_start, block_end, pid in blocks:
         # Handle CPU idle time (gap between processes)
-        if start > current_time:
-            idle_duration = start - current_time
-            bar_str += "-" * (idle_duration * 3) + "|"  # 3 chars per time unit
-            
+        if block_start > current_time:
+            idle_duration = block_start - current_time
+            stream.write("-" * (idle_duration * 3) + "|")  # 3 chars per time unit
+
         # Create process execution block
-        duration = end - start
+        duration = block_end - block_start
         block_width = duration * 3  # Width in characters
+        current_time = block_end
+        if pid is None:
+            # Context switch overhead
+            stream.write(SWITCH_SYMBOL * block_width + "|")
+            switched = True
+            continue
         pid_str = f"{pid}"
-        
+
         # Center the PID within the block
         padding = block_width - len(pid_str)
         left_pad = padding // 2
         right_pad = padding - left_pad
-        
-        bar_str += "-" * left_pad + pid_str + "-" * right_pad + "|"
-        current_time = end
-        
-    print(bar_str)
-    print()
 
+        stream.write("-" * left_pad + pid_str + "-" * right_pad + "|")
+
+    stream.write("\n")
+    if switched:
+        stream.write(f"('{SWITCH_SYMBOL}' = context switch)\n")
+
+def write_bucketed_chart(blocks, start, end, width, stream):
+    # Draws the window in at most `width` columns of equal time buckets.
+
+    bucket = -(-(end - start) // width)  # Time units per column (ceiling division)
+    columns = -(-(end - start) // bucket)
+
+    symbols = {}  # pid -> chart symbol, assigned in order of first appearance
+    cpu_row = []
+    util_row = []
+
+    def flush(column, occupancy, busy):
+        # Appends the characters for one finished column.
+        column_length = min(bucket, end - (start + column * bucket))
+        if busy == 0:
+            cpu_row.append('.')
+        else:
+            dominant = max(occupancy, key=occupancy.get)
+            if dominant is None:
+                cpu_row.append(SWITCH_SYMBOL)  # Mostly context switching
+            else:
+                if dominant not in symbols and len(symbols) < len(SYMBOLS):
+                    symbols[dominant] = SYMBOLS[len(symbols)]
+                cpu_row.append(symbols.get(dominant, '*'))
+        util_row.append(SHADES[round(busy / column_length * (len(SHADES) - 1))])
+
+    column = 0
+    occupancy = {}  # pid (None = context switching) -> time run within the current column
+    busy = 0  # Busy time within the current column, context switches included
+
+    for block_start, block_end, pid in blocks:
+        t = block_start
+        while t < block_end:
+            block_column = (t - start) // bucket
+            while column < block_column:
+                # Close finished columns (idle ones included)
+                flush(column, occupancy, busy)
+                column += 1
+                occupancy = {}
+                busy = 0
+            segment_end = min(block_end, start + (column + 1) * bucket)
+            occupancy[pid] = occupancy.get(pid, 0) + segment_end - t
+            busy += segment_end - t
+            t = segment_end
+
+    while column < columns:
+        flush(column, occupancy, busy)
+        column += 1
+        occupancy = {}
+        busy = 0
+
+    # Time markers every 10 columns
+    axis = [' '] * (columns + 10)
+    for c in range(0, columns, 10):
+        label = str(start + c * bucket)
+        axis[c:c + len(label)] = label
+    stream.write(f"Time: {''.join(axis).rstrip()}\n")
+    stream.write(f"CPU:  {''.join(cpu_row)}\n")
+    stream.write(f"Util: {''.join(util_row)}\n")
+    stream.write(f"(1 column = {bucket} time units, '.' = idle, utilization shaded '{SHADES}')\n")
+
+    # Legend for the process symbols used
+    stream.write("Legend: " + " ".join(f"{symbol}={pid}" for pid, symbol in symbols.items()))
+    if '*' in cpu_row:
+        stream.write(" *=other")
+    if SWITCH_SYMBOL in cpu_row:
+        stream.write(f" {SWITCH_SYMBOL}=context switch")
+    stream.write("\n")
@@ -1,63 +1,188 @@
-def parse_input(filename):
-    # Parses the process input file and creates a list of process dictionaries.
+from utils.process_table import ProcessTable
+from utils.binary_workload import is_binary_workload, read_binary_workload, write_binary_workload
+
+# Bytes of text requested per read when streaming a workload file
+CHUNK_SIZE = 1 << 20
+
+class WorkloadError(ValueError):
+    # A malformed or out-of-order line in a text workload file, or a malformed
+    # binary workload file (line_no is None).
+
+    def __init__(self, filename, line_no, message):
+        super().__init__(f"{filename}:{line_no}: {message}" if line_no is not None else f"{filename}: {message}")
+        self.filename = filename
+        self.line_no = line_no
+        self.message = message
+
+def iter_processes(filename, strict=False, errors=None, require_sorted=False, chunk_size=CHUNK_SIZE):
+    # Streams process records from a text workload file without loading it whole.
+# 
+# The file is read in chunks of roughly chunk_size bytes and one record is
+# yielded per valid line, so a consumer can start working before the file has
+# been fully read.
+# 
+# Args:
+#     filename: Path to the input file
+#     strict: Raise the first WorkloadError instead of skipping the line
+#     errors: Optional list that collects a WorkloadError for every skipped line
+#     require_sorted: Treat a record that arrives before the previous one (by
+#                     arrival time, then PID) as an error, so the stream can be
+#                     consumed in order without a global sort
+#     chunk_size: Approximate bytes read per chunk
+# 
+# Yields:
+#     Tuples of (pid, arrival_time, burst_time, priority)
+    with open(filename, 'r') as f:
+        yield from parse_lines(read_chunks(f, chunk_size), filename, strict, errors, require_sorted)
+
+def read_chunks(f, chunk_size=CHUNK_SIZE):
+    # Lines of a text stream, read about chunk_size bytes at a time.
+    while True:
+        lines = f.readlines(chunk_size)
+        if not lines:
+            break
+        yield from lines
+
+def read_lines(f, before_read=None):
+    # Lines of a pipe or FIFO, read one at a time so each is parsed as soon as it is complete.
+    # before_read runs before every (possibly blocking) read, e.g. to flush pending output.
+    while True:
+        if before_read is not None:
+            before_read()
+        line = f.readline()
+        if not line:
+            break
+        yield line
+
+def parse_lines(lines, filename, strict=False, errors=None, require_sorted=False):
+    # Parses workload lines into process records (see iter_processes for the arguments).
+# 
+# lines may be any iterable of text lines - a chunked file, or a pipe read one line
+# at a time so that every record is yielded as soon as its line is complete.
+# filename only labels the WorkloadErrors.
+    last_key = None
+    line_no = 0
+    
+    for line in lines:
+        line_no += 1
+        line = line.strip()  # Remove leading/trailing whitespace
+        
+        # Skip empty lines and comments
+        if not line or line.startswith('#'):
+            continue
+        
+        # Parse process data
+        parts = line.split()
+        problem = None
+        if len(parts) != 4:  # Expecting exactly 4 fields
+            problem = f"expected 4 fields (PID arrival burst priority), found {len(parts)}"
+        else:
+            try:
+                arrival_time = int(parts[1])
+                burst_time = int(parts[2])
+                priority = int(parts[3])
+            except ValueError:
+                problem = "invalid number format"
+            else:
+                if arrival_time < 0:
+                    problem = f"negative arrival time {arrival_time}"
+                elif burst_time <= 0:
+                    problem = f"burst time must be positive, found {burst_time}"
+                elif require_sorted and last_key is not None and (arrival_time, parts[0]) < last_key:
+                    problem = f"{parts[0]} arrives at {arrival_time}, before the previous process"
+        
+        if problem is not None:
+            error = WorkloadError(filename, line_no, problem)
+            if strict:
+                raise error
+            if errors is not None:
+                errors.append(error)
+            continue
+        
+        last_key = (arrival_time, parts[0])
+        yield parts[0], arrival_time, burst_time, priority
+
+def parse_input(filename, strict=False, errors=None):
+    # Parses the process input file into a column-oriented ProcessTable.
 # 
 # Expected File Format:
 #     # Comments start with #
 #     PID arrival_time burst_time priority
 #     P1  0            8          2
 # 
+# Malformed lines are reported with their line number. In lenient mode (the
+# default) they are skipped and the rest of the file is kept; in strict mode the
+# first one aborts parsing.
+# 
 # Args:
 #     filename: Path to the input file
+#     strict: Reject the whole file on the first malformed line
+#     errors: Optional list that also receives a WorkloadError for every skipped line
 # 
 # Returns:
-#     List of process dictionaries, each containing:
-#         - pid: Process identifier (string)
-#         - arrival_time: When process arrives (integer)
-#         - burst_time: CPU time required (integer)
-#         - priority: Process priority, lower = higher priority (integer)
-#         - remaining_time: Initialized to burst_time, used by preemptive algorithms
-#         - start_time: When process first gets CPU (None initially)
-#         - completion_time: When process finishes execution (0 initially)
-    processes = []
+#     ProcessTable with one row per process (empty on error), holding:
+#         - pids: Process identifiers (strings)
+#         - arrival: When each process arrives
+#         - burst: CPU time required
+#         - priority: Process priority, lower = higher priority
+    pids = []
+    arrival = []
+    burst = []
+    priority = []
+    if errors is None:
+        errors = []
+    presorted = True  # Whether the file already lists processes in arrival order
     
     try:
-        with open(filename, 'r') as f:
-            for line in f:
-                line = line.strip()  # Remove leading/trailing whitespace
-                
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Parse process data
-                parts = line.split()
-                if len(parts) != 4:  # Expecting exactly 4 fields
-                    continue
-                
-                pid = parts[0]  # Process ID (string)
-                arrival_time = int(parts[1])  # Arrival time (convert to int)
-                burst_time = int(parts[2])  # Burst time (convert to int)
-                priority = int(parts[3])  # Priority (convert to int)
-                
-                # Create process dictionary with all necessary fields
-                processes.append({
-                    'pid': pid,
-                    'arrival_time': arrival_time,
-                    'burst_time': burst_time,
-                    'priority': priority,
-                    'remaining_time': burst_time,  # For preemptive algorithms
-                    'start_time': None,  # Will be set when process first runs
-                    'completion_time': 0  # Will be set when process finishes
-                })
+        for pid, arrival_time, burst_time, prio in iter_processes(filename, strict=strict, errors=errors):
+            if pids and (arrival_time, pid) < (arrival[-1], pids[-1]):
+                presorted = False
+            pids.append(pid)
+            arrival.append(arrival_time)
+            burst.append(burst_time)
+            priority.append(prio)
                 
     except FileNotFoundError:
         print(f"Error: File {filename} not found.")
-        return []
-    except ValueError:
-        print(f"Error: Invalid number format in {filename}.")
-        return []
+        return ProcessTable()
+    except WorkloadError as e:
+        print(f"Error: {e}")
+        return ProcessTable()
+    
+    for e in errors:
+        print(f"Warning: skipped {e}")
         
-    # Sort processes by arrival time for initial ordering
-    processes.sort(key=lambda x: x['arrival_time'])
-    return processes
+    # Columns are stored sorted by arrival time (PID tie-break); the sort is skipped
+    # when the file was already in that order
+    return ProcessTable(pids, arrival, burst, priority, presorted=presorted)
+
+def load_workload(filename, strict=False):
+    # Loads a workload in either supported format.
+    #
+    # Binary workload files (see utils/binary_workload.py) are memory-mapped and used
+    # without parsing; anything else is parsed as the whitespace text format
+    # (strict applies to text files only).
+    #
+    # Returns:
+    #     ProcessTable (empty on error)
+    if is_binary_workload(filename):
+        try:
+            return read_binary_workload(filename)
+        except WorkloadError as e:
+            print(f"Error: {e}")
+            return ProcessTable()
+    return parse_input(filename, strict)
 
+def convert_workload(text_filename, binary_filename, strict=False):
+    # Converts a whitespace text workload into the binary workload format.
+    #
+    # The parsed table is already sorted by arrival time (PID tie-break), so the
+    # output is flagged as sorted and later loads skip sorting entirely.
+    #
+    # Returns:
+    #     Number of processes written, or 0 if the input could not be parsed
+    table = parse_input(text_filename, strict)
+    if not table:
+        return 0
+    write_binary_workload(table, binary_filename, presorted=True)
+    return len(table)
@@ -0,0 +1,125 @@
+from array import array
+
+class ProcessTable:
+
+    # Column-oriented (struct-of-arrays) storage for a workload.
+
+    # Each process is a row index; its fields live in parallel columns instead of
+    # a dictionary per process. Algorithms treat the table as read-only input and
+    # write their results into fresh ScheduleResult columns, so one parsed table
+    # can be shared by every algorithm run without copying.
+
+    # Rows are kept sorted by (arrival_time, pid). This lets the row index itself
+    # serve as the arrival/PID tie-breaker inside the scheduling engines.
+
+    __slots__ = ('pids', 'arrival', 'burst', 'priority')
+
+    def __init__(self, pids=(), arrival=(), burst=(), priority=(), presorted=False):
+
+        # Args:
+        #    pids: Process identifiers (strings)
+        #    arrival, burst, priority: Integer columns, one value per process
+        #    presorted: Skip sorting when rows are already in (arrival_time, pid) order
+
+        if not presorted:
+            order = sorted(range(len(pids)), key=lambda i: (arrival[i], pids[i]))
+            pids = [pids[i] for i in order]
+            arrival = [arrival[i] for i in order]
+            burst = [burst[i] for i in order]
+            priority = [priority[i] for i in order]
+
+        self.pids = list(pids)  # pid index -> pid string
+        self.arrival = array('q', arrival)
+        self.burst = array('q', burst)
+        self.priority = array('q', priority)
+
+    @classmethod
+    def from_dicts(cls, processes):
+        # Builds a table from a list of process dictionaries (see parse_input's old format).
+        return cls([p['pid'] for p in processes],
+                   [p['arrival_time'] for p in processes],
+                   [p['burst_time'] for p in processes],
+                   [p['priority'] for p in processes])
+
+    @classmethod
+    def from_columns(cls, pids, arrival, burst, priority):
+        # Wraps existing columns (e.g. memoryviews over a mapped file) without copying.
+        # Rows must already be sorted by (arrival_time, pid).
+        table = cls.__new__(cls)
+        table.pids = pids
+        table.arrival = arrival
+        table.burst = burst
+        table.priority = priority
+        return table
+
+    def __len__(self):
+        return len(self.pids)
+
+class StreamTable:
+
+    # Process table of a streaming run (see algorithms/stream.py).
+
+    # Rows are appended as processes arrive, numbered in arrival order, and retired
+    # once they complete. The columns are dictionaries keyed by row, so a retired
+    # row's memory is released while the row numbers of live processes stay valid.
+    # len() is the number of rows appended so far, including retired ones.
+
+    __slots__ = ('pids', 'arrival', 'burst', 'priority', 'rows')
+
+    def __init__(self):
+        self.pids = {}
+        self.arrival = {}
+        self.burst = {}
+        self.priority = {}
+        self.rows = 0  # Rows appended so far; the next row's index
+
+    def append(self, pid, arrival, burst, priority):
+        # Adds a process and returns its row index.
+        i = self.rows
+        self.pids[i] = pid
+        self.arrival[i] = arrival
+        self.burst[i] = burst
+        self.priority[i] = priority
+        self.rows += 1
+        return i
+
+    def retire(self, i):
+        # Drops row i from every column.
+        del self.pids[i], self.arrival[i], self.burst[i], self.priority[i]
+
+    def live(self):
+        # Number of rows not retired yet.
+        return len(self.pids)
+
+    def __len__(self):
+        return self.rows
+
+class ScheduleResult:
+
+    # Output of one algorithm run over a ProcessTable.
+
+    # Attributes:
+    #    execution_log: List of (start_time, end_time, pid) tuples
+    #    start: First CPU access per row (-1 if the process never ran)
+    #    completion: Completion time per row
+    #    counters: Engine instrumentation counters (see Engine.counters), or None
+    #    core_logs: Per-core execution logs of a multi-core run (None on a single core);
+    #               execution_log then holds all their blocks ordered by start time
+    #    level_time: CPU time run on each queue level of a multilevel policy such as MLFQ (else None)
+    #    switch_logs: Per-lane (start_time, end_time) context switch blocks of a run with a
+    #                 switch cost, one lane per core as in lane_logs() (else None)
+
+    __slots__ = ('execution_log', 'start', 'completion', 'counters', 'core_logs', 'level_time', 'switch_logs')
+
+    def __init__(self, execution_log, start, completion, counters=None, core_logs=None):
+        self.execution_log = execution_log
+        self.start = start
+        self.completion = completion
+        self.counters = counters
+        self.core_logs = core_logs
+        self.level_time = None
+        self.switch_logs = None
+
+    def lane_logs(self):
+        # The chronological, non-overlapping execution logs of the run: one per core.
+        return self.core_logs if self.core_logs is not None else [self.execution_log]
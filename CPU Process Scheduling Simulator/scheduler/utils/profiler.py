@@ -0,0 +1,111 @@
+import contextlib
+import json
+import sys
+import time
+import tracemalloc
+
+class PhaseProfiler:
+
+    # Records wall time, CPU time and allocations for each phase of an algorithm run.
+
+    # Phases are measured with the phase() context manager, engine counters are added
+    # with record_counters(). Every finished record is a plain dictionary that is
+    # stored and passed to each registered hook, so measurements can be forwarded
+    # elsewhere as they happen:
+
+    #    profiler = PhaseProfiler()
+    #    profiler.add_hook(lambda record: print(record['phase'], record.get('wall_seconds')))
+
+    # Phase records hold: algorithm (None for global phases such as loading), phase,
+    # wall_seconds, cpu_seconds, allocated_blocks (net change in live heap blocks) and,
+    # while tracemalloc is tracing, allocated_bytes (net) and peak_bytes (above the
+    # phase's starting point). Counter records have phase 'engine' and a 'counters' dict.
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory  # Trace allocations with tracemalloc (slows allocation-heavy phases)
+        self.hooks = []  # Callables receiving every new record
+        self.records = []  # All records, in the order they were made
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+
+    def add_record(self, record):
+        # Stores a record and passes it to the hooks (also used to replay records from workers).
+        self.records.append(record)
+        for hook in self.hooks:
+            hook(record)
+
+    def start(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop(self):
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @contextlib.contextmanager
+    def phase(self, algorithm, name):
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            traced_before = tracemalloc.get_traced_memory()[0]
+        blocks_before = sys.getallocatedblocks()
+        cpu_before = time.process_time()
+        wall_before = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_before
+            cpu = time.process_time() - cpu_before
+            record = {
+                'algorithm': algorithm,
+                'phase': name,
+                'wall_seconds': wall,
+                'cpu_seconds': cpu,
+                'allocated_blocks': sys.getallocatedblocks() - blocks_before
+            }
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                record['allocated_bytes'] = current - traced_before
+                record['peak_bytes'] = peak - traced_before
+            self.add_record(record)
+
+    def record_counters(self, algorithm, counters):
+        if counters is not None:
+            self.add_record({'algorithm': algorithm, 'phase': 'engine', 'counters': counters})
+
+    def to_dict(self):
+        # Records grouped as {'global': {phase: ...}, 'algorithms': {name: {'phases': ..., 'counters': ...}}}.
+        profile = {'trace_memory': self.trace_memory, 'global': {}, 'algorithms': {}}
+        for record in self.records:
+            values = {key: value for key, value in record.items() if key not in ('algorithm', 'phase')}
+            if record['algorithm'] is None:
+                profile['global'][record['phase']] = values
+                continue
+            entry = profile['algorithms'].setdefault(record['algorithm'], {'phases': {}, 'counters': {}})
+            if record['phase'] == 'engine':
+                entry['counters'] = record['counters']
+            else:
+                entry['phases'][record['phase']] = values
+        return profile
+
+    def write_json(self, path):
+        # Writes to_dict() as JSON to path ('-' for stdout).
+        if path == '-':
+            print(json.dumps(self.to_dict(), indent=2))
+            return
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+class NullProfiler(PhaseProfiler):
+
+    # Profiler that measures nothing, used when profiling is off.
+
+    def __init__(self):
+        super().__init__(trace_memory=False)
+
+    def add_record(self, record):
+        pass
+
+    def phase(self, algorithm, name):
+        return contextlib.nullcontext()
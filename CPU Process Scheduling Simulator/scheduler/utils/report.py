@@ -0,0 +1,171 @@
+import csv
+import json
+import os
+
+# Bytes buffered before structured output is written out
+BUFFER_SIZE = 1 << 20
+
+# Columns of a per-process record, in output order
+PROCESS_FIELDS = ('pid', 'arrival', 'burst', 'priority', 'start', 'completion',
+                  'turnaround', 'waiting', 'response', 'slowdown')
+
+# Columns of an execution log record, in output order
+BLOCK_FIELDS = ('start', 'end', 'pid')
+
+def flatten_metrics(metrics):
+    # Metrics as one flat dictionary ('turnaround_mean', ..., 'core_utilization_0', ..., 'context_switches').
+    # Metrics that do not apply to the run (None, such as core_utilization on a single core) are left out.
+    flat = {}
+    for name, value in metrics.to_dict().items():
+        if value is None:
+            continue
+        if isinstance(value, dict):
+            for stat, stat_value in value.items():
+                flat[f"{name}_{stat}"] = stat_value
+        elif isinstance(value, list):
+            for k, item in enumerate(value):
+                flat[f"{name}_{k}"] = item
+        else:
+            flat[name] = value
+    return flat
+
+def iter_process_records(table, result, calc):
+    # Per-process result rows as tuples in PROCESS_FIELDS order.
+    # calc is the StatsCalculator whose summarize() already built the per-process columns.
+    burst = table.burst
+    return zip(table.pids, table.arrival, burst, table.priority, result.start, result.completion,
+               calc.turnaround, calc.waiting, calc.response,
+               (t / b for t, b in zip(calc.turnaround, burst)))
+
+def open_output(path):
+    # Opens a structured output destination ('-' or None for stdout) with a large write buffer.
+    # The stdout wrapper shares the descriptor, so closing it leaves stdout open.
+    if path in (None, '-'):
+        return open(1, 'w', buffering=BUFFER_SIZE, newline='', closefd=False)
+    return open(path, 'w', buffering=BUFFER_SIZE, newline='')
+
+class ReportWriter:
+
+    # Writes the results of a run in a machine-readable format.
+
+    # Usage:
+    #    writer.begin(info)                      # run-level fields (input, quantum, ...)
+    #    writer.write_algorithm(name, metrics, processes, blocks)
+    #    writer.end()
+
+    # processes is an iterable of PROCESS_FIELDS tuples and blocks an iterable of
+    # execution log blocks; either may be None to leave it out. Records are written
+    # as they are produced, so nothing is held in memory beyond the stream's buffer.
+
+    def __init__(self, stream, path=None):
+        self.stream = stream  # Buffered text stream receiving the output
+        self.path = path  # Output file path (None when writing to stdout)
+
+    def begin(self, info):
+        pass
+
+    def write_algorithm(self, name, metrics, processes=None, blocks=None):
+        raise NotImplementedError
+
+    def end(self):
+        pass
+
+class JsonReportWriter(ReportWriter):
+
+    # One JSON document: {<info>, "algorithms": {name: {"metrics", "processes", "execution_log"}}}.
+    # The document is written piece by piece instead of being built with json.dump.
+
+    def begin(self, info):
+        self.stream.write(json.dumps(info)[:-1])
+        self.stream.write(', "algorithms": {' if info else '"algorithms": {')
+        self.first = True
+
+    def write_list(self, key, fields, rows):
+        self.stream.write(f', "{key}": [')
+        separator = '\n'
+        for row in rows:
+            self.stream.write(separator)
+            self.stream.write(json.dumps(dict(zip(fields, row))))
+            separator = ',\n'
+        self.stream.write(']')
+
+    def write_algorithm(self, name, metrics, processes=None, blocks=None):
+        if not self.first:
+            self.stream.write(',')
+        self.first = False
+        self.stream.write(f'\n{json.dumps(name)}: {{"metrics": {json.dumps(metrics.to_dict())}')
+        if processes is not None:
+            self.write_list('processes', PROCESS_FIELDS, processes)
+        if blocks is not None:
+            self.write_list('execution_log', BLOCK_FIELDS, blocks)
+        self.stream.write('}')
+
+    def end(self):
+        self.stream.write('\n}}\n')
+
+class NdjsonReportWriter(ReportWriter):
+
+    # Newline-delimited JSON: one object per line, told apart by its "record" field
+    # ('run', 'metrics', 'process' or 'block'), so consumers can process it line by line.
+
+    def write_record(self, record):
+        self.stream.write(json.dumps(record))
+        self.stream.write('\n')
+
+    def begin(self, info):
+        self.write_record({'record': 'run', **info})
+
+    def write_algorithm(self, name, metrics, processes=None, blocks=None):
+        self.write_record({'record': 'metrics', 'algorithm': name, **metrics.to_dict()})
+        for fields, kind, rows in ((PROCESS_FIELDS, 'process', processes), (BLOCK_FIELDS, 'block', blocks)):
+            if rows is None:
+                continue
+            for row in rows:
+                self.write_record({'record': kind, 'algorithm': name, **dict(zip(fields, row))})
+
+class CsvReportWriter(ReportWriter):
+
+    # CSV tables: the output gets one row of flattened metrics per algorithm.
+    # Per-process rows and execution log blocks have different columns, so they go to
+    # sibling files <output>.processes.csv and <output>.log.csv (only when writing to a file).
+    # Algorithms may report different metric columns (MLFQ's per-level residency), so the
+    # summary rows - one per algorithm - are held until end() and written under the union.
+
+    def begin(self, info):
+        self.summary = csv.writer(self.stream)
+        self.summary_rows = []  # (algorithm, flattened metrics) in run order
+        self.tables = {}  # Sibling file suffix -> (file, csv writer), opened on first use
+
+    def write_table(self, suffix, fields, name, rows):
+        if self.path is None:
+            return  # Stdout holds the summary only; scheduler.py warns or refuses up front
+        if suffix not in self.tables:
+            f = open_output(f"{os.path.splitext(self.path)[0]}.{suffix}.csv")
+            writer = csv.writer(f)
+            writer.writerow(('algorithm',) + fields)
+            self.tables[suffix] = (f, writer)
+        self.tables[suffix][1].writerows((name,) + tuple(row) for row in rows)
+
+    def write_algorithm(self, name, metrics, processes=None, blocks=None):
+        self.summary_rows.append((name, flatten_metrics(metrics)))
+        if processes is not None:
+            self.write_table('processes', PROCESS_FIELDS, name, processes)
+        if blocks is not None:
+            self.write_table('log', BLOCK_FIELDS, name, blocks)
+
+    def end(self):
+        header = {}
+        for _, flat in self.summary_rows:
+            header.update(dict.fromkeys(flat))
+        self.summary.writerow(['algorithm'] + list(header))
+        for name, flat in self.summary_rows:
+            self.summary.writerow([name] + [flat.get(key) for key in header])
+        for f, _ in self.tables.values():
+            f.close()
+
+# --format names and their writers
+REPORT_FORMATS = {
+    'json': JsonReportWriter,
+    'ndjson': NdjsonReportWriter,
+    'csv': CsvReportWriter
+}
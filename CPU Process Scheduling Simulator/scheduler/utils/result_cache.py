@@ -0,0 +1,450 @@
+import glob
+import hashlib
+import heapq
+import json
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from collections.abc import Sequence
+from utils.binary_workload import is_binary_workload, read_binary_workload, write_binary_workload
+from utils.parser import WorkloadError, load_workload, parse_input
+from utils.process_table import ScheduleResult
+
+# Content-addressed on-disk cache of simulation results.
+#
+# A result is keyed by a SHA-256 over the workload file's bytes, the algorithm
+# name and settings (quantum, algorithm parameters, core options) and the engine
+# version - a hash of the workload reading, scheduling and statistics sources - so
+# any change to the input or the code yields a new key and stale entries are never read.
+#
+# Result file format (all integers little-endian):
+#
+#   Header (40 bytes):
+#       magic    8s   b'CPURSULT'
+#       version  u32  FORMAT_VERSION
+#       lanes    u32  number of block logs: 1, or one per core on a multi-core run
+#       count    u64  number of processes n
+#       blocks   u64  number of execution blocks m over all lanes
+#       meta     u64  length of the JSON metadata
+#   sizes        uint64[9]  compressed length of each column below
+#   start        int64[n]
+#   completion   int64[n]
+#   lane_blocks  uint64[lanes]  blocks per lane
+#   block_start  int64[m]
+#   block_end    int64[m]
+#   block_row    int64[m]   row of the block's process (its pid is read from the workload)
+#   lane_switches uint64[lanes]  context switch blocks per lane (all 0 without a switch cost)
+#   switch_start int64[s]
+#   switch_end   int64[s]
+#   metadata     JSON: counters, level_time, whether switch blocks were logged, metrics
+#
+# Each column is zlib-compressed (level 1), which shrinks the time columns about
+# fivefold for a fraction of the cost of re-running the simulation.
+#
+# Text workloads that parse cleanly are cached too, as binary workload files
+# (utils/binary_workload.py), so a repeated run maps them instead of parsing. Their
+# key is the file digest plus the parser version, a hash of the workload reading sources.
+#
+# Binary workloads are memory-mapped rather than read, so they are not hashed either:
+# their digest stands for the file's path, device, inode, size and modification time
+# (see workload_identity). Rewriting the file changes at least one of them.
+#
+# Entries are evicted least recently used first once the directory grows past its
+# size limit; a hit refreshes the entry's modification time.
+#
+# In incremental mode the cache also remembers the size and digest of the last
+# version of each workload path it loaded (source-*.json). A file that still starts
+# with exactly those bytes, up to a line end, was extended by appending lines; its
+# runs can continue from the snapshots the earlier version's runs left
+# (snapshot-*.bin, see IncrementalRun in utils/checkpoint.py).
+
+MAGIC = b'CPURSULT'
+FORMAT_VERSION = 2
+COLUMNS = 9
+
+HEADER = struct.Struct('<8sIIQQQ')
+
+# Default size limit of the cache directory
+DEFAULT_MAX_BYTES = 256 << 20
+
+# Bytes hashed per read
+HASH_CHUNK = 1 << 20
+
+def default_cache_dir():
+    # $XDG_CACHE_HOME/cpu-scheduler, or ~/.cache/cpu-scheduler.
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'cpu-scheduler')
+
+def file_digest(path):
+    # SHA-256 hex digest of a file's contents.
+    return file_digests(path)[0]
+
+def file_digests(path, prefix_length=None):
+    # SHA-256 hex digests of a file's contents and of its first prefix_length bytes, in one pass.
+    # The prefix digest is None unless the file is longer and the prefix ends with a line
+    # break, i.e. unless the file could be the prefix with whole lines appended.
+    digest = hashlib.sha256()
+    prefix = None
+    position = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            end = position + len(chunk)
+            if prefix_length is not None and position < prefix_length <= end:
+                cut = prefix_length - position
+                digest.update(chunk[:cut])
+                if chunk[cut - 1] == ord('\n'):
+                    prefix = digest.hexdigest()
+                digest.update(chunk[cut:])
+            else:
+                digest.update(chunk)
+            position = end
+    if prefix_length is None or position <= prefix_length:
+        prefix = None
+    return digest.hexdigest(), prefix
+
+def workload_identity(path):
+    # Digest standing for a workload file's contents: the SHA-256 of a text file, or for a
+    # binary workload, which is mapped without being read, a hash of its stat identity.
+    if not is_binary_workload(path):
+        return file_digest(path)
+    stat = os.stat(path)
+    identity = f"{os.path.abspath(path)}:{stat.st_dev}:{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}"
+    return 'stat-' + hashlib.sha256(identity.encode()).hexdigest()
+
+# Sources (glob patterns under the scheduler directory) that determine how a workload file is read
+PARSER_SOURCES = ('utils/parser.py', 'utils/process_table.py', 'utils/binary_workload.py')
+
+# Sources that determine a result: the workload reading, the algorithms and the statistics
+ENGINE_SOURCES = PARSER_SOURCES + ('algorithms/*.py', 'utils/statistics.py')
+
+_source_versions = {}
+
+def source_version(patterns):
+    # SHA-256 hex digest over the contents of the source files matching patterns, computed once per process.
+    if patterns not in _source_versions:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        digest = hashlib.sha256()
+        for pattern in patterns:
+            for path in sorted(glob.glob(os.path.join(root, pattern))):
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+        _source_versions[patterns] = digest.hexdigest()
+    return _source_versions[patterns]
+
+def engine_version():
+    # Hash of the sources that determine a result (ENGINE_SOURCES).
+    return source_version(ENGINE_SOURCES)
+
+def parser_version():
+    # Hash of the sources that determine a parsed workload (PARSER_SOURCES).
+    return source_version(PARSER_SOURCES)
+
+def run_key(workload_digest, algo_name, kwargs=None, smp=None):
+    # SHA-256 identifying one algorithm run: workload contents, algorithm, settings and engine version.
+    settings = {
+        'engine': engine_version(),
+        'workload': workload_digest,
+        'algorithm': algo_name,
+        'kwargs': kwargs or {},
+        'smp': None if smp is None else {name: getattr(smp, name) for name in smp.__slots__}
+    }
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()
+
+class BlockLog(Sequence):
+
+    # Read-only execution log over the cached block columns.
+    # Blocks are built on access, so a cache hit that never reads the log costs nothing.
+
+    __slots__ = ('starts', 'ends', 'rows', 'pids')
+
+    def __init__(self, starts, ends, rows, pids):
+        self.starts = starts
+        self.ends = ends
+        self.rows = rows
+        self.pids = pids  # The workload's pid column
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[j] for j in range(*k.indices(len(self)))]
+        return self.starts[k], self.ends[k], self.pids[self.rows[k]]
+
+    def __iter__(self):
+        pids = self.pids
+        return ((start, end, pids[row]) for start, end, row in zip(self.starts, self.ends, self.rows))
+
+class SwitchLog(Sequence):
+
+    # Read-only context switch log over the cached switch columns, built on access like BlockLog.
+
+    __slots__ = ('starts', 'ends')
+
+    def __init__(self, starts, ends):
+        self.starts = starts
+        self.ends = ends
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[j] for j in range(*k.indices(len(self)))]
+        return self.starts[k], self.ends[k]
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+class CachedRun:
+
+    # A cache hit: the ScheduleResult and the Metrics.to_dict() stored with it.
+
+    __slots__ = ('result', 'metrics')
+
+    def __init__(self, result, metrics):
+        self.result = result
+        self.metrics = metrics
+
+class ResultCache:
+
+    # Size-bounded directory of cached workloads and results (see the format above).
+
+    # Usage:
+    #    cache = ResultCache()
+    #    table = cache.load_workload(path)         # hashes a text file; reuses a cached parse
+    #    key = cache.key('RR', {'quantum': 2})
+    #    run = cache.get(key, table)               # CachedRun or None
+    #    cache.put(key, table, result, metrics)    # after a miss
+
+    # The object holds no open files, so it can be passed to worker processes.
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES, incremental=False):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.incremental = incremental  # Continue runs over workloads extended by appending (--incremental)
+        self.workload_digest = None  # Digest of the workload loaded by load_workload()
+        self.base_digest = None  # Digest of the earlier version the loaded workload extends, if any
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def load_workload(self, filename, strict=False):
+        # Loads a workload like load_workload(), using the cached binary copy of a text file.
+        # Returns a ProcessTable (empty on error).
+        self.base_digest = None
+        try:
+            if is_binary_workload(filename):
+                self.workload_digest = workload_identity(filename)
+                return load_workload(filename)
+            if self.incremental:
+                self.workload_digest = self.detect_extension(filename)
+            else:
+                self.workload_digest = file_digest(filename)
+        except OSError:
+            return load_workload(filename, strict)  # Reports the error
+        parse_key = hashlib.sha256(f"{self.workload_digest}:{parser_version()}".encode()).hexdigest()
+        cached = self.path(f"workload-{parse_key}.bin")
+        if os.path.exists(cached):
+            try:
+                table = read_binary_workload(cached)
+            except WorkloadError:
+                pass  # A damaged copy is parsed again and replaced
+            else:
+                self.touch(cached)
+                return table
+        errors = []
+        table = parse_input(filename, strict, errors)
+        if table and not errors:
+            # Only clean parses are cached: a hit must not hide warnings or a strict failure
+            self.write_atomic(cached, lambda path: write_binary_workload(table, path))
+        return table
+
+    def detect_extension(self, filename):
+        # Hashes the workload, setting base_digest if it extends the version loaded last time
+        # from the same path, and records this version for the next run. Returns the digest.
+        source = self.path(f"source-{hashlib.sha256(os.path.abspath(filename).encode()).hexdigest()}.json")
+        try:
+            with open(source) as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            previous = None
+        digest, prefix = file_digests(filename, previous['size'] if previous else None)
+        self.base_digest = previous['digest'] if prefix is not None and prefix == previous['digest'] else None
+        if previous is None or previous['digest'] != digest:
+            record = {'size': os.path.getsize(filename), 'digest': digest}
+
+            def write(path):
+                with open(path, 'w') as f:
+                    json.dump(record, f)
+
+            self.write_atomic(source, write)
+        return digest
+
+    def key(self, algo_name, kwargs=None, smp=None):
+        # Cache key of one algorithm run over the loaded workload (see run_key).
+        return run_key(self.workload_digest, algo_name, kwargs, smp)
+
+    def read_entry(self, key, rows):
+        # Decodes the result file stored under key for a workload of rows processes.
+        # Returns (lanes, columns, metadata) with the nine columns in file order, or None.
+        path = self.path(f"result-{key}.bin")
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) < HEADER.size:
+            return None
+        magic, version, lanes, n, m, meta_length = HEADER.unpack_from(data)
+        if magic != MAGIC or version != FORMAT_VERSION or n != rows:
+            return None
+        self.touch(path)
+
+        view = memoryview(data)
+        sizes = array('Q')
+        sizes.frombytes(view[HEADER.size:HEADER.size + 8 * COLUMNS])
+        if sys.byteorder != 'little':
+            sizes.byteswap()
+        pos = HEADER.size + 8 * COLUMNS
+
+        def column(typecode, size):
+            nonlocal pos
+            values = array(typecode)
+            values.frombytes(zlib.decompress(view[pos:pos + size]))
+            if sys.byteorder != 'little':
+                values.byteswap()
+            pos += size
+            return values
+
+        try:
+            columns = [column(typecode, size) for typecode, size in zip('qqQqqqQqq', sizes)]
+            meta = json.loads(bytes(view[pos:pos + meta_length]))
+        except (zlib.error, ValueError):
+            return None  # Damaged entry: treated as a miss and overwritten
+        return lanes, columns, meta
+
+    def get(self, key, table):
+        # Returns the CachedRun stored under key, or None.
+        entry = self.read_entry(key, len(table))
+        if entry is None:
+            return None
+        (lanes, (start, completion, lane_blocks, block_start, block_end, block_row, lane_switches, switch_start,
+                 switch_end), meta) = entry
+
+        logs = []
+        first = 0
+        for count in lane_blocks:
+            logs.append(BlockLog(block_start[first:first + count], block_end[first:first + count],
+                                 block_row[first:first + count], table.pids))
+            first += count
+        if lanes > 1:
+            result = ScheduleResult(list(heapq.merge(*logs)), start, completion, meta['counters'], logs)
+        else:
+            result = ScheduleResult(logs[0], start, completion, meta['counters'])
+        result.level_time = meta['level_time']
+        if meta['switch_logs']:
+            result.switch_logs = []
+            first = 0
+            for count in lane_switches:
+                result.switch_logs.append(SwitchLog(switch_start[first:first + count], switch_end[first:first + count]))
+                first += count
+        return CachedRun(result, meta['metrics'])
+
+    def get_logs(self, key, rows, pids, blocks, switches):
+        # Returns the first blocks blocks of the single-core execution log stored under key
+        # for a workload of rows processes, as a list of (start, end, pid) tuples, and the
+        # first switches blocks of its context switch log as (start, end) tuples, or None.
+        # pids may belong to a longer workload that starts with the same rows.
+        entry = self.read_entry(key, rows)
+        if entry is None:
+            return None
+        lanes, (_, _, _, block_start, block_end, block_row, _, switch_start, switch_end), _ = entry
+        if lanes != 1 or blocks > len(block_start) or switches > len(switch_start):
+            return None
+        return (list(zip(block_start[:blocks], block_end[:blocks], map(pids.__getitem__, block_row[:blocks]))),
+                list(zip(switch_start[:switches], switch_end[:switches])))
+
+    def put(self, key, table, result, metrics):
+        # Stores a finished run (metrics is its Metrics) and evicts old entries if needed.
+        row_of = {pid: i for i, pid in enumerate(table.pids)}
+        logs = result.core_logs if result.core_logs is not None else [result.execution_log]
+        switch_logs = result.switch_logs or [[] for _ in logs]
+        columns = [array('q', result.start), array('q', result.completion),
+                   array('Q', [len(log) for log in logs]),
+                   array('q', [block[0] for log in logs for block in log]),
+                   array('q', [block[1] for log in logs for block in log]),
+                   array('q', [row_of[block[2]] for log in logs for block in log]),
+                   array('Q', [len(log) for log in switch_logs]),
+                   array('q', [block[0] for log in switch_logs for block in log]),
+                   array('q', [block[1] for log in switch_logs for block in log])]
+        blocks = len(columns[3])
+        if sys.byteorder != 'little':
+            for values in columns:
+                values.byteswap()
+        compressed = [zlib.compress(values, 1) for values in columns]
+        sizes = array('Q', [len(c) for c in compressed])
+        if sys.byteorder != 'little':
+            sizes.byteswap()
+        meta = json.dumps({'counters': result.counters, 'level_time': result.level_time,
+                           'switch_logs': result.switch_logs is not None, 'metrics': metrics.to_dict()}).encode()
+
+        def write(path):
+            with open(path, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(logs), len(table), blocks, len(meta)))
+                sizes.tofile(f)
+                for c in compressed:
+                    f.write(c)
+                f.write(meta)
+
+        self.write_atomic(self.path(f"result-{key}.bin"), write)
+
+    def write_atomic(self, path, write):
+        # Writes an entry through a temporary file, so readers never see a partial one,
+        # then trims the cache. A cache that cannot be written is skipped silently.
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            os.close(fd)
+            try:
+                write(temp_path)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError:
+            return
+        self.evict()
+
+    def touch(self, path):
+        # Marks an entry as recently used.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def evict(self):
+        # Removes the least recently used entries until the cache fits in max_bytes.
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith('.bin') and entry.is_file():
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                        total += stat.st_size
+        except OSError:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # Already evicted by a concurrent run
+            total -= size
@@ -1,80 +1,383 @@
-import matplotlib.pyplot as plt
 import os
 
+def load_pyplot():
+    # Imports matplotlib.pyplot on first use with the non-interactive Agg backend.
+    # Importing it costs far more than a whole simulation of a small workload, so
+    # runs that never save graphs never import it.
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+# Processes from which summarize() computes the metrics with NumPy, when it is installed.
+# Below this, importing NumPy costs more than the pure-Python summary saves, so small
+# runs never try to import it.
+VECTORIZE_MIN = 50000
+
+def load_numpy():
+    # Imports NumPy on first use, or returns None when it is not installed (it is optional).
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def percentile(sorted_values, q):
+    # Linear-interpolation percentile (q in 0..100) of an already sorted sequence.
+    if not sorted_values:
+        return 0
+    pos = (len(sorted_values) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+class Distribution:
+    
+    # Summary of one per-process metric: mean, standard deviation and tail percentiles.
+    
+    __slots__ = ('mean', 'std', 'p50', 'p90', 'p99', 'max')
+    
+    def __init__(self, values):
+        
+        # Args: values: Per-process values (any sequence of numbers)
+        
+        n = len(values)
+        ordered = sorted(values)
+        self.mean = sum(ordered) / n if n else 0
+        # Population standard deviation
+        self.std = (sum((v - self.mean) ** 2 for v in ordered) / n) ** 0.5 if n else 0
+        self.p50 = percentile(ordered, 50)
+        self.p90 = percentile(ordered, 90)
+        self.p99 = percentile(ordered, 99)
+        self.max = ordered[-1] if n else 0
+        
+    @classmethod
+    def from_array(cls, np, values):
+        # Same summary of a non-empty NumPy array, with one sort and vectorised reductions.
+        # Values are converted back to Python numbers, so to_dict() output is unchanged.
+        dist = cls.__new__(cls)
+        ordered = np.sort(values)
+        dist.mean = ordered.mean().item()
+        dist.std = ordered.std().item()
+        dist.p50, dist.p90, dist.p99 = np.percentile(ordered, (50, 90, 99)).tolist()
+        dist.max = ordered[-1].item()
+        return dist
+        
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    @classmethod
+    def from_dict(cls, values):
+        # Rebuilds a Distribution from to_dict() output (e.g. a cached result).
+        dist = cls.__new__(cls)
+        for name in cls.__slots__:
+            setattr(dist, name, values[name])
+        return dist
+
+class Metrics:
+    
+    # Structured result of StatsCalculator.compute_metrics().
+    
+    # Attributes:
+    #    turnaround, waiting, response, slowdown: Distribution of each per-process metric
+    #    makespan: Time from the first arrival to the last completion
+    #    throughput: Completed processes per time unit over the makespan
+    #    cpu_utilization: Fraction of the makespan the CPU (all cores together) spent running processes
+    #    core_utilization: Per-core fractions of a multi-core run (None on a single core)
+    #    level_residency: Fraction of the CPU time run on each queue level (MLFQ; None otherwise)
+    #    context_switches: Context switches counted by the engine (over all cores)
+    #    switch_time: CPU time spent on context switches
+    #    cpu_efficiency: Fraction of the CPU's working time (process time plus switch time)
+    #                    that went to the processes
+    
+    def __init__(self, turnaround, waiting, response, slowdown, makespan, busy_time, n, core_busy=None,
+                 level_time=None, context_switches=None, switch_time=0):
+        self.turnaround = turnaround
+        self.waiting = waiting
+        self.response = response
+        self.slowdown = slowdown
+        self.makespan = makespan
+        self.throughput = n / makespan if makespan else 0
+        cores = len(core_busy) if core_busy else 1
+        self.cpu_utilization = busy_time / (makespan * cores) if makespan else 0
+        self.core_utilization = [busy / makespan if makespan else 0 for busy in core_busy] if core_busy else None
+        self.level_residency = [t / busy_time if busy_time else 0 for t in level_time] if level_time else None
+        self.context_switches = context_switches
+        self.switch_time = switch_time
+        self.cpu_efficiency = busy_time / (busy_time + switch_time) if busy_time else 0
+        
+    # Averages under the names used by the comparison summary and graphs
+    @property
+    def avg_turnaround(self):
+        return self.turnaround.mean
+    
+    @property
+    def avg_waiting(self):
+        return self.waiting.mean
+    
+    @property
+    def avg_response(self):
+        return self.response.mean
+    
+    def to_dict(self):
+        return {
+            'turnaround': self.turnaround.to_dict(),
+            'waiting': self.waiting.to_dict(),
+            'response': self.response.to_dict(),
+            'slowdown': self.slowdown.to_dict(),
+            'makespan': self.makespan,
+            'throughput': self.throughput,
+            'cpu_utilization': self.cpu_utilization,
+            'core_utilization': self.core_utilization,
+            'level_residency': self.level_residency,
+            'context_switches': self.context_switches,
+            'switch_time': self.switch_time,
+            'cpu_efficiency': self.cpu_efficiency
+        }
+    
+    @classmethod
+    def from_dict(cls, values):
+        # Rebuilds Metrics from to_dict() output (e.g. a cached result).
+        metrics = cls.__new__(cls)
+        for name, value in values.items():
+            setattr(metrics, name, Distribution.from_dict(value) if isinstance(value, dict) else value)
+        return metrics
+
 class StatsCalculator:
     
 # Calculates and displays process scheduling statistics.
-# Computes performance metrics for each process and overall averages:
+# Computes performance metrics for each process, their averages and tail statistics:
 # Turnaround Time: Total time from arrival to completion
 # Waiting Time: Time spent waiting in ready queue
 # Response Time: Time from arrival to first CPU access
+# Slowdown: Turnaround time relative to burst time
     
-    def __init__(self, processes):
+    def __init__(self, table, result):
         
         # Initialize the calculator with process data.
         
-        # Args: processes: List of process dicts with computed times (completion_time, start_time)
+        # Args: table: ProcessTable with arrival and burst columns
+        #       result: ScheduleResult with computed start and completion columns
         
-        self.processes = processes
+        self.table = table
+        self.result = result
 
-    def compute_metrics(self):
+    def summarize(self):
         
-        # Computes performance metrics for each process and calculates averages.
+        # Computes performance metrics for each process and summarizes them, without printing.
         
         # Formulas:
         #    Turnaround Time = Completion Time - Arrival Time
         #    Waiting Time = Turnaround Time - Burst Time
         #    Response Time = First Start Time - Arrival Time
+        #    Slowdown = Turnaround Time / Burst Time
+        #    CPU Efficiency = Total Burst Time / (Total Burst Time + Context Switch Time)
+        
+        # The per-process columns are built with whole-column comprehensions rather
+        # than per-process dictionaries, and kept on the calculator for printing.
+        # From VECTORIZE_MIN processes they are computed with NumPy when it is installed.
         
         # Returns:
-           # Dictionary containing:
-           # - avg_turnaround: Average turnaround time across all processes
-           #    - avg_waiting: Average waiting time across all processes
-           #    - avg_response: Average response time across all processes
-        
-        total_turnaround = 0
-        total_waiting = 0
-        total_response = 0
-        n = len(self.processes)
-        
-        # Print table header
-        print("\nPer-Process Statistics:")
-        print(f"{'PID':<5} {'Arr':<5} {'Burst':<6} {'Compl':<6} {'Turn':<6} {'Wait':<6} {'Resp':<6}")
-        
-        # Calculate metrics for each process
-        for p in self.processes:
-            # Turnaround Time = time from arrival to completion
-            p['turnaround_time'] = p['completion_time'] - p['arrival_time']
-            
-            # Waiting Time = turnaround minus actual CPU usage
-            p['waiting_time'] = p['turnaround_time'] - p['burst_time']
-            
-            # Response Time = time from arrival to first CPU access
-            p['response_time'] = p['start_time'] - p['arrival_time']
-            
-            # Accumulate totals for averaging
-            total_turnaround += p['turnaround_time']
-            total_waiting += p['waiting_time']
-            total_response += p['response_time']
-            
-            # Print per-process statistics
-            print(f"{p['pid']:<5} {p['arrival_time']:<5} {p['burst_time']:<6} {p['completion_time']:<6} {p['turnaround_time']:<6} {p['waiting_time']:<6} {p['response_time']:<6}")
+        #    Metrics object (see above)
+        
+        arrival = self.table.arrival
+        burst = self.table.burst
+        completion = self.result.completion
+        n = len(self.table)
+        
+        np = load_numpy() if n >= VECTORIZE_MIN else None
+        if np is not None:
+            distributions = self.vector_distributions(np)
+        else:
+            self.process_columns()
+            slowdown = [t / b for t, b in zip(self.turnaround, burst)]
+            distributions = [Distribution(column) for column in (self.turnaround, self.waiting, self.response, slowdown)]
         
-        # Calculate averages
-        avg_turnaround = total_turnaround / n
-        avg_waiting = total_waiting / n
-        avg_response = total_response / n
+        # Rows are sorted by arrival, so the first row holds the earliest arrival
+        makespan = max(completion) - arrival[0] if n else 0
+        core_busy = None
+        if self.result.core_logs is not None:
+            core_busy = [sum(end - start for start, end, _ in log) for log in self.result.core_logs]
+        counters = self.result.counters
+        return Metrics(*distributions, makespan, sum(burst), n, core_busy, self.result.level_time,
+                       counters['context_switches'], counters['switch_time'])
+
+    def vector_distributions(self, np):
+        # summarize() with NumPy: the columns are whole-array expressions over the table and
+        # result columns (read through the buffer protocol, without copying), and are kept on
+        # the calculator as lists like process_columns() does.
+        arrival = np.asarray(self.table.arrival, dtype=np.int64)
+        burst = np.asarray(self.table.burst, dtype=np.int64)
+        turnaround = np.asarray(self.result.completion, dtype=np.int64) - arrival
+        waiting = turnaround - burst
+        response = np.asarray(self.result.start, dtype=np.int64) - arrival
+        slowdown = turnaround / burst
+        self.turnaround = turnaround.tolist()
+        self.waiting = waiting.tolist()
+        self.response = response.tolist()
+        return [Distribution.from_array(np, column) for column in (turnaround, waiting, response, slowdown)]
+
+    def process_columns(self):
+        # Builds the per-process turnaround, waiting and response columns (kept on the calculator).
+        arrival = self.table.arrival
+        self.turnaround = [c - a for c, a in zip(self.result.completion, arrival)]
+        self.waiting = [t - b for t, b in zip(self.turnaround, self.table.burst)]
+        self.response = [s - a for s, a in zip(self.result.start, arrival)]
+
+    def compute_metrics(self, show_processes=True, metrics=None):
+        
+        # Computes the metrics (see summarize) and prints them.
+        
+        # Args:
+        #    show_processes: Print the per-process table (skip it for very large runs)
+        #    metrics: Already known Metrics of this result (e.g. cached); only printed
+        
+        # Returns:
+        #    Metrics object (see above)
+        
+        if metrics is None:
+            metrics = self.summarize()
+        elif show_processes:
+            self.process_columns()
+        
+        if show_processes:
+            pids = self.table.pids
+            arrival = self.table.arrival
+            burst = self.table.burst
+            completion = self.result.completion
+            
+            # Print table header
+            print("\nPer-Process Statistics:")
+            print(f"{'PID':<5} {'Arr':<5} {'Burst':<6} {'Compl':<6} {'Turn':<6} {'Wait':<6} {'Resp':<6}")
+            for i in range(len(pids)):
+                print(f"{pids[i]:<5} {arrival[i]:<5} {burst[i]:<6} {completion[i]:<6} {self.turnaround[i]:<6} {self.waiting[i]:<6} {self.response[i]:<6}")
         
         # Print average statistics
         print(f"\nAverages:")
-        print(f"Turnaround: {avg_turnaround:.2f}")
-        print(f"Waiting: {avg_waiting:.2f}")
-        print(f"Response: {avg_response:.2f}")
+        print(f"Turnaround: {metrics.avg_turnaround:.2f}")
+        print(f"Waiting: {metrics.avg_waiting:.2f}")
+        print(f"Response: {metrics.avg_response:.2f}")
         
+        # Print tail statistics
+        print("\nDistribution:")
+        print(f"{'Metric':<11} {'Mean':<9} {'StdDev':<9} {'p50':<9} {'p90':<9} {'p99':<9} {'Max':<9}")
+        for name, dist in (('Turnaround', metrics.turnaround), ('Waiting', metrics.waiting),
+                           ('Response', metrics.response), ('Slowdown', metrics.slowdown)):
+            print(f"{name:<11} {dist.mean:<9.2f} {dist.std:<9.2f} {dist.p50:<9.2f} {dist.p90:<9.2f} {dist.p99:<9.2f} {dist.max:<9.2f}")
+        print(f"Throughput: {metrics.throughput:.4f} processes/unit")
+        print(f"CPU Utilization: {metrics.cpu_utilization * 100:.2f}%")
+        if metrics.switch_time:
+            print(f"CPU Efficiency: {metrics.cpu_efficiency * 100:.2f}% "
+                  f"({metrics.switch_time} time units spent on context switches)")
+        if metrics.core_utilization is not None:
+            print("Core Utilization: " + ", ".join(f"core {k} {u * 100:.2f}%"
+                                                   for k, u in enumerate(metrics.core_utilization)))
+        if metrics.level_residency is not None:
+            print("Level Residency: " + ", ".join(f"level {k} {r * 100:.2f}%"
+                                                  for k, r in enumerate(metrics.level_residency)))
+        
+        return metrics
+
+class RunningStats:
+    
+    # Streaming mean, variance and maximum of a series of values (Welford's algorithm).
+    # Partial results from different worker processes can be combined with merge().
+    
+    __slots__ = ('count', 'mean', 'm2', 'max')
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+        self.max = None
+        
+    def add(self, value):
+        self.count += 1
+        if self.max is None or value > self.max:
+            self.max = value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        
+    def merge(self, other):
+        # Combines another RunningStats into this one (Chan et al. parallel update).
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        if self.max is None or other.max > self.max:
+            self.max = other.max
+        
+    @property
+    def std(self):
+        # Sample standard deviation
+        return (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else 0.0
+    
+    def confidence_interval(self, z=1.96):
+        # Half-width of the normal-approximation confidence interval of the mean (95% by default).
+        return z * self.std / self.count ** 0.5 if self.count else 0.0
+    
+    def to_dict(self):
+        return {'mean': self.mean, 'std': self.std, 'max': self.max}
+
+class StreamMetrics:
+    
+    # Running metrics of a streaming run (see algorithms/stream.py), updated as each
+    # process completes. Only aggregates are kept, so memory stays constant however
+    # long the stream runs; percentiles would need every value and are left out.
+    
+    # Attributes:
+    #    turnaround, waiting, response, slowdown: RunningStats over the completed processes
+    #    first_arrival: Arrival time of the first process (None before any completion)
+    #    clock: Time of the latest completion
+    #    busy_time: CPU time of the completed processes
+    
+    __slots__ = ('turnaround', 'waiting', 'response', 'slowdown', 'first_arrival', 'clock', 'busy_time')
+    
+    def __init__(self):
+        self.turnaround = RunningStats()
+        self.waiting = RunningStats()
+        self.response = RunningStats()
+        self.slowdown = RunningStats()
+        self.first_arrival = None
+        self.clock = 0
+        self.busy_time = 0
+        
+    @property
+    def completed(self):
+        return self.turnaround.count
+    
+    def add(self, arrival, burst, start, completion):
+        # Records one completed process and returns its (turnaround, waiting, response, slowdown).
+        turnaround = completion - arrival
+        waiting = turnaround - burst
+        response = start - arrival
+        slowdown = turnaround / burst
+        self.turnaround.add(turnaround)
+        self.waiting.add(waiting)
+        self.response.add(response)
+        self.slowdown.add(slowdown)
+        if self.first_arrival is None or arrival < self.first_arrival:
+            self.first_arrival = arrival
+        self.clock = max(self.clock, completion)
+        self.busy_time += burst
+        return turnaround, waiting, response, slowdown
+    
+    def to_dict(self):
+        # Throughput and utilization cover the span from the first arrival to the latest completion.
+        span = self.clock - self.first_arrival if self.completed else 0
         return {
-            'avg_turnaround': avg_turnaround,
-            'avg_waiting': avg_waiting,
-            'avg_response': avg_response
+            'completed': self.completed,
+            'clock': self.clock,
+            'turnaround': self.turnaround.to_dict(),
+            'waiting': self.waiting.to_dict(),
+            'response': self.response.to_dict(),
+            'slowdown': self.slowdown.to_dict(),
+            'throughput': self.completed / span if span else 0,
+            'cpu_utilization': self.busy_time / span if span else 0
         }
 
 def save_graphs(results, output_dir="graphs"):
@@ -86,18 +389,20 @@ def save_graphs(results, output_dir="graphs"):
     # 2. Average Turnaround Time vs Algorithm
     
     # Args:
-    #  results: Dictionary mapping algorithm names to their metrics
-    #             Format: {'FCFS': {'avg_waiting': 8.75, 'avg_turnaround': 15.25, ...}, ...}
+    #  results: Dictionary mapping algorithm names to their Metrics objects
+    #             (only avg_waiting and avg_turnaround are plotted)
     #    output_dir: Directory to save graphs (default: "graphs")
     
+    plt = load_pyplot()
+    
     # Create output directory if it doesn't exist
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
         
     # Extract data for plotting
     algorithms = list(results.keys())  # Algorithm names (x-axis labels)
-    avg_waiting = [results[algo]['avg_waiting'] for algo in algorithms]  # Waiting time values
-    avg_turnaround = [results[algo]['avg_turnaround'] for algo in algorithms]  # Turnaround time values
+    avg_waiting = [results[algo].avg_waiting for algo in algorithms]  # Waiting time values
+    avg_turnaround = [results[algo].avg_turnaround for algo in algorithms]  # Turnaround time values
     
     # Generate Waiting Time Bar Chart
     plt.figure(figsize=(10, 6))
@@ -119,3 +424,46 @@ def save_graphs(results, output_dir="graphs"):
     
     print(f"\nGraphs saved to {output_dir}/")
 
+def save_sweep_graphs(sweep, output_dir="graphs"):
+    
+    # Generates and saves line charts for a Round Robin quantum sweep.
+    
+    # Creates two graphs:
+    # 1. Average Turnaround, Waiting and Response Time vs Quantum
+    # 2. Context Switches vs Quantum
+    
+    # Args:
+    #  sweep: List of (quantum, Metrics) tuples, in increasing quantum order
+    #    output_dir: Directory to save graphs (default: "graphs")
+    
+    plt = load_pyplot()
+    
+    # Create output directory if it doesn't exist
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+        
+    # Extract data for plotting
+    quanta = [quantum for quantum, _ in sweep]  # x-axis values
+    
+    # Generate Times vs Quantum Line Chart
+    plt.figure(figsize=(10, 6))
+    plt.plot(quanta, [m.avg_turnaround for _, m in sweep], marker='o', color='salmon', label="Avg Turnaround")
+    plt.plot(quanta, [m.avg_waiting for _, m in sweep], marker='o', color='skyblue', label="Avg Waiting")
+    plt.plot(quanta, [m.avg_response for _, m in sweep], marker='o', color='mediumseagreen', label="Avg Response")
+    plt.xlabel("Quantum")
+    plt.ylabel("Time")
+    plt.title("Round Robin: Average Times vs Quantum")
+    plt.legend()
+    plt.savefig(os.path.join(output_dir, "quantum_sweep_times.png"))  # Save to file
+    plt.close()  # Close figure to free memory
+    
+    # Generate Context Switches vs Quantum Line Chart
+    plt.figure(figsize=(10, 6))
+    plt.plot(quanta, [m.context_switches for _, m in sweep], marker='o', color='orange')
+    plt.xlabel("Quantum")
+    plt.ylabel("Context Switches")
+    plt.title("Round Robin: Context Switches vs Quantum")
+    plt.savefig(os.path.join(output_dir, "quantum_sweep_switches.png"))  # Save to file
+    plt.close()  # Close figure to free memory
+    
+    print(f"\nGraphs saved to {output_dir}/")
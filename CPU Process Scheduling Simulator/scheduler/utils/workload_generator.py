@@ -0,0 +1,85 @@
+import random
+from utils.process_table import ProcessTable
+
+# Supported distributions
+ARRIVAL_DISTRIBUTIONS = ('poisson', 'uniform', 'pareto')
+BURST_DISTRIBUTIONS = ('exponential', 'uniform', 'pareto')
+PRIORITY_DISTRIBUTIONS = ('uniform', 'skewed', 'constant')
+
+def sample(rng, distribution, mean, pareto_alpha):
+    # Draws one positive value with the given mean from the named distribution.
+#
+# - poisson / exponential: exponential values (inter-arrival times of a Poisson process)
+# - uniform: uniform on [0, 2 * mean]
+# - pareto: heavy-tailed Pareto values with shape pareto_alpha (> 1), scaled to the mean
+    if distribution in ('poisson', 'exponential'):
+        return rng.expovariate(1 / mean)
+    if distribution == 'uniform':
+        return rng.uniform(0, 2 * mean)
+    if distribution == 'pareto':
+        return rng.paretovariate(pareto_alpha) * mean * (pareto_alpha - 1) / pareto_alpha
+    raise ValueError(f"Unknown distribution: {distribution}")
+
+def generate_workload(n, seed=None, arrival='poisson', arrival_rate=0.15, burst='exponential', mean_burst=5,
+                      pareto_alpha=1.5, priority='uniform', priority_levels=5):
+    # Generates a synthetic workload.
+#
+# Arrivals are the cumulative sum of inter-arrival times (mean 1 / arrival_rate),
+# bursts are drawn independently (rounded, at least 1), and priorities are drawn
+# from 0 (highest) to priority_levels - 1:
+# - uniform: every level equally likely
+# - skewed: Zipf-like, level k has weight 1 / (k + 1), so high priorities dominate
+# - constant: every process gets priority 0
+#
+# Args:
+#     n: Number of processes
+#     seed: Seed for the random generator (same seed -> same workload)
+#     arrival: One of ARRIVAL_DISTRIBUTIONS
+#     arrival_rate: Mean arrivals per time unit
+#     burst: One of BURST_DISTRIBUTIONS
+#     mean_burst: Mean burst time
+#     pareto_alpha: Shape of the heavy-tailed Pareto distributions (must be > 1)
+#     priority: One of PRIORITY_DISTRIBUTIONS
+#     priority_levels: Number of priority levels
+#
+# Returns:
+#     ProcessTable with processes P1..Pn
+    if pareto_alpha <= 1:
+        raise ValueError("pareto_alpha must be greater than 1 for a finite mean")
+    if priority not in PRIORITY_DISTRIBUTIONS:
+        raise ValueError(f"Unknown priority distribution: {priority}")
+
+    rng = random.Random(seed)
+    mean_interarrival = 1 / arrival_rate
+    levels = range(priority_levels)
+    cum_weights = []
+    total = 0
+    for k in levels:
+        total += 1 / (k + 1)
+        cum_weights.append(total)
+
+    pids = []
+    arrivals = []
+    bursts = []
+    priorities = []
+    clock = 0.0
+    for i in range(n):
+        pids.append(f"P{i + 1}")
+        arrivals.append(int(clock))
+        bursts.append(max(1, round(sample(rng, burst, mean_burst, pareto_alpha))))
+        if priority == 'uniform':
+            priorities.append(rng.randrange(priority_levels))
+        elif priority == 'skewed':
+            priorities.append(rng.choices(levels, cum_weights=cum_weights)[0])
+        else:
+            priorities.append(0)
+        clock += sample(rng, arrival, mean_interarrival, pareto_alpha)
+
+    return ProcessTable(pids, arrivals, bursts, priorities)
+
+def write_text_workload(table, filename):
+    # Writes a ProcessTable in the whitespace text format read by parse_input.
+    with open(filename, 'w') as f:
+        f.write("# pid arrival_time burst_time priority\n")
+        for i, pid in enumerate(table.pids):
+            f.write(f"{pid} {table.arrival[i]} {table.burst[i]} {table.priority[i]}\n")